@@ -0,0 +1,75 @@
+# Benchmark to measure the throughput of parallel batch rendering of synthetic
+# Precis documents (JSON), by number of worker processes
+
+from context import precis
+from synthetic import writePrecisData
+import argparse
+import os
+import tempfile
+import time
+import yaml
+
+
+def benchmarkBatch(n_documents: int, size: int, workers: list):
+    print('{0:>8} {1:>14} {2:>12} {3:>16}'.format(
+        'workers', 'documents/s', 'speedup', 'mean build (s)'))
+
+    template_folder = os.path.join(os.path.dirname(precis.__file__),
+                                   'templates', 'curriculum_vitae')
+    prefs_file = os.path.join(os.path.dirname(os.path.dirname(
+        precis.__file__)), 'data', 'sample_cv_prefs.yml')
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        # Item overrides in the sample preferences refer to individuals in the
+        # sample data, and are removed
+        with open(prefs_file) as f:
+            user_prefs = yaml.safe_load(f)
+        user_prefs.pop('item_overrides', None)
+        prefs_file = os.path.join(tmp_folder, 'prefs.yml')
+        with open(prefs_file, 'w') as f:
+            yaml.safe_dump(user_prefs, f)
+
+        jobs = list()
+        for i in range(n_documents):
+            data_file = os.path.join(tmp_folder, '{0}.json'.format(i))
+            writePrecisData(file_path=data_file, n_individuals=size, seed=i)
+            jobs.append(precis.templating.BatchJob(
+                data_file=data_file, template_folder=template_folder,
+                prefs_file=prefs_file,
+                output_file=os.path.join(tmp_folder, '{0}.tex'.format(i))))
+
+        baseline = None
+        for n_workers in workers:
+            # Workers are started (and pre-warmed) before timing
+            with precis.templating.BatchRenderer(
+                    template_folders=[template_folder],
+                    max_workers=n_workers) as renderer:
+                t = time.perf_counter()
+                results = list(renderer.render(jobs=jobs))
+                elapsed = time.perf_counter() - t
+
+            errors = [result.error for result in results if result.error]
+            if errors:
+                raise RuntimeError(errors[0])
+
+            throughput = n_documents / elapsed
+            baseline = baseline or throughput
+            print('{0:>8} {1:>14.2f} {2:>11.2f}x {3:>16.3f}'.format(
+                n_workers, throughput, throughput / baseline,
+                sum(result.timings['build'] for result in results) /
+                n_documents))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--documents', type=int, default=16,
+                        help='Number of documents to render.')
+    parser.add_argument('--size', type=int, default=100,
+                        help='Approximate number of individuals per document.')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, os.cpu_count() or 1}),
+                        help='Numbers of worker processes to compare.')
+    args = parser.parse_args()
+
+    benchmarkBatch(n_documents=args.documents, size=args.size,
+                   workers=args.workers)
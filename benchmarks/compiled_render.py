@@ -0,0 +1,118 @@
+# Benchmark to compare rendering the CV template from the user data ontology,
+# and from compiled user data, over the sample data and synthetic Precis
+# documents
+
+from context import precis
+from synthetic import writePrecisData
+import argparse
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import yaml
+
+
+# Rendering modes
+MODES = ['ontology', 'compile', 'compiled']
+
+def runRender(data_file: str, compiled_file: str, mode: str):
+    # Run in a fresh process (see `benchmarkRender`); prints the time taken to
+    # load the user data (or compiled user data) and render the template, or
+    # to load and compile the user data (for the 'compile' mode)
+    from owlready2 import default_world, get_ontology
+
+    template_folder = os.path.join(os.path.dirname(precis.__file__),
+                                   'templates', 'curriculum_vitae')
+    prefs_file = os.path.join(os.path.dirname(os.path.dirname(
+        precis.__file__)), 'data', 'sample_cv_prefs.yml')
+    template = precis.templating.PrecisTemplate(template_folder=template_folder)
+    precis.bootstrap.initialize()
+
+    # Item overrides in the sample preferences refer to individuals in the
+    # sample data, and are removed
+    with open(prefs_file) as f:
+        user_prefs = yaml.safe_load(f)
+    user_prefs.pop('item_overrides', None)
+
+    t = time.perf_counter()
+    if mode == 'compiled':
+        user_ont, user_graph = None, None
+        compiled_data = precis.templating.CompiledData.load(
+            file_path=compiled_file)
+    else:
+        user_ont = get_ontology(os.path.abspath(data_file)).load()
+        user_graph = default_world.as_rdflib_graph()
+        compiled_data = None
+
+    if mode == 'compile':
+        precis.templating.CompiledData.compile(user_ont=user_ont,
+            user_graph=user_graph).save(file_path=compiled_file)
+    else:
+        precis.templating.TemplateDriver(template=template,
+            user_ont=user_ont, user_graph=user_graph,
+            user_prefs=io.StringIO(yaml.safe_dump(user_prefs)),
+            compiled_data=compiled_data).buildTemplate()
+    elapsed = time.perf_counter() - t
+
+    print(elapsed)
+
+
+def writeRDF(json_file: str, rdf_file: str):
+    # Run in a fresh process (see `benchmarkRender`), such that only the
+    # target data is saved
+    with open(json_file) as f:
+        precis.Loader(ingest_file=f).saveToFile(save_location=rdf_file)
+
+
+def benchmarkRender(sizes: list):
+    print('{0:<24} {1:>14} {2:>14} {3:>14}'.format(
+        'data', 'ontology (s)', 'compile (s)', 'compiled (s)'))
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        # Sample data, in the top-level project folder
+        sample_rdf = os.path.join(os.path.dirname(os.path.dirname(
+            precis.__file__)), 'data', 'sample.rdf')
+        data_files = [('sample.rdf', sample_rdf)]
+        for size in sizes:
+            json_file = os.path.join(tmp_folder, '{0}.json'.format(size))
+            rdf_file = os.path.join(tmp_folder, '{0}.rdf'.format(size))
+            writePrecisData(file_path=json_file, n_individuals=size)
+            subprocess.check_call(
+                [sys.executable, os.path.abspath(__file__), '--run', json_file,
+                 '--output', rdf_file],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                stderr=subprocess.DEVNULL)
+            data_files.append(('synthetic ({0})'.format(size), rdf_file))
+
+        for name, data_file in data_files:
+            compiled_file = os.path.join(tmp_folder, 'compiled.pickle.gz')
+            timings = dict()
+            for mode in MODES:
+                output = subprocess.check_output(
+                    [sys.executable, os.path.abspath(__file__), '--run',
+                     data_file, '--output', compiled_file, '--mode', mode],
+                    cwd=os.path.dirname(os.path.abspath(__file__)),
+                    stderr=subprocess.DEVNULL)
+                timings[mode] = float(output.decode())
+
+            print('{0:<24} {1:>14.2f} {2:>14.2f} {3:>14.3f}'.format(
+                name, *[timings[i] for i in MODES]))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[300, 1200],
+                        help='Approximate number of individuals per document.')
+    parser.add_argument('--run', help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run and args.mode:
+        runRender(data_file=args.run, compiled_file=args.output, mode=args.mode)
+    elif args.run:
+        writeRDF(json_file=args.run, rdf_file=args.output)
+    else:
+        benchmarkRender(sizes=args.sizes)
@@ -0,0 +1,14 @@
+import logging
+import os
+import sys
+
+# Setting logging level to 'WARNING' for the benchmarks (debug logging skews
+# timings)
+logging.getLogger().setLevel(logging.WARNING)
+
+try:
+    import precis
+except ModuleNotFoundError:
+    sys.path.insert(0, os.path.abspath('../'))
+    os.chdir(os.path.abspath('../'))
+    import precis
@@ -0,0 +1,72 @@
+# Benchmark to compare serial and concurrent extraction of template data (see
+# `TemplateDriver`) from synthetic Precis documents, by number of worker
+# processes
+
+from context import precis
+from synthetic import writePrecisData
+import argparse
+import io
+import os
+import tempfile
+import time
+import yaml
+
+
+def benchmarkExtraction(sizes: list, workers: list, repeats: int):
+    print('{0:>10} {1:>8} {2:>12} {3:>12} {4:>16}'.format(
+        'size', 'workers', 'build (s)', 'speedup', 'slowest class (s)'))
+
+    template_folder = os.path.join(os.path.dirname(precis.__file__),
+                                   'templates', 'curriculum_vitae')
+    prefs_file = os.path.join(os.path.dirname(os.path.dirname(
+        precis.__file__)), 'data', 'sample_cv_prefs.yml')
+    template = precis.templating.PrecisTemplate(template_folder=template_folder)
+
+    # Item overrides in the sample preferences refer to individuals in the
+    # sample data, and are removed
+    with open(prefs_file) as f:
+        user_prefs = yaml.safe_load(f)
+    user_prefs.pop('item_overrides', None)
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        for size in sizes:
+            data_file = os.path.join(tmp_folder, '{0}.json'.format(size))
+            writePrecisData(file_path=data_file, n_individuals=size)
+            world = precis.PrecisWorld()
+            with open(data_file) as f:
+                loader = precis.Loader(ingest_file=f, world=world)
+
+            baseline = None
+            for n_workers in workers:
+                elapsed = list()
+                for _ in range(repeats):
+                    t = time.perf_counter()
+                    driver = precis.templating.TemplateDriver(
+                        template=template, user_ont=loader.getOntology(),
+                        user_graph=loader.getRDFLibGraph(),
+                        user_prefs=io.StringIO(yaml.safe_dump(user_prefs)),
+                        max_workers=n_workers)
+                    elapsed.append(time.perf_counter() - t)
+
+                build = min(elapsed)
+                baseline = baseline or build
+                print('{0:>10} {1:>8} {2:>12.3f} {3:>11.2f}x {4:>16.3f}'.format(
+                    size, n_workers, build, baseline / build,
+                    max(driver.getClassTimings().values())))
+
+            world.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000],
+                        help='Approximate number of individuals per document.')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, os.cpu_count() or 1}),
+                        help='Numbers of worker processes to compare.')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Number of times each build is timed.')
+    args = parser.parse_args()
+
+    benchmarkExtraction(sizes=args.sizes, workers=args.workers,
+                        repeats=args.repeats)
@@ -0,0 +1,56 @@
+# Benchmark to measure `import precis` time, with and without deferring the
+# ontology load until first use
+
+from context import precis
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+# Code run in a fresh interpreter for each case
+CASES = {
+    'import precis (deferred)': 'import precis',
+    'import precis (eager)': 'import precis; precis.bootstrap.initialize(); '
+        'precis.Loader; precis.OntQuery; precis.templating.TemplateDriver',
+    'import precis.templating': 'import precis.templating'
+}
+
+# Wrapper measuring the wall time of the case code in the child process
+TIMER = 'import time; t = time.perf_counter(); {0}; ' \
+    'print(time.perf_counter() - t)'
+
+
+def timeCase(code: str, runs: int) -> list:
+    # Project folder, so that the child process imports this copy of Precis
+    project_folder = os.path.dirname(os.path.dirname(precis.__file__))
+
+    timings = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', TIMER.format(code)],
+            cwd=project_folder, stderr=subprocess.DEVNULL)
+        timings.append(float(output.decode().strip().splitlines()[-1]))
+
+    return timings
+
+
+def benchmarkImportTime(runs: int):
+    # Warm-up run (populates the ontology cache and snapshot)
+    timeCase(code=CASES['import precis (eager)'], runs=1)
+
+    print('{0:<28} {1:>10} {2:>10}'.format('case', 'min (ms)', 'med (ms)'))
+    for case, code in CASES.items():
+        timings = timeCase(code=code, runs=runs)
+        print('{0:<28} {1:>10.1f} {2:>10.1f}'.format(
+            case, min(timings) * 1e3, statistics.median(timings) * 1e3))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10,
+                        help='Number of fresh interpreters per case.')
+    args = parser.parse_args()
+
+    benchmarkImportTime(runs=args.runs)
@@ -0,0 +1,72 @@
+# Benchmark to compare ingest throughput into a persistent Precis world (one
+# namespace per document), loading each document with its own Loader (with and
+# without bulk mode), and loading all documents with `Loader.bulkLoad`
+
+from context import precis
+from synthetic import generatePrecisData
+import argparse
+import json
+import os
+import tempfile
+import time
+
+
+def countIndividuals(value) -> int:
+    # Number of objects with IDs in a document (including nested objects)
+    if isinstance(value, dict):
+        return int('$id' in value) + sum(countIndividuals(v)
+                                         for v in value.values())
+    if isinstance(value, list):
+        return sum(countIndividuals(v) for v in value)
+    return 0
+
+
+def benchmarkBulk(n_documents: int, size: int):
+    print('{0:>10} {1:>14} {2:>10} {3:>16}'.format('documents', 'mode',
+                                                  'time (s)', 'individuals/s'))
+
+    precis.bootstrap.initialize()
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        data_files = list()
+        n_individuals = 0
+        for i in range(n_documents):
+            document = generatePrecisData(n_individuals=size, seed=i)
+            n_individuals += countIndividuals(document)
+            data_files.append(os.path.join(tmp_folder, '{0}.json'.format(i)))
+            with open(data_files[-1], 'w') as f:
+                json.dump(document, f)
+        namespaces = ['http://example.org/person/{0}#'.format(i)
+                      for i in range(n_documents)]
+
+        for mode in ['loader', 'loader (bulk)', 'bulkLoad']:
+            store_file = os.path.join(tmp_folder, '{0}.sqlite3'.format(mode))
+
+            t = time.perf_counter()
+            world = precis.PrecisWorld.open(file_path=store_file,
+                                            bulk=(mode == 'loader (bulk)'))
+            if mode == 'bulkLoad':
+                precis.Loader.bulkLoad(ingest_files=data_files,
+                                       namespaces=namespaces, world=world)
+            else:
+                for data_file, namespace in zip(data_files, namespaces):
+                    with open(data_file) as f:
+                        precis.Loader(ingest_file=f, namespace=namespace,
+                                      world=world)
+            world.close()
+            elapsed = time.perf_counter() - t
+
+            print('{0:>10} {1:>14} {2:>10.2f} {3:>16.0f}'.format(
+                n_documents, mode, elapsed, n_individuals / elapsed))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--documents', type=int, nargs='+', default=[100, 500],
+                        help='Number of documents to load.')
+    parser.add_argument('--size', type=int, default=50,
+                        help='Approximate number of individuals per document.')
+    args = parser.parse_args()
+
+    for n_documents in args.documents:
+        benchmarkBulk(n_documents=n_documents, size=args.size)
@@ -0,0 +1,37 @@
+# Benchmark to measure Loader ingest time over synthetic Precis documents
+
+from context import precis
+from synthetic import writePrecisData
+import argparse
+import os
+import tempfile
+import time
+
+
+def benchmarkIngest(sizes: list):
+    print('{0:>12} {1:>10} {2:>16}'.format('individuals', 'time (s)',
+                                           'individuals/s'))
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        for size in sizes:
+            data_file = os.path.join(tmp_folder, '{0}.json'.format(size))
+            writePrecisData(file_path=data_file, n_individuals=size)
+
+            # Note: each document is loaded into its own namespace
+            with open(data_file) as f:
+                t = time.perf_counter()
+                precis.Loader(ingest_file=f)
+                elapsed = time.perf_counter() - t
+
+            print('{0:>12} {1:>10.2f} {2:>16.0f}'.format(
+                size, elapsed, size / elapsed))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10000, 30000, 100000],
+                        help='Approximate number of individuals per document.')
+    args = parser.parse_args()
+
+    benchmarkIngest(sizes=args.sizes)
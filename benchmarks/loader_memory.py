@@ -0,0 +1,66 @@
+# Benchmark to compare the peak memory of the Loader with the complete JSON
+# document parsed up-front, and with streaming ingestion
+
+from context import precis
+from synthetic import writePrecisData
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def runIngest(data_file: str, stream: bool):
+    # Run in a fresh process (see `benchmarkMemory`); prints the peak resident
+    # set size before and after loading, and the load time
+    precis.bootstrap.initialize()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    with open(data_file) as f:
+        t = time.perf_counter()
+        precis.Loader(ingest_file=f, stream=stream)
+        elapsed = time.perf_counter() - t
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(rss_before, rss_after, elapsed)
+
+
+def benchmarkMemory(sizes: list):
+    print('{0:>12} {1:>8} {2:>16} {3:>16} {4:>10}'.format(
+        'individuals', 'mode', 'peak RSS (MB)', 'load delta (MB)', 'time (s)'))
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        for size in sizes:
+            data_file = os.path.join(tmp_folder, '{0}.json'.format(size))
+            writePrecisData(file_path=data_file, n_individuals=size)
+
+            for mode in ['full', 'stream']:
+                output = subprocess.check_output(
+                    [sys.executable, os.path.abspath(__file__), '--run',
+                     data_file, '--mode', mode],
+                    cwd=os.path.dirname(os.path.abspath(__file__)),
+                    stderr=subprocess.DEVNULL)
+                rss_before, rss_after, elapsed = output.decode().split()
+
+                # Note: ru_maxrss is reported in KB on Linux
+                print('{0:>12} {1:>8} {2:>16.1f} {3:>16.1f} {4:>10.2f}'.format(
+                    size, mode, int(rss_after) / 1024,
+                    (int(rss_after) - int(rss_before)) / 1024, float(elapsed)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10000, 100000],
+                        help='Approximate number of individuals per document.')
+    parser.add_argument('--run', help=argparse.SUPPRESS)
+    parser.add_argument('--mode', choices=['full', 'stream'],
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        runIngest(data_file=args.run, stream=args.mode == 'stream')
+    else:
+        benchmarkMemory(sizes=args.sizes)
@@ -0,0 +1,83 @@
+# Benchmark to compare the save and load latency, and file size of user data
+# saved in each Loader output format (RDF/XML, N-Triples, and binary quadstore
+# snapshots), over the sample data and synthetic Precis documents
+
+from context import precis
+from synthetic import writePrecisData
+import argparse
+import os
+import tempfile
+import time
+
+
+# Output formats, and file extensions
+FORMATS = {'rdfxml': 'rdf', 'ntriples': 'nt', 'sqlite': 'sqlite3'}
+
+def loadFile(data_file: str, file_format: str) -> float:
+    # Time taken to load a saved file into an isolated world, and to extract
+    # all individuals (snapshots are read on demand, so data is accessed)
+    t = time.perf_counter()
+    if file_format == 'sqlite':
+        world = precis.PrecisWorld.fromSnapshot(file_path=data_file)
+        user_ont = world.ont
+    else:
+        world = precis.PrecisWorld()
+        user_ont = world.world.get_ontology(os.path.abspath(data_file)).load()
+    precis.OntQuery(ont=user_ont, graph=world.getRDFLibGraph(),
+                    backend='native').getAll()
+    elapsed = time.perf_counter() - t
+    world.close()
+
+    return elapsed
+
+
+def benchmarkFormats(sizes: list, repeats: int):
+    print('{0:<20} {1:<10} {2:>10} {3:>10} {4:>12}'.format(
+        'data', 'format', 'save (s)', 'load (s)', 'size (KB)'))
+
+    sample_json = os.path.join(os.path.dirname(os.path.dirname(
+        precis.__file__)), 'data', 'sample.json')
+    precis.bootstrap.initialize()
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        data_files = [('sample', sample_json)]
+        for size in sizes:
+            json_file = os.path.join(tmp_folder, '{0}.json'.format(size))
+            writePrecisData(file_path=json_file, n_individuals=size)
+            data_files.append(('synthetic ({0})'.format(size), json_file))
+
+        for name, json_file in data_files:
+            world = precis.PrecisWorld()
+            with open(json_file) as f:
+                loader = precis.Loader(ingest_file=f, world=world)
+
+            for file_format, extension in FORMATS.items():
+                data_file = os.path.join(tmp_folder, 'data.{0}'.format(
+                    extension))
+
+                t = time.perf_counter()
+                for _ in range(repeats):
+                    loader.saveToFile(save_location=data_file,
+                                      format=file_format)
+                save_time = (time.perf_counter() - t) / repeats
+
+                load_time = min(loadFile(data_file=data_file,
+                                         file_format=file_format)
+                                for _ in range(repeats))
+
+                print('{0:<20} {1:<10} {2:>10.4f} {3:>10.4f} {4:>12.1f}'\
+                    .format(name, file_format, save_time, load_time,
+                            os.path.getsize(data_file) / 1024))
+
+            world.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='Approximate number of individuals per document.')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Number of repetitions per measurement.')
+    args = parser.parse_args()
+
+    benchmarkFormats(sizes=args.sizes, repeats=args.repeats)
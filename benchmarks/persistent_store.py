@@ -0,0 +1,72 @@
+# Benchmark to measure ingest throughput into a persistent Precis world (one
+# namespace per person), with and without bulk mode, and the latency and peak
+# memory of querying one person's user data from the persistent world as the
+# number of people grows
+
+from context import precis
+from synthetic import generatePrecisData
+import argparse
+import io
+import json
+import os
+import resource
+import tempfile
+import time
+
+
+def personNamespace(i: int) -> str:
+    return 'http://example.org/person/{0}#'.format(i)
+
+
+def benchmarkStore(n_people: int, size: int, queries: int):
+    print('{0:>8} {1:>6} {2:>12} {3:>16} {4:>16} {5:>12}'.format(
+        'people', 'bulk', 'people/s', 'query (ms)', 'peak RSS (MB)',
+        'size (MB)'))
+
+    precis.bootstrap.initialize()
+    documents = [json.dumps(generatePrecisData(n_individuals=size, seed=i))
+                 for i in range(n_people)]
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        for bulk in [False, True]:
+            store_file = os.path.join(tmp_folder, 'store{0}.sqlite3'.format(
+                int(bulk)))
+
+            t = time.perf_counter()
+            world = precis.PrecisWorld.open(file_path=store_file, bulk=bulk)
+            for i, document in enumerate(documents):
+                precis.Loader(ingest_file=io.StringIO(document),
+                              namespace=personNamespace(i), world=world)
+            world.close()
+            ingest_rate = n_people / (time.perf_counter() - t)
+
+            # Querying people from the persistent world, in place
+            world = precis.PrecisWorld.fromSnapshot(file_path=store_file)
+            t = time.perf_counter()
+            for i in range(queries):
+                precis.OntQuery(ont=world.ont, graph=world.getRDFLibGraph(),
+                                backend='native',
+                                namespace=personNamespace(
+                                    i * n_people // queries)).getAll()
+            query_time = (time.perf_counter() - t) / queries
+            world.close()
+
+            # Note: ru_maxrss is reported in KB on Linux
+            print('{0:>8} {1:>6} {2:>12.2f} {3:>16.2f} {4:>16.1f} {5:>12.1f}'\
+                .format(n_people, str(bulk), ingest_rate, query_time * 1000,
+                        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                        / 1024, os.path.getsize(store_file) / 1024 ** 2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--people', type=int, nargs='+', default=[100, 500],
+                        help='Number of people in the persistent world.')
+    parser.add_argument('--size', type=int, default=50,
+                        help='Approximate number of individuals per person.')
+    parser.add_argument('--queries', type=int, default=10,
+                        help='Number of people queried.')
+    args = parser.parse_args()
+
+    for n_people in args.people:
+        benchmarkStore(n_people=n_people, size=args.size, queries=args.queries)
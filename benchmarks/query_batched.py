@@ -0,0 +1,82 @@
+# Benchmark to compare per-individual, batched and native (owlready2 quadstore)
+# extraction in OntQuery, over the sample data and synthetic Precis documents
+
+from context import precis
+from synthetic import writePrecisData
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Extraction modes
+MODES = ['single', 'batched', 'native']
+
+def runExtraction(data_file: str, mode: str):
+    # Run in a fresh process (see `benchmarkExtraction`), such that only the
+    # target data is loaded; prints the number of extracted individuals, and
+    # the time taken to extract all classes, for all ordering schemes
+    from owlready2 import default_world, get_ontology
+    precis.bootstrap.initialize()
+
+    if data_file.endswith('.json'):
+        with open(data_file) as f:
+            loader = precis.Loader(ingest_file=f)
+        ont = loader.getOntology()
+    else:
+        ont = get_ontology(os.path.abspath(data_file)).load()
+    graph = default_world.as_rdflib_graph()
+    query = precis.OntQuery(ont=ont, graph=graph, batched=mode == 'batched',
+                            backend='native' if mode == 'native' else 'rdflib')
+
+    t = time.perf_counter()
+    for order in [None] + precis.config.valid_order_options:
+        output = query.getAll(order=order)
+    elapsed = time.perf_counter() - t
+
+    print(sum(len(i) for i in output.values()), elapsed)
+
+
+def benchmarkExtraction(sizes: list):
+    print('{0:<24} {1:>12} {2:>12} {3:>12} {4:>12}'.format(
+        'data', 'individuals', 'single (s)', 'batched (s)', 'native (s)'))
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        # Sample data, in the top-level project folder
+        sample_rdf = os.path.join(os.path.dirname(os.path.dirname(
+            precis.__file__)), 'data', 'sample.rdf')
+        data_files = [('sample.rdf', sample_rdf)]
+        for size in sizes:
+            data_file = os.path.join(tmp_folder, '{0}.json'.format(size))
+            writePrecisData(file_path=data_file, n_individuals=size)
+            data_files.append(('synthetic ({0})'.format(size), data_file))
+
+        for name, data_file in data_files:
+            timings = dict()
+            for mode in MODES:
+                output = subprocess.check_output(
+                    [sys.executable, os.path.abspath(__file__), '--run',
+                     data_file, '--mode', mode],
+                    cwd=os.path.dirname(os.path.abspath(__file__)),
+                    stderr=subprocess.DEVNULL)
+                n_individuals, timings[mode] = output.decode().split()
+
+            print('{0:<24} {1:>12} {2:>12.2f} {3:>12.2f} {4:>12.2f}'.format(
+                name, n_individuals, *[float(timings[i]) for i in MODES]))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[300, 1200],
+                        help='Approximate number of individuals per document.')
+    parser.add_argument('--run', help=argparse.SUPPRESS)
+    parser.add_argument('--mode', choices=MODES,
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        runExtraction(data_file=args.run, mode=args.mode)
+    else:
+        benchmarkExtraction(sizes=args.sizes)
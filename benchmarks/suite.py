@@ -0,0 +1,205 @@
+# Benchmark suite to time each stage of the Precis pipeline (loading, saving,
+# querying, and building both bundled templates) over synthetic Precis
+# documents, recording results as JSON so that runs can be compared
+
+from context import precis
+from synthetic import SYNTHETIC_PREFS, generatePrecisData
+from precis.cfg import config
+import argparse
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import yaml
+
+
+# Bundled templates
+TEMPLATES = ['curriculum_vitae', 'resume']
+
+# Output formats, and file extensions
+FORMATS = {'rdfxml': 'rdf', 'ntriples': 'nt', 'sqlite': 'sqlite3'}
+
+def timeStage(results: dict, stage: str, repeats: int, function) -> object:
+    # Times `function` over a number of repeats, recording the timings of the
+    # stage; returns the output of the last repeat
+    times = list()
+    for _ in range(repeats):
+        t = time.perf_counter()
+        output = function()
+        times.append(time.perf_counter() - t)
+
+    results[stage] = {'min': min(times), 'median': statistics.median(times),
+                      'times': times}
+
+    return output
+
+
+def runMetadata() -> dict:
+    # Metadata identifying a run (versions, commit and platform)
+    import owlready2
+    import rdflib
+
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(os.path.abspath(precis.__file__))
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {'timestamp': datetime.datetime.now().isoformat(),
+            'commit': commit,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'owlready2': owlready2.VERSION,
+            'rdflib': rdflib.__version__}
+
+
+def benchmarkDocument(data: list, repeats: int, tmp_folder: str) -> dict:
+    results = dict()
+    data_json = json.dumps(data)
+    worlds = list()
+
+    def load():
+        world = precis.PrecisWorld()
+        worlds.append(world)
+        return precis.Loader(ingest_file=io.StringIO(data_json), world=world)
+
+    loader = timeStage(results=results, stage='Loader', repeats=repeats,
+                       function=load)
+    for world in worlds[:-1]:
+        world.close()
+
+    for file_format, extension in FORMATS.items():
+        data_file = os.path.join(tmp_folder, 'data.{0}'.format(extension))
+        timeStage(results=results,
+                  stage='Loader.saveToFile ({0})'.format(file_format),
+                  repeats=repeats,
+                  function=lambda: loader.saveToFile(save_location=data_file,
+                                                     format=file_format))
+
+    for backend in config.valid_query_backends:
+        query = precis.OntQuery(ont=loader.getOntology(),
+                                graph=loader.getRDFLibGraph(), backend=backend)
+        timeStage(results=results,
+                  stage='OntQuery.getAllOfType ({0})'.format(backend),
+                  repeats=repeats,
+                  function=lambda: [query.getAllOfType(c_type=c_type)
+                                    for c_type in config.ont_classes
+                                    if c_type != 'Description'])
+        timeStage(results=results,
+                  stage='OntQuery.getAll ({0})'.format(backend),
+                  repeats=repeats, function=query.getAll)
+
+    user_prefs = yaml.safe_dump(SYNTHETIC_PREFS)
+    for template_name in TEMPLATES:
+        template_folder = os.path.join(os.path.dirname(precis.__file__),
+                                       'templates', template_name)
+        template = timeStage(results=results,
+                             stage='PrecisTemplate ({0})'.format(
+                                 template_name),
+                             repeats=repeats,
+                             function=lambda: precis.templating.PrecisTemplate(
+                                 template_folder=template_folder))
+        driver = timeStage(results=results,
+                           stage='TemplateDriver ({0})'.format(template_name),
+                           repeats=repeats,
+                           function=lambda: precis.templating.TemplateDriver(
+                               template=template, user_ont=loader.getOntology(),
+                               user_graph=loader.getRDFLibGraph(),
+                               user_prefs=io.StringIO(user_prefs)))
+        timeStage(results=results,
+                  stage='TemplateDriver.buildTemplate ({0})'.format(
+                      template_name),
+                  repeats=repeats, function=driver.buildTemplate)
+
+    worlds[-1].close()
+
+    return results
+
+
+def runSuite(sizes: list, depth: int, fan_out: int, repeats: int,
+             output_file: str):
+    precis.bootstrap.initialize()
+
+    run = {'metadata': runMetadata(),
+           'parameters': {'sizes': sizes, 'depth': depth, 'fan_out': fan_out,
+                          'repeats': repeats},
+           'results': dict()}
+
+    print('{0:<10} {1:<48} {2:>10} {3:>10}'.format('size', 'stage',
+                                                   'min (s)', 'median (s)'))
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        for size in sizes:
+            data = generatePrecisData(n_individuals=size, depth=depth,
+                                      fan_out=fan_out)
+            results = benchmarkDocument(data=data, repeats=repeats,
+                                        tmp_folder=tmp_folder)
+            run['results'][str(size)] = results
+
+            for stage, timing in results.items():
+                print('{0:<10} {1:<48} {2:>10.4f} {3:>10.4f}'.format(
+                    size, stage, timing['min'], timing['median']))
+
+    if output_file:
+        with open(output_file, 'w') as f:
+            json.dump(run, f, indent=2)
+        print('Saved results to {0}'.format(output_file))
+
+
+def compareRuns(baseline_file: str, current_file: str):
+    with open(baseline_file) as f:
+        baseline = json.load(f)
+    with open(current_file) as f:
+        current = json.load(f)
+
+    print('Baseline: {0} ({1})'.format(baseline['metadata']['commit'],
+                                       baseline['metadata']['timestamp']))
+    print('Current:  {0} ({1})'.format(current['metadata']['commit'],
+                                       current['metadata']['timestamp']))
+    print('{0:<10} {1:<48} {2:>12} {3:>12} {4:>8}'.format(
+        'size', 'stage', 'baseline (s)', 'current (s)', 'ratio'))
+
+    # Stages present in both runs, by median time
+    for size, results in current['results'].items():
+        for stage, timing in results.items():
+            if stage not in baseline['results'].get(size, {}):
+                continue
+            baseline_time = baseline['results'][size][stage]['median']
+            print('{0:<10} {1:<48} {2:>12.4f} {3:>12.4f} {4:>8.2f}'.format(
+                size, stage, baseline_time, timing['median'],
+                timing['median'] / baseline_time))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[200, 1000],
+                        help='Approximate number of individuals per document.')
+    parser.add_argument('--depth', type=int, default=2,
+                        help='Number of organizations in each chain of parent \
+                        organizations.')
+    parser.add_argument('--fan-out', type=int, default=3,
+                        help='Number of nested individuals, descriptions and \
+                        related individuals.')
+    parser.add_argument('--repeats', type=int, default=3,
+                        help='Number of repetitions per measurement.')
+    parser.add_argument('--output', default=None,
+                        help='JSON file to save results to (relative to the \
+                        project folder).')
+    parser.add_argument('--compare', nargs=2, default=None,
+                        metavar=('BASELINE', 'CURRENT'),
+                        help='Compare two saved results files, instead of \
+                        running the suite.')
+    args = parser.parse_args()
+
+    if args.compare:
+        compareRuns(baseline_file=args.compare[0], current_file=args.compare[1])
+    else:
+        runSuite(sizes=args.sizes, depth=args.depth, fan_out=args.fan_out,
+                 repeats=args.repeats, output_file=args.output)
@@ -0,0 +1,242 @@
+# Synthetic Precis data generator for benchmarks
+
+import json
+import random
+
+
+# User preferences satisfying the required input of both bundled templates
+SYNTHETIC_PREFS = {
+    'full_name': 'Synthetic User',
+    'address_line_1': '1 Synthetic Road',
+    'address_city_state': 'Palo Alto, CA',
+    'address_zip': '94304',
+    'address_country': 'USA',
+    'phone': '(800) 000-0000',
+    'email': 'user@example.com',
+    'website': 'example.com',
+    'linkedin': 'http://linkedin.com/in/synthetic',
+    'last_updated': 'January 1, 2020',
+    'max_description_priority': 2
+}
+
+
+def countIndividuals(item) -> int:
+    """Function to count the individuals (i.e. JSON objects, including
+    descriptions) in a Precis JSON value.
+
+    Arguments:
+        item {object} -- Precis JSON value.
+
+    Returns:
+        int -- Number of individuals.
+    """
+
+    if isinstance(item, dict):
+        return 1 + sum(countIndividuals(i) for i in item.values())
+    elif isinstance(item, list):
+        return sum(countIndividuals(i) for i in item)
+
+    return 0
+
+
+def generatePrecisData(n_individuals: int, seed: int=0, depth: int=1,
+                       fan_out: int=5) -> list:
+    """Function to generate a synthetic, valid Precis JSON document (i.e. the
+    top-level JSONArray) with approximately `n_individuals` individuals.
+
+    The document is made of blocks, each with an individual of every class of
+    the Precis ontology: a skill group with nested skills, a work experience
+    and a degree at organizations with nested chains of parent organizations,
+    a course, accolades (awards and certifications) affiliated with the work
+    experience or degree, portfolio items (projects, publications and talks),
+    with projects related to skills and awards by ID, and knowledge areas and
+    activity types with nested subjects and activities. Descriptions, with
+    increasing priorities, are counted as individuals.
+
+    Arguments:
+        n_individuals {int} -- Approximate number of individuals.
+
+    Keyword Arguments:
+        seed {int} -- Random seed (default: {0}).
+        depth {int} -- Number of organizations in each chain of parent
+                       organizations (default: {1}).
+        fan_out {int} -- Number of nested individuals (skills, subjects and
+                         activities), descriptions and related individuals
+                         (default: {5}).
+
+    Returns:
+        list -- Precis JSON document.
+    """
+
+    rng = random.Random(seed)
+    data = []
+    skill_ids = []
+    award_ids = []
+    affiliation_ids = []
+    count = 0
+
+    def date() -> str:
+        return '{0:04d}-{1:02d}-01'.format(rng.randint(1990, 2020),
+                                          rng.randint(1, 12))
+
+    def descriptions(text: str) -> list:
+        return [{'hasPriority': i, 'hasText': '{0} {1}'.format(text, i)}
+                for i in range(fan_out)]
+
+    def organization(block: int, name: str) -> dict:
+        # Organization, with a nested chain of `depth - 1` parents
+        org = None
+        for level in reversed(range(depth)):
+            child = {'$type': 'Organization',
+                     '$id': 'org:{0}:{1}:{2}'.format(name, block, level),
+                     'hasName': 'Organization {0}-{1}'.format(block, level),
+                     'hasWebsite': 'https://{0}{1}-{2}.example.com'.format(
+                         name, block, level)}
+            if org:
+                child['hasParentOrganization'] = org
+            org = child
+
+        return org
+
+    while count < n_individuals:
+        block = len(data)
+        items = []
+
+        # Skill group with nested skills
+        skills = [{'$type': 'Skill', '$id': 'sk:{0}:{1}'.format(block, i),
+                   'hasName': 'Skill {0}-{1}'.format(block, i)}
+                  for i in range(fan_out)]
+        skill_ids += [i['$id'] for i in skills]
+        items.append({'$type': 'SkillGroup', '$id': 'sg:{0}'.format(block),
+                      'hasName': 'Skill Group {0}'.format(block),
+                      'hasSkill': skills})
+
+        # Work experience and degree, at nested organizations
+        we_id = 'we:{0}'.format(block)
+        items.append({
+            '$type': 'WorkExperience', '$id': we_id,
+            'hasName': 'Position {0}'.format(block),
+            'employedAt': organization(block=block, name='employer'),
+            'hasDate': date(),
+            'inCity': 'City {0}'.format(block),
+            'hasDescription': descriptions(text='Position text')
+        })
+        degree_id = 'degree:{0}'.format(block)
+        items.append({
+            '$type': 'Degree', '$id': degree_id,
+            'hasName': 'Degree {0}'.format(block),
+            'degreeDepartment': organization(block=block, name='department'),
+            'degreeSchool': 'org:department:{0}:{1}'.format(block,
+                                                            min(1, depth - 1)),
+            'degreeUniversity': 'org:department:{0}:{1}'.format(block,
+                                                                depth - 1),
+            'degreeConcentration': 'http://dbpedia.org/resource/Physics',
+            'degreeType': 'http://dbpedia.org/resource/Bachelor_of_Science',
+            'hasDate': date(),
+            'inCity': 'City {0}'.format(block),
+            'inState': 'CA'
+        })
+        affiliation_ids += [we_id, degree_id]
+
+        # Course taught at the degree department
+        items.append({
+            '$type': 'Course', '$id': 'course:{0}'.format(block),
+            'hasName': 'Course {0}'.format(block),
+            'hasDepartmentCode': 'DEPT',
+            'hasCourseCode': '{0:03d}'.format(block % 1000),
+            'hasWebsite': 'https://course{0}.example.com'.format(block),
+            'withGrade': 4.0,
+            'taughtAt': 'org:department:{0}:0'.format(block)
+        })
+
+        # Accolades, affiliated with existing work experiences and degrees
+        for c_type in ['Accolade', 'Award', 'Certification']:
+            items.append({
+                '$type': c_type, '$id': '{0}:{1}'.format(c_type.lower(), block),
+                'hasName': '{0} {1}'.format(c_type, block),
+                'affiliatedWith': rng.choice(affiliation_ids),
+                'hasDate': date(),
+                'hasDescription': descriptions(text='{0} text'.format(c_type))
+            })
+        award_ids.append('award:{0}'.format(block))
+
+        # Portfolio items; projects are related to existing skills and awards
+        items.append({
+            '$type': 'Portfolio', '$id': 'portfolio:{0}'.format(block),
+            'hasName': 'Portfolio {0}'.format(block),
+            'hasDate': date()
+        })
+        items.append({
+            '$type': 'Project', '$id': 'proj:{0}'.format(block),
+            'hasName': 'Project {0}'.format(block),
+            'affiliatedWith': rng.choice(affiliation_ids),
+            'hasDate': date(),
+            'relatedTo': rng.sample(skill_ids, min(fan_out, len(skill_ids))) +
+                rng.sample(award_ids, min(fan_out, len(award_ids))),
+            'hasDescription': descriptions(text='Project text')
+        })
+        items.append({
+            '$type': 'Publication', '$id': 'pub:{0}'.format(block),
+            'hasName': 'Publication {0}'.format(block),
+            'inConferenceOrJournal': 'Journal {0}'.format(block),
+            'inPublication': 'Volume {0}'.format(block),
+            'hasAuthors': 'Author {0}'.format(block),
+            'hasWebsite': 'https://pub{0}.example.com'.format(block),
+            'affiliatedWith': rng.choice(affiliation_ids),
+            'hasDate': date(),
+            'hasDescription': descriptions(text='Publication text')
+        })
+        items.append({
+            '$type': 'Talk', '$id': 'talk:{0}'.format(block),
+            'hasName': 'Talk {0}'.format(block),
+            'hasWebsite': 'https://talk{0}.example.com'.format(block),
+            'affiliatedWith': rng.choice(affiliation_ids),
+            'hasDate': date(),
+            'hasDescription': descriptions(text='Talk text')
+        })
+
+        # Knowledge area and activity type, with nested subjects and activities
+        items.append({
+            '$type': 'KnowledgeArea', '$id': 'ka:{0}'.format(block),
+            'hasName': 'Knowledge Area {0}'.format(block),
+            'hasSubject': [{'$type': 'Subject',
+                            '$id': 'subj:{0}:{1}'.format(block, i),
+                            'hasName': 'Subject {0}-{1}'.format(block, i)}
+                           for i in range(fan_out)]
+        })
+        items.append({
+            '$type': 'ActivityType', '$id': 'ac_type:{0}'.format(block),
+            'hasName': 'Activity Type {0}'.format(block),
+            'hasActivity': [{'$type': 'Activity',
+                             '$id': 'ac:{0}:{1}'.format(block, i),
+                             'hasName': 'Activity {0}-{1}'.format(block, i),
+                             'hasDate': date()}
+                            for i in range(fan_out)]
+        })
+
+        data += items
+        count += countIndividuals(items)
+
+    return data
+
+
+def writePrecisData(file_path: str, n_individuals: int, seed: int=0,
+                    depth: int=1, fan_out: int=5):
+    """Function to write a synthetic Precis JSON document to a file (see
+    `generatePrecisData`).
+
+    Arguments:
+        file_path {str} -- Output file path.
+        n_individuals {int} -- Approximate number of individuals.
+
+    Keyword Arguments:
+        seed {int} -- Random seed (default: {0}).
+        depth {int} -- Number of organizations in each chain of parent
+                       organizations (default: {1}).
+        fan_out {int} -- Number of nested individuals, descriptions and
+                         related individuals (default: {5}).
+    """
+
+    with open(file_path, 'w') as f:
+        json.dump(generatePrecisData(n_individuals=n_individuals, seed=seed,
+                                     depth=depth, fan_out=fan_out), f)
@@ -0,0 +1,48 @@
+# Benchmark to measure the throughput of loading and querying independent
+# documents in one process, each in its own isolated Precis world, and the
+# peak memory as worlds are created and closed
+
+from context import precis
+from synthetic import writePrecisData
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+
+def benchmarkThroughput(n_documents: int, size: int):
+    print('{0:>10} {1:>14} {2:>16}'.format('documents', 'documents/s',
+                                           'peak RSS (MB)'))
+
+    with tempfile.TemporaryDirectory() as tmp_folder:
+        data_file = os.path.join(tmp_folder, '{0}.json'.format(size))
+        writePrecisData(file_path=data_file, n_individuals=size)
+        precis.bootstrap.initialize()
+
+        t = time.perf_counter()
+        for i in range(1, n_documents + 1):
+            world = precis.PrecisWorld()
+            with open(data_file) as f:
+                loader = precis.Loader(ingest_file=f, world=world)
+            precis.OntQuery(ont=loader.getOntology(),
+                            graph=loader.getRDFLibGraph(),
+                            backend='native').getAll()
+            world.close()
+
+            if i % max(1, n_documents // 5) == 0:
+                # Note: ru_maxrss is reported in KB on Linux
+                print('{0:>10} {1:>14.2f} {2:>16.1f}'.format(
+                    i, i / (time.perf_counter() - t),
+                    resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--documents', type=int, default=100,
+                        help='Number of documents to load and query.')
+    parser.add_argument('--size', type=int, default=100,
+                        help='Approximate number of individuals per document.')
+    args = parser.parse_args()
+
+    benchmarkThroughput(n_documents=args.documents, size=args.size)
@@ -1,50 +1,38 @@
 from .cfg import config
-
-from owlready2 import *
-
-# Getting and loading the ontology
-ont = get_ontology(config.ont_source).load()
-
-# Binding to config module
-config.ont = ont
-
-# Binding base IRI to config
-config.ont_base_iri = config.ont.base_iri
-
-# Extracting ontology object property relations
-object_properties = {}
-for object_property in config.ont.object_properties():
-    object_property_name = str(object_property).split('.')[1] 
-    object_properties[object_property_name] = object_property
-
-# Removing 'hasDescription' from this dict, as it has a special handler
-del object_properties['hasDescription']
-
-# Binding to config module
-config.object_properties = object_properties
-
-
-# Extracting ontology classes and building class -> constructor map
-ont_classes = dict()
-for ont_class in config.ont.classes():
-    # Getting class name
-    class_name = str(ont_class).split('.')[1]
-    ont_classes[class_name] = ont_class
-
-# Binding to config module
-config.ont_classes = ont_classes
-
-
-# Extracting ontology data properties list
-data_properties = dict()
-for data_property in config.ont.data_properties():
-    data_property_name = str(data_property).split('.')[1]
-    data_properties[data_property_name] = data_property
-
-# Binding to config module
-config.data_properties = data_properties
-
-# Importing Precis modules
-from .loader import Loader
-from .query import OntQuery, TemplateOntQuery
-from . import templating
+from . import bootstrap
+
+# NOTE: The Precis ontology (and owlready2 and rdflib with it) is loaded lazily,
+#       the first time a Loader, OntQuery or TemplateDriver is used, or when one
+#       of the attributes below is accessed. This keeps `import precis` cheap
+#       for things like CLI argument parsing.
+
+# Lazily imported Precis modules
+_lazy_modules = {
+    'Loader': ('.loader', 'Loader'),
+    'LoadResult': ('.loader', 'LoadResult'),
+    'OntQuery': ('.query', 'OntQuery'),
+    'PrecisWorld': ('.world', 'PrecisWorld'),
+    'QueryProfiler': ('.query', 'QueryProfiler'),
+    'Stats': ('.stats', 'Stats'),
+    'query': ('.query', None),
+    'TemplateOntQuery': ('.query', 'TemplateOntQuery'),
+    'templating': ('.templating', None)
+}
+
+# Lazily materialized ontology attributes (bound to the config module)
+_lazy_attributes = ['ont', 'object_properties', 'ont_classes',
+                    'data_properties']
+
+
+def __getattr__(name: str):
+    # See: https://www.python.org/dev/peps/pep-0562/
+    if name in _lazy_modules:
+        from importlib import import_module
+        module, attribute = _lazy_modules[name]
+        module = import_module(module, __name__)
+        return module if attribute is None else getattr(module, attribute)
+    elif name in _lazy_attributes:
+        bootstrap.initialize()
+        return getattr(config, name)
+    raise AttributeError('module {0} has no attribute {1}'.format(
+        __name__, name))
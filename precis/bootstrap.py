@@ -0,0 +1,373 @@
+from .cfg import config
+
+from typing import TYPE_CHECKING
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+
+# Only imported for type annotations; owlready2 is imported on first load
+if TYPE_CHECKING:
+    from owlready2.namespace import Ontology, World
+
+
+# Version of the lookup map snapshot layout; bump when the contents change
+SNAPSHOT_FORMAT = 2
+
+
+def initialize():
+    """Function to initialize Precis. Loads the Precis ontology from the local
+    cache, builds the class and property lookup maps, and binds them to the
+    config module.
+
+    This function is idempotent; calling it after Precis has been initialized
+    has no effect.
+    """
+
+    # Skip if already initialized
+    if config.ont is not None:
+        return
+
+    # Resolving cached ontology file (seeded or downloaded if necessary)
+    ont_file = resolveOntologyFile(version=config.ont_version)
+    digest = fileDigest(file_path=ont_file)
+
+    # Loading ontology from the local file, keeping the source URL as its IRI
+    ont = loadOntology(ont_file=ont_file)
+
+    # Loading lookup maps from the snapshot, rebuilding it if it is stale
+    snapshot = loadSnapshot(digest=digest)
+    if snapshot is None:
+        snapshot = buildSnapshot(ont=ont, digest=digest)
+        saveSnapshot(snapshot=snapshot)
+
+    # Verifying base IRI
+    if snapshot['base_iri'] != config.ont_base_iri:
+        logging.warning('Precis ontology base IRI {0} does not match {1}'\
+            .format(snapshot['base_iri'], config.ont_base_iri))
+
+    # Binding to config module
+    config.ont = ont
+    config.ont_file = ont_file
+    config.ont_base_iri = snapshot['base_iri']
+    config.object_properties = bindLookupMap(
+        ont=ont, iri_map=snapshot['object_properties'])
+    config.ont_classes = bindLookupMap(
+        ont=ont, iri_map=snapshot['ont_classes'])
+    config.data_properties = bindLookupMap(
+        ont=ont, iri_map=snapshot['data_properties'])
+    config.property_table = snapshot['property_table']
+
+    logging.debug('Initialized Precis ontology {0} ({1})'.format(
+        config.ont_version, digest))
+
+
+def loadOntology(ont_file: str, world: 'World'=None) -> 'Ontology':
+    """Function to load the Precis ontology from a local file into a given
+    owlready2 world. The ontology is registered under the configured source URL,
+    so that it is indistinguishable from a downloaded copy.
+
+    Arguments:
+        ont_file {str} -- Path to the ontology file.
+
+    Keyword Arguments:
+        world {World} -- Target owlready2 world. The default world is used if
+                         one is not provided (default: {None}).
+
+    Returns:
+        Ontology -- Loaded Precis ontology.
+    """
+
+    if world is None:
+        from owlready2 import default_world as world
+
+    with open(ont_file, 'rb') as f:
+        return world.get_ontology(config.ont_source).load(fileobj=f)
+
+
+def resolveOntologyFile(version: str) -> str:
+    """Function to resolve the local, content-addressed copy of a given version
+    of the Precis ontology. Cache entries are named by the SHA-256 digest of
+    their contents, and are verified on every read.
+
+    On a cache miss, the cache is seeded from the copy bundled with the package
+    (if the versions match), and the ontology is downloaded otherwise. If the
+    cache folder is not writable, the bundled copy is used directly.
+
+    Arguments:
+        version {str} -- Ontology version (eg: '1.5.2').
+
+    Raises:
+        ValueError -- Raised when a downloaded ontology does not match its
+                      pinned checksum.
+
+    Returns:
+        str -- Path to the local ontology file.
+    """
+
+    ont_folder = os.path.join(config.cache_folder, 'ontology')
+    index_file = os.path.join(ont_folder, 'index.json')
+
+    # Looking up digest of the requested version (pinned digests take priority)
+    index = _readIndex(index_file=index_file)
+    digest = config.ont_checksums.get(version, index.get(version))
+
+    # Cache hit; verify contents before use
+    if digest is not None:
+        cached_file = os.path.join(ont_folder, '{0}.rdf'.format(digest))
+        if os.path.isfile(cached_file) and \
+            fileDigest(file_path=cached_file) == digest:
+            logging.debug('Using cached Precis ontology {0}'.format(
+                cached_file))
+            return cached_file
+
+    # Cache miss; seed from the bundled copy or download
+    if version == config.ont_bundled_version:
+        with open(config.ont_bundled, 'rb') as f:
+            contents = f.read()
+    else:
+        import urllib.request
+        source = config.ont_sources[version]
+        logging.info('Downloading Precis ontology {0} from {1}'.format(
+            version, source))
+        with urllib.request.urlopen(source) as response:
+            contents = response.read()
+
+    new_digest = hashlib.sha256(contents).hexdigest()
+    if digest is not None and new_digest != digest:
+        message = 'Precis ontology {0} does not match checksum {1}'.format(
+            version, digest)
+        logging.error(message)
+        raise ValueError(message)
+
+    # Writing to cache (atomic, as several processes may be starting up)
+    cached_file = os.path.join(ont_folder, '{0}.rdf'.format(new_digest))
+    try:
+        atomicWrite(file_path=cached_file, contents=contents)
+        index[version] = new_digest
+        atomicWrite(file_path=index_file,
+                     contents=json.dumps(index, indent=2).encode('utf-8'))
+    except OSError:
+        logging.warning('Precis cache folder {0} is not writable'.format(
+            config.cache_folder))
+        if version == config.ont_bundled_version:
+            return config.ont_bundled
+        raise
+
+    return cached_file
+
+
+def buildSnapshot(ont: 'Ontology', digest: str) -> dict:
+    """Function to build the lookup map snapshot for a loaded Precis ontology.
+    The snapshot maps class and property names to IRIs, so that it can be
+    stored independently of the owlready2 world. It also contains the property
+    table of the ontology (see `buildPropertyTable`).
+
+    Arguments:
+        ont {Ontology} -- Loaded Precis ontology.
+        digest {str} -- SHA-256 digest of the ontology file.
+
+    Returns:
+        dict -- Lookup map snapshot.
+    """
+
+    # Extracting ontology object property relations
+    # Note: 'hasDescription' is omitted, as it has a special handler
+    object_properties = {i.name: i.iri for i in ont.object_properties()
+                         if i.name != 'hasDescription'}
+
+    # Extracting ontology classes
+    ont_classes = {i.name: i.iri for i in ont.classes()}
+
+    # Extracting ontology data properties
+    data_properties = {i.name: i.iri for i in ont.data_properties()}
+
+    return {
+        'format': SNAPSHOT_FORMAT,
+        'digest': digest,
+        'base_iri': ont.base_iri,
+        'object_properties': object_properties,
+        'ont_classes': ont_classes,
+        'data_properties': data_properties,
+        'property_table': buildPropertyTable(ont=ont)
+    }
+
+
+def buildPropertyTable(ont: 'Ontology') -> dict:
+    """Function to build the property table of a loaded Precis ontology; a flat
+    map of (class name, property name) pairs to the schema of the property for
+    individuals of the class, for all classes and properties (including
+    'hasDescription'). The table only contains names and numbers, such that it
+    can be used without owlready2 (eg: to validate user data).
+
+    The schema of a property for a class is a dictionary of the form
+    {'functional': bool, 'min': int, 'max': int, 'range': list}, where
+    'functional' is True if the property has at most one value for the class
+    (see `PropertyClass.is_functional_for`), 'min' and 'max' are its
+    cardinality bounds ('max' is None if unbounded) from the restrictions of
+    the class and its ancestors, and 'range' is the sorted names of the
+    classes or datatypes (eg: 'str', 'datetime') of its values.
+
+    Arguments:
+        ont {Ontology} -- Loaded Precis ontology.
+
+    Returns:
+        dict -- Property table.
+    """
+
+    from owlready2 import EXACTLY, MAX, MIN, SOME
+    from owlready2.class_construct import Or, Restriction
+
+    def rangeNames(value) -> set:
+        # Names of a class or datatype, or of the members of a union
+        if isinstance(value, Or):
+            return set().union(*[rangeNames(i) for i in value.Classes])
+        if isinstance(value, type):
+            return set([getattr(value, 'name', None) or value.__name__])
+        return set()
+
+    property_table = dict()
+
+    ont_properties = list(ont.object_properties()) + \
+        list(ont.data_properties())
+    for ont_class in ont.classes():
+        # Value restrictions of the class and its ancestors, by property
+        restrictions = dict()
+        for ancestor in ont_class.ancestors():
+            for restriction in getattr(ancestor, 'is_a', []):
+                if isinstance(restriction, Restriction):
+                    restrictions.setdefault(restriction.property, []).append(
+                        restriction)
+
+        for ont_property in ont_properties:
+            schema = {'functional': bool(ont_property.is_functional_for(
+                          ont_class)),
+                      'min': 0, 'max': None,
+                      'range': set().union(*[rangeNames(value) for value in
+                                             ont_property.range])}
+
+            for restriction in restrictions.get(ont_property, []):
+                cardinality = restriction.cardinality
+                if restriction.type in [EXACTLY, MIN]:
+                    schema['min'] = max(schema['min'], cardinality)
+                elif restriction.type == SOME:
+                    schema['min'] = max(schema['min'], 1)
+                if restriction.type in [EXACTLY, MAX]:
+                    schema['max'] = cardinality if schema['max'] is None \
+                        else min(schema['max'], cardinality)
+                schema['range'].update(rangeNames(restriction.value))
+
+            schema['range'] = sorted(schema['range'])
+            property_table[(ont_class.name, ont_property.name)] = schema
+
+    return property_table
+
+
+def loadSnapshot(digest: str) -> dict:
+    """Function to load the lookup map snapshot for a given ontology digest.
+    The snapshot is only returned if both its format and its digest match.
+
+    Arguments:
+        digest {str} -- SHA-256 digest of the ontology file.
+
+    Returns:
+        dict -- Lookup map snapshot, or None if it is missing or stale.
+    """
+
+    snapshot_file = _snapshotFile(digest=digest)
+
+    try:
+        with open(snapshot_file, 'rb') as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+    if snapshot.get('format') != SNAPSHOT_FORMAT or \
+        snapshot.get('digest') != digest:
+        logging.debug('Discarding stale snapshot {0}'.format(snapshot_file))
+        return None
+
+    return snapshot
+
+
+def saveSnapshot(snapshot: dict):
+    """Function to save a lookup map snapshot to the local cache. Failures are
+    logged, but are not fatal.
+
+    Arguments:
+        snapshot {dict} -- Lookup map snapshot.
+    """
+
+    snapshot_file = _snapshotFile(digest=snapshot['digest'])
+
+    try:
+        atomicWrite(file_path=snapshot_file, contents=pickle.dumps(
+            snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        logging.warning('Snapshot could not be saved to {0}'.format(
+            snapshot_file))
+
+
+def bindLookupMap(ont: 'Ontology', iri_map: dict) -> dict:
+    """Function to bind a name -> IRI lookup map to the entities of a loaded
+    ontology.
+
+    Arguments:
+        ont {Ontology} -- Loaded Precis ontology.
+        iri_map {dict} -- Map of entity names to IRIs.
+
+    Returns:
+        dict -- Map of entity names to owlready2 entities.
+    """
+
+    return {name: ont.world[iri] for name, iri in iri_map.items()}
+
+
+def fileDigest(file_path: str) -> str:
+    """Function to compute the SHA-256 digest of a file.
+
+    Arguments:
+        file_path {str} -- Target file path.
+
+    Returns:
+        str -- Hex digest of the file contents.
+    """
+
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def atomicWrite(file_path: str, contents: bytes):
+    """Function to write a file atomically (i.e. readers see either the old
+    contents or the new contents), creating its folder if necessary.
+
+    Arguments:
+        file_path {str} -- Target file path.
+        contents {bytes} -- File contents.
+    """
+
+    # Write to a temporary file in the same folder, then move into place
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(contents)
+        os.replace(tmp_path, file_path)
+    except:
+        os.remove(tmp_path)
+        raise
+
+
+def _snapshotFile(digest: str) -> str:
+    return os.path.join(config.cache_folder, 'snapshots',
+                        '{0}.pickle'.format(digest))
+
+
+def _readIndex(index_file: str) -> dict:
+    try:
+        with open(index_file) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
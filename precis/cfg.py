@@ -1,11 +1,15 @@
-from owlready2.namespace import Namespace, Ontology
+from typing import TYPE_CHECKING
 import os
 
+# Only imported for type annotations; owlready2 is loaded lazily
+if TYPE_CHECKING:
+    from owlready2.namespace import Namespace, Ontology
+
 
 class config():
 
     # Precis ontology versions
-    __ont_sources = {
+    ont_sources = {
         'local': './precis_ontology.rdf',
         '1.0.0': 'https://github.com/rukmal/precis/releases/download/1.0.0/precis_ontology.rdf',
         '1.0.1': 'https://github.com/rukmal/precis/releases/download/1.0.1/precis_ontology.rdf',
@@ -20,24 +24,67 @@ class config():
         '1.5.2': 'https://github.com/rukmal/precis/releases/download/1.5.2/precis_ontology.rdf'
     }
 
-    # Ontology source URL
+    # Ontology version and source URL
     # Currently configured for use with Precis Ontology 1.5.2
-    ont_source = __ont_sources['1.5.2']
+    ont_version = '1.5.2'
+    ont_source = ont_sources[ont_version]
+
+    # SHA-256 digests of released ontology versions; used to verify the
+    # bundled copy and downloaded files before they enter the local cache
+    ont_checksums = {
+        '1.5.2': '27ea194494b21c1e3db8b5cea8ee1525e5ed94db51440998cb5e61cbd57f22a2'
+    }
+
+    # Ontology copy bundled with the package (seeds the local cache)
+    ont_bundled = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                               'precis_ontology.rdf')
+    ont_bundled_version = '1.5.2'
+
+    # Local cache folder (content-addressed ontology files and snapshots)
+    # Can be overridden with the PRECIS_CACHE_DIR environment variable
+    cache_folder = os.environ.get('PRECIS_CACHE_DIR', os.path.join(
+        os.path.expanduser('~'), '.cache', 'precis'))
+
+    # Whether templates are compiled through the persistent bytecode cache in
+    # the cache folder by default (see `TemplateBytecodeCache`)
+    # Can be enabled with the PRECIS_TEMPLATE_CACHE environment variable
+    template_bytecode_cache = os.environ.get('PRECIS_TEMPLATE_CACHE',
+                                             '') not in ['', '0']
+
+    # Maximum size of the render cache (see `RenderCache`), in bytes
+    render_cache_size = 256 * 1024 * 1024
+
+    # Default socket of the local render server (see `RenderServer`)
+    server_socket = os.path.join(cache_folder, 'render.sock')
+
+    # Ontology base IRI (fixed by the ontology; verified when it is loaded)
+    ont_base_iri: str = 'http://precis.rukmal.me/ontology#'
 
     # NOTE: The following are set to empty here to help with linting; they
     #       are set at runtime when Precis is initialized.
     
-    ont: Ontology = None  # Ontology
-    ont_base_iri: str = None  # Ontology base IRI
+    ont: 'Ontology' = None  # Ontology
+    ont_file: str = None  # Local ontology file (see `bootstrap.initialize`)
     object_properties: dict = {}  # Object property map
     data_properties: dict = {}  # Data property map
     ont_classes: dict = {}  # Ontology class map
-    namespace: Namespace = None  # Namespace for the current ontology
+    property_table: dict = {}  # (Class, property) -> schema map
+    namespace: 'Namespace' = None  # Namespace for the current ontology
 
     # Valid ordering options
     valid_order_options = ['chron_A', 'chron_D', 'alphabetical_A',
                            'alphabetical_D']
 
+    # Valid file formats to save user data in (see `Loader.saveToFile`)
+    valid_save_formats = ['rdfxml', 'ntriples', 'sqlite']
+
+    # Valid query backends (see `OntQuery`)
+    valid_query_backends = ['rdflib', 'native']
+
+    # Time (in seconds) above which queries are logged as slow (see
+    # `QueryProfiler`)
+    slow_query_threshold = 0.05
+
     # Templating Stuff
 
     # Template folder (relative to top-level package import)
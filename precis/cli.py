@@ -1,4 +1,208 @@
+from .cfg import config
+
 import argparse
+import logging
+import os
+import sys
+
+
+def load(args: argparse.Namespace) -> int:
+    """Function to load a JSON data file (with overrides), and save it as an
+    RDF file, or as a quadstore snapshot, or add it to a persistent world.
+
+    Arguments:
+        args {argparse.Namespace} -- Parsed 'load' command arguments.
+
+    Returns:
+        int -- Exit status.
+    """
+
+    from io import StringIO
+    from . import Loader, PrecisWorld, util
+    import json
+
+    data = util.buildData(data_file=args.data_file,
+                          override_files=args.override or [])
+
+    if args.store:
+        world = PrecisWorld.open(file_path=args.output_file)
+    else:
+        world = PrecisWorld()
+    try:
+        loader = Loader(ingest_file=StringIO(json.dumps(data)),
+                        namespace=args.namespace, world=world)
+        if not args.store:
+            loader.saveToFile(save_location=args.output_file,
+                              format=args.format)
+    finally:
+        world.close()
+
+    print('Saved {0} to {1}'.format(args.data_file, args.output_file))
+
+    return 0
+
+
+def render(args: argparse.Namespace) -> int:
+    """Function to render a template for a user data file (RDF or JSON, with
+    overrides), in this process, or on a running render server (see `serve`).
+
+    Arguments:
+        args {argparse.Namespace} -- Parsed 'render' command arguments.
+
+    Returns:
+        int -- Exit status (1 if rendering failed, 0 otherwise).
+    """
+
+    from .templating.batch import BatchJob
+
+    job = BatchJob(data_file=args.data_file,
+                   template_folder=resolveTemplate(template=args.template),
+                   prefs_file=args.prefs, output_file=args.output,
+                   override_files=tuple(args.override or []),
+                   namespace=args.namespace)
+
+    stats, profiler = None, None
+    if args.socket:
+        from .templating.server import RenderClient
+        result = RenderClient(socket_path=args.socket).render(job=job)
+    else:
+        from .templating import RenderCache
+        from .templating.batch import renderJob
+        if args.stats or args.trace:
+            from .stats import Stats
+            stats = Stats()
+        if args.query_profile:
+            from .query import QueryProfiler
+            profiler = QueryProfiler(slow_threshold=args.slow_query_threshold,
+                                     dump_algebra=args.dump_algebra)
+        result = renderJob(job=job,
+                           render_cache=RenderCache() if args.cache else None,
+                           stats=stats, profiler=profiler)
+
+    # Saving instrumentation (even if rendering failed)
+    if stats and args.stats:
+        stats.saveJSON(file_path=args.stats)
+    if stats and args.trace:
+        stats.saveChromeTrace(file_path=args.trace)
+    if profiler:
+        profiler.saveReport(file_path=args.query_profile)
+
+    if result.error:
+        print('Rendering failed: {0}'.format(result.error), file=sys.stderr)
+        return 1
+
+    if result.output is not None:
+        sys.stdout.write(result.output)
+    logging.info('Rendered {0} in {1:.3f}s'.format(args.data_file,
+                                                    result.timings['total']))
+
+    return 0
+
+
+def batch(args: argparse.Namespace) -> int:
+    """Function to render a template for each of a set of user data files in
+    parallel (see `BatchRenderer`). A line is printed as each job completes.
+
+    Arguments:
+        args {argparse.Namespace} -- Parsed 'batch' command arguments.
+
+    Returns:
+        int -- Exit status (1 if any job failed, 0 otherwise).
+    """
+
+    from .templating import BatchJob, BatchRenderer, RenderCache
+
+    template_folder = resolveTemplate(template=args.template)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    jobs = list()
+    for data_file in args.data_files:
+        output_name = os.path.splitext(os.path.basename(data_file))[0] + '.tex'
+        jobs.append(BatchJob(data_file=data_file,
+                             template_folder=template_folder,
+                             prefs_file=args.prefs,
+                             output_file=os.path.join(args.output_dir,
+                                                      output_name)))
+
+    n_failed = 0
+    with BatchRenderer(template_folders=[template_folder],
+                       max_workers=args.workers,
+                       render_cache=RenderCache() if args.cache else None) \
+        as renderer:
+        for result in renderer.render(jobs=jobs):
+            if result.error:
+                n_failed += 1
+                print('FAILED {0} ({1:.3f}s): {2}'.format(
+                    result.job.data_file, result.timings['total'],
+                    result.error))
+            else:
+                print('OK {0} -> {1} (build {2:.3f}s, render {3:.3f}s)'.format(
+                    result.job.data_file, result.job.output_file,
+                    result.timings['build'], result.timings['render']))
+            sys.stdout.flush()
+
+    print('Rendered {0} of {1} documents'.format(len(jobs) - n_failed,
+                                                  len(jobs)))
+
+    return 1 if n_failed else 0
+
+
+def serve(args: argparse.Namespace) -> int:
+    """Function to run a local render server (see `RenderServer`) until it is
+    stopped, or to stop a running render server.
+
+    Arguments:
+        args {argparse.Namespace} -- Parsed 'serve' command arguments.
+
+    Returns:
+        int -- Exit status.
+    """
+
+    from .templating.server import RenderClient, RenderServer
+
+    if args.stop:
+        RenderClient(socket_path=args.socket).shutdown()
+        print('Stopped render server on {0}'.format(args.socket))
+        return 0
+
+    from .templating import RenderCache
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.socket)), exist_ok=True)
+    server = RenderServer(socket_path=args.socket,
+                          template_folders=[resolveTemplate(template=t)
+                                            for t in args.template or []],
+                          render_cache=RenderCache() if args.cache else None)
+    print('Render server listening on {0}'.format(args.socket))
+    sys.stdout.flush()
+    server.serveForever()
+
+    return 0
+
+
+def resolveTemplate(template: str) -> str:
+    """Function to resolve a template folder, given its path or the name of a
+    template bundled with Precis (eg: 'curriculum_vitae').
+
+    Arguments:
+        template {str} -- Template folder path, or bundled template name.
+
+    Raises:
+        FileNotFoundError -- Raised when the template folder does not exist.
+
+    Returns:
+        str -- Template folder path.
+    """
+
+    if os.path.isdir(template):
+        return template
+
+    bundled_template = os.path.join(config.templates_folder, template)
+    if os.path.isdir(bundled_template):
+        return bundled_template
+
+    message = 'Template {0} not found'.format(template)
+    logging.error(message)
+    raise FileNotFoundError(message)
 
 
 def main():
@@ -6,23 +210,135 @@ def main():
         prog='precis',
         description='The non-redundant resume engine.'
     )
+    parser.add_argument('--verbose', action='store_true',
+                        help='Log progress information.')
+    subparsers = parser.add_subparsers(dest='command')
+
+    # Optional argument - overriding data (shared by subcommands)
+    override_parser = argparse.ArgumentParser(add_help=False)
+    override_parser.add_argument('--override', action='append',
+                                 help='JSON file to be used to override main \
+                                 data file (may be repeated). In ascending \
+                                 order of specificity; i.e. data_file < \
+                                 override 1 < override 2 < ... < override n.')
+
+    # Loading a JSON data file into RDF
+    load_parser = subparsers.add_parser('load', parents=[override_parser],
+                                        help='Convert a JSON data file to RDF.')
+    load_parser.add_argument('data_file', action='store',
+                             help='JSON data file to be loaded. Must be in \
+                             Precis-compatible format.')
+    load_parser.add_argument('output_file', action='store',
+                             help='File to be written.')
+    load_parser.add_argument('--format', action='store', default='rdfxml',
+                             choices=config.valid_save_formats,
+                             help='Output file format; RDF/XML, N-Triples, or \
+                             a binary quadstore snapshot (opened without \
+                             parsing RDF).')
+    load_parser.add_argument('--namespace', action='store', default=None,
+                             help='Namespace of the user data (randomly \
+                             generated if not provided).')
+    load_parser.add_argument('--store', action='store_true',
+                             help='Add the user data to the persistent world \
+                             in output_file (created if it does not exist), \
+                             under its namespace.')
 
-    # Required arguments
-    parser.add_argument('data_file', action='store', nargs=1,
-                        help='Data file to be used for resume. Must be in \
-                        Precis-compatible format.')  # data file
-    parser.add_argument('template_file', action='store', nargs=1,
-                        help='Template file to be compiled.')  # template file
+    # Rendering a single resume
+    render_parser = subparsers.add_parser('render', parents=[override_parser],
+                                          help='Render a single resume.')
+    render_parser.add_argument('data_file', action='store',
+                               help='Data file (RDF or JSON) to be used for \
+                               resume. Must be in Precis-compatible format.')
+    render_parser.add_argument('template', action='store',
+                               help='Template folder, or name of a bundled \
+                               template.')
+    render_parser.add_argument('--prefs', action='store', required=True,
+                               help='Template preferences file.')
+    render_parser.add_argument('--output', '-o', action='store', default=None,
+                               help='File to write the rendered template to \
+                               (written to stdout if not provided).')
+    render_parser.add_argument('--cache', action='store_true',
+                               help='Use the render cache.')
+    render_parser.add_argument('--socket', action='store', default=None,
+                               help='Render on the render server listening on \
+                               this socket (see "serve").')
+    render_parser.add_argument('--namespace', action='store', default=None,
+                               help='Namespace of the user data to render, if \
+                               data_file is a persistent world (see "load \
+                               --store").')
+    render_parser.add_argument('--stats', action='store', default=None,
+                               help='JSON file to write stage timings and \
+                               counters (queries, rows, searches and \
+                               individuals created) to.')
+    render_parser.add_argument('--trace', action='store', default=None,
+                               help='Chrome trace file to write stage timings \
+                               to (see chrome://tracing).')
+    render_parser.add_argument('--query-profile', action='store', default=None,
+                               help='JSON file to write the query profile \
+                               (timings and rows by query shape) and the slow \
+                               query log to.')
+    render_parser.add_argument('--slow-query-threshold', action='store',
+                               type=float, default=config.slow_query_threshold,
+                               help='Time (in seconds) above which queries are \
+                               logged as slow (with --query-profile).')
+    render_parser.add_argument('--dump-algebra', action='store_true',
+                               help='Include the RDFLib algebra tree of each \
+                               query shape in the query profile.')
 
-    # Optional argument - overriding data
-    parser.add_argument('--override', action='append', nargs='+',
-                        help='File(s) to be used to override main data file. \
-                        In ascending order of specificity; i.e. data_file < \
-                        override 1 < override 2 < ... < override n.')
+    # Rendering resumes in parallel
+    batch_parser = subparsers.add_parser('batch', help='Render a template for \
+                                         each of a set of data files, in \
+                                         parallel.')
+    batch_parser.add_argument('data_files', action='store', nargs='+',
+                              help='Data files (RDF or JSON) to be rendered.')
+    batch_parser.add_argument('--template', action='store', required=True,
+                              help='Template folder, or name of a bundled \
+                              template.')
+    batch_parser.add_argument('--prefs', action='store', required=True,
+                              help='Template preferences file.')
+    batch_parser.add_argument('--output-dir', action='store', default='.',
+                              help='Folder to write rendered templates to; \
+                              each is named after its data file.')
+    batch_parser.add_argument('--workers', action='store', type=int,
+                              default=None, help='Number of worker processes \
+                              (defaults to the number of CPUs).')
+    batch_parser.add_argument('--cache', action='store_true',
+                              help='Use the render cache.')
+
+    # Running a local render server
+    serve_parser = subparsers.add_parser('serve', help='Run a local render \
+                                         server, keeping the ontology and \
+                                         templates loaded between renders.')
+    serve_parser.add_argument('--socket', action='store',
+                              default=config.server_socket,
+                              help='Unix domain socket to listen on.')
+    serve_parser.add_argument('--template', action='append',
+                              help='Template folder, or name of a bundled \
+                              template, to be loaded when the server starts \
+                              (may be repeated).')
+    serve_parser.add_argument('--cache', action='store_true',
+                              help='Use the render cache.')
+    serve_parser.add_argument('--stop', action='store_true',
+                              help='Stop the render server listening on the \
+                              socket.')
 
     args = parser.parse_args()
 
-    print(args.data_file)
+    if (args.command == 'load') and args.store and (not args.namespace):
+        parser.error('--store requires --namespace')
+    if (args.command == 'render') and args.socket and \
+        (args.stats or args.trace or args.query_profile):
+        parser.error('--stats, --trace and --query-profile cannot be used \
+                     with --socket')
+
+    logging.basicConfig(level=logging.INFO if args.verbose else
+                        logging.WARNING)
+
+    commands = {'load': load, 'render': render, 'batch': batch, 'serve': serve}
+    if args.command in commands:
+        sys.exit(commands[args.command](args=args))
+    else:
+        parser.print_help()
 
 if __name__ == '__main__':
     main()
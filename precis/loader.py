@@ -1,20 +1,43 @@
+from . import util
 from .cfg import config
+from .stats import Stats, stage
+from .world import PrecisWorld
 
 from collections import OrderedDict
 from datetime import datetime
 from io import TextIOWrapper
-from owlready2 import default_world
+from owlready2 import destroy_entity
 from owlready2.entity import ThingClass
 from owlready2.namespace import Ontology
 from owlready2.rdflib_store import TripleLiteRDFlibGraph
-from typing import Union
+from typing import NamedTuple, Union
 from urllib.parse import urlparse
 from uuid import uuid4
+import hashlib
 import json
 import logging
 import re
 
 
+class LoadResult(NamedTuple):
+    """Result of loading a document with `Loader.bulkLoad`.
+
+    Arguments:
+        source {str} -- Path (or name) of the JSON document.
+        namespace {str} -- Namespace the document was loaded into (None if a
+                           random namespace was requested and the document
+                           failed to load).
+        loader {Loader} -- Loader holding the loaded document (None if the
+                           document failed to load).
+        error {str} -- Error message (None if the document was loaded).
+    """
+
+    source: str
+    namespace: str
+    loader: 'Loader'
+    error: str
+
+
 class Loader():
     """This module encapsulates JSON loading functionality. It supports loading
     a nested JSON representation of the linked data resume, as described in the
@@ -45,10 +68,34 @@ class Loader():
     object, enabling easy ID-based cross-referencing.
     """
 
-    def __init__(self, ingest_file: TextIOWrapper, namespace: str=None):
+    def __init__(self, ingest_file: TextIOWrapper, namespace: str=None,
+                 stream: bool=False, world: PrecisWorld=None,
+                 stats: Stats=None, track_changes: bool=False):
         """Initialization function for the Loader class. This method reads in a
         JSON file, and iteratively processes each of the objects in the
         top-level JSONArray.
+
+        In streaming mode, the top-level JSONArray is parsed incrementally, and
+        each object is processed as soon as it is parsed, so that the complete
+        parsed document is never held in memory. Note that in this mode,
+        objects preceding a malformed section of the file are added to the
+        ontology before the error is raised.
+
+        Individuals are added to the given Precis world. By default, the Precis
+        world wrapping the owlready2 default world is used (see
+        `PrecisWorld.default`), and the created namespace is also bound to the
+        config module. Loading into isolated worlds enables loading and querying
+        several, independent documents in one process. Documents loaded into a
+        persistent world (see `PrecisWorld.open`) are committed once they are
+        loaded, unless the world is in bulk mode.
+
+        If a Stats object is supplied, the time taken to parse the document, to
+        create individuals (of each class) and to commit it is recorded, and
+        individuals created and ontology searches are counted (see `Stats`).
+
+        If changes are tracked, a record (content hash, type and properties) of
+        the object each individual is created from is kept, such that the
+        document can be incrementally reloaded (see `reload`).
         
         Arguments:
             ingest_file {TextIOWrapper} -- Target JSON file object.
@@ -57,25 +104,35 @@ class Loader():
             namespace {str} -- Namespace to be used for the Ontology. A random
                                namespace is generated if one is not provided
                                (default: {None}).
+            stream {bool} -- Flag to parse and process the JSON file one object
+                             at a time (default: {False}).
+            world {PrecisWorld} -- Target Precis world. The default Precis world
+                                   is used if one is not provided
+                                   (default: {None}).
+            stats {Stats} -- Stats object recording instrumentation
+                             (default: {None}).
+            track_changes {bool} -- Flag to record the loaded objects, for
+                                    incremental reloads (default: {False}).
         
         Raises:
             JSONDecodeError -- Raised when the input JSON file is malformed.
             FileNotFoundError -- Raised when the target JSON file is not found.
         """
 
-        # Namespace creation (randomly generated if not explicitly provided)
-        if namespace is None:
-            config.namespace = config.ont.get_namespace(
-                ''.join([config.ont_base_iri, str(uuid4())]))
-        else:
-            # Verifying custom namespace
-            self.__verifyNamespace(candidate_namespace=namespace)
-            config.namespace = config.ont.get_namespace(namespace)
+        self.__setUp(namespace=namespace, world=world, stats=stats,
+                     track_changes=track_changes)
 
         try:
-            # Attempting to load JSON file
+            # Attempting to load JSON file (or to open the stream)
             # Note: the OrderedDict object hook is to preserve JSONArray order
-            raw = json.load(ingest_file, object_pairs_hook=OrderedDict)
+            if stream:
+                raw = util.iterJSONArray(file_obj=ingest_file,
+                                         object_pairs_hook=OrderedDict)
+            else:
+                with stage(self.stats, 'parse'):
+                    raw = json.load(ingest_file, object_pairs_hook=OrderedDict)
+
+            self.__ingest(document=raw)
         except json.decoder.JSONDecodeError:
             logging.error('JSON file is malformed')
             raise
@@ -83,15 +140,182 @@ class Loader():
             logging.error('JSON file {0} not found'.format(ingest_file.name))
             raise
 
-        for instance in raw:
-            # Creating ontology class from each instance
-            self.__processInstance(candidate_object=instance)
-        
+        # Committing to a persistent world (deferred in bulk mode)
+        if not self.world.bulk:
+            with stage(self.stats, 'commit'):
+                self.world.save()
+
+    @classmethod
+    def bulkLoad(cls, ingest_files: list, namespaces: list=None,
+                 world: PrecisWorld=None, stats: Stats=None,
+                 track_changes: bool=False) -> list:
+        """Function to load many JSON documents (eg: the documents of many
+        people, each into its own namespace) into a Precis world, committing
+        once all documents are loaded (see `PrecisWorld.open`).
+
+        Each document is parsed and validated (IDs and types) before any of
+        its individuals are created. A document that fails to load does not
+        abort the batch; the individuals (and descriptions) already created
+        from it are destroyed, and its error is reported in its result.
+
+        Arguments:
+            ingest_files {list} -- JSON documents (paths, or file objects).
+
+        Keyword Arguments:
+            namespaces {list} -- Namespace of each document (None for a random
+                                 namespace). Random namespaces are used for
+                                 all documents if not provided
+                                 (default: {None}).
+            world {PrecisWorld} -- Target Precis world. The default Precis world
+                                   is used if one is not provided
+                                   (default: {None}).
+            stats {Stats} -- Stats object recording instrumentation, shared by
+                             all documents (default: {None}).
+            track_changes {bool} -- Flag to record the loaded objects, for
+                                    incremental reloads of each document
+                                    (default: {False}).
+
+        Raises:
+            ValueError -- Raised when the number of namespaces does not match
+                          the number of documents.
+
+        Returns:
+            list -- Result of each document (see `LoadResult`), in order.
+        """
+
+        if namespaces is None:
+            namespaces = [None] * len(ingest_files)
+        elif len(namespaces) != len(ingest_files):
+            message = 'Expected {0} namespaces, got {1}'.format(
+                len(ingest_files), len(namespaces))
+            logging.error(message)
+            raise ValueError(message)
+
+        results = list()
+        for ingest_file, namespace in zip(ingest_files, namespaces):
+            source = ingest_file if type(ingest_file) is str else \
+                getattr(ingest_file, 'name', None)
+            loader = None
+            try:
+                with stage(stats, 'parse'):
+                    if type(ingest_file) is str:
+                        with open(ingest_file) as f:
+                            raw = json.load(f, object_pairs_hook=OrderedDict)
+                    else:
+                        raw = json.load(ingest_file,
+                                        object_pairs_hook=OrderedDict)
+
+                # Validating the document before creating individuals
+                candidate_loader = cls.__new__(cls)
+                candidate_loader.__setUp(namespace=namespace, world=world,
+                                         stats=stats,
+                                         track_changes=track_changes)
+                candidate_loader.__created = list()
+                loader = candidate_loader
+                with stage(stats, 'validate'):
+                    loader.__flattenDocument(document=raw)
+                loader.__ingest(document=raw)
+
+                results.append(LoadResult(source=source,
+                    namespace=loader.getNamespace(), loader=loader,
+                    error=None))
+            except Exception as e:
+                error = '{0}: {1}'.format(type(e).__name__, e)
+                logging.error('Document {0} could not be loaded: {1}'.format(
+                    source, error))
+
+                # Destroying individuals created from the document
+                if loader is not None:
+                    loader.__rollBack()
+
+                results.append(LoadResult(source=source,
+                    namespace=loader.getNamespace() if loader else namespace,
+                    loader=None, error=error))
+
+        # Committing all documents at once
+        with stage(stats, 'commit'):
+            (world or PrecisWorld.default()).save()
+
+        logging.info('Loaded {0} of {1} documents'.format(
+            sum(1 for result in results if result.error is None),
+            len(results)))
+
+        return results
+
+    def __setUp(self, namespace: str, world: PrecisWorld, stats: Stats,
+                track_changes: bool):
+        """Function to bind the target Precis world, and to create the
+        namespace of the loaded document (see `__init__`).
+
+        Arguments:
+            namespace {str} -- Namespace IRI (None for a random namespace).
+            world {PrecisWorld} -- Target Precis world (None for the default
+                                   Precis world).
+            stats {Stats} -- Stats object (None if instrumentation is
+                             disabled).
+            track_changes {bool} -- Flag to record the loaded objects.
+
+        Raises:
+            ValueError -- Raised when the namespace is not a valid URI.
+        """
+
+        # Binding target Precis world (loading the Precis ontology, if not
+        # loaded already)
+        if world is None:
+            world = PrecisWorld.default()
+        self.world = world
+        self.stats = stats
+        self.track_changes = track_changes
+
+        # Namespace creation (randomly generated if not explicitly provided)
+        if namespace is None:
+            self.namespace = self.world.getNamespace(
+                ''.join([config.ont_base_iri, str(uuid4())]))
+        else:
+            # Verifying custom namespace
+            self.__verifyNamespace(candidate_namespace=namespace)
+            self.namespace = self.world.getNamespace(namespace)
+
+        # Binding namespace to the config module (default world only)
+        if self.world.isDefault():
+            config.namespace = self.namespace
+
+        # Index of individuals created by this Loader (ID -> individual), used
+        # to resolve ID references without searching the ontology
+        self.__individuals = dict()
+
+        # Records of the objects each individual was created from (ID ->
+        # content hash, type, properties and number of descriptions), used to
+        # diff documents in incremental reloads (see `reload`; only kept if
+        # changes are tracked), and the individuals changed by the last reload
+        # (ID -> types)
+        self.__records = dict()
+        self.__last_changes = dict()
+
+        # Names of the entities (individuals and descriptions) created from
+        # the document, recorded before they are created, such that they can
+        # be destroyed if the document fails to load (bulk loads only; see
+        # `bulkLoad`)
+        self.__created = None
+
+    def __ingest(self, document):
+        """Function to create the individuals of a parsed JSON document (the
+        top-level JSONArray, or an iterator over its objects), in order.
+
+        Arguments:
+            document {list} -- Top-level JSONArray.
+        """
+
+        with stage(self.stats, 'ingest'):
+            for instance in document:
+                # Creating ontology class from each instance
+                self.__processInstance(candidate_object=instance)
+
+        # Note: Individuals are counted from the index of this Loader, as
+        #       counting the individuals of the ontology scans the whole world
         logging.info('Success! Added {0} individuals to the Precis ontology\
-            with base namespace IRI {1}'.format(
-                len(list(config.ont.individuals())),
-                config.namespace.base_iri)
-            )
+            with base namespace IRI {1}'.format(len(self.__individuals),
+                self.namespace.base_iri))
 
     def getOntology(self) -> Ontology:
         """Function to get the ontology as an owlready2 ontology.
@@ -100,7 +324,7 @@ class Loader():
             Ontology -- Built ontology with the loaded information.
         """
 
-        return config.namespace.ontology
+        return self.namespace.ontology
     
     def getRDFLibGraph(self) -> TripleLiteRDFlibGraph:
         """Function to get the rdflib graph representation of the ontology.
@@ -109,18 +333,159 @@ class Loader():
             TripleLiteRDFlibGraph -- RDFlib compatible graph.
         """
 
-        return default_world.as_rdflib_graph()
+        return self.world.getRDFLibGraph()
+
+    def getWorld(self) -> PrecisWorld:
+        """Function to get the Precis world the ontology was loaded into.
+
+        Returns:
+            PrecisWorld -- Precis world.
+        """
+
+        return self.world
     
-    def saveToFile(self, save_location: str):
-        """Function to save the built ontology to an RDF/XML file.
+    def reload(self, ingest_file: TextIOWrapper) -> dict:
+        """Function to incrementally reload the ontology from a new version of
+        the JSON document it was loaded from.
+
+        The new document is diffed against the loaded document by individual
+        ID and content hash (nested objects are diffed individually, and
+        compared by ID in their parents). Only changed individuals are
+        updated (in place, such that references to them are preserved), new
+        individuals are created, and individuals that are no longer in the
+        document are destroyed, together with their descriptions (the
+        '-description-N' children). Unchanged individuals are not touched, so
+        the time taken is proportional to the size of the edit, rather than
+        the size of the document.
+
+        The new document is validated (IDs, types and references) before the
+        ontology is modified. Note that if an invalid property is found while
+        processing a changed individual, changes preceding it are kept.
+
+        The document must have been loaded with changes tracked (see the
+        `track_changes` argument of `Loader`).
+
+        Arguments:
+            ingest_file {TextIOWrapper} -- New version of the JSON document.
+
+        Raises:
+            ValueError -- Raised when changes are not tracked by this Loader.
+            JSONDecodeError -- Raised when the input JSON file is malformed.
+            KeyError -- Raised when an object is missing its ID or type, or
+                        when its type is not a Precis ontology class.
+            ReferenceError -- Raised when an ID is referenced before it is
+                              defined, or is not defined in the document.
+
+        Returns:
+            dict -- Number of individuals added, updated, removed and
+                    unchanged.
+        """
+
+        if not self.track_changes:
+            message = 'Documents can only be reloaded if changes are tracked \
+                (see the track_changes argument of Loader)'
+            logging.error(message)
+            raise ValueError(message)
+
+        try:
+            with stage(self.stats, 'parse'):
+                raw = json.load(ingest_file, object_pairs_hook=OrderedDict)
+        except json.decoder.JSONDecodeError:
+            logging.error('JSON file is malformed')
+            raise
+
+        # Flattening and validating the new document before changing anything
+        with stage(self.stats, 'validate'):
+            new_objects = self.__flattenDocument(document=raw)
+        removed_ids = [i for i in self.__records if i not in new_objects]
+
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        self.__last_changes = dict()
+
+        # Creating new individuals, and updating changed individuals (in
+        # document order; nested objects precede their parents)
+        for individual_id, flat_object in new_objects.items():
+            old_record = self.__records.get(individual_id)
+            if old_record is None:
+                stats['added'] += 1
+                self.__last_changes[individual_id] = set([
+                    flat_object['$type']])
+            elif old_record['hash'] == self.__hashObject(
+                    flat_object=flat_object):
+                stats['unchanged'] += 1
+                continue
+            else:
+                self.__resetIndividual(individual_id=individual_id,
+                                       old_record=old_record,
+                                       new_object=flat_object)
+                stats['updated'] += 1
+                self.__last_changes[individual_id] = set([
+                    old_record['type'], flat_object['$type']])
+
+            self.__processInstance(candidate_object=OrderedDict(flat_object))
+
+        # Destroying individuals that are no longer in the document
+        for individual_id in removed_ids:
+            self.__last_changes[individual_id] = set([
+                self.__records[individual_id]['type']])
+            self.__destroyIndividual(individual_id=individual_id)
+            stats['removed'] += 1
+
+        # Committing to a persistent world (deferred in bulk mode)
+        if not self.world.bulk:
+            with stage(self.stats, 'commit'):
+                self.world.save()
+
+        logging.info('Reloaded ontology with base namespace IRI {0}; {1} \
+            added, {2} updated, {3} removed, {4} unchanged'.format(
+                self.namespace.base_iri, stats['added'], stats['updated'],
+                stats['removed'], stats['unchanged']))
+
+        return stats
+
+    def getLastChanges(self) -> dict:
+        """Function to get the individuals changed (added, updated or removed)
+        by the last incremental reload (see `reload`), with their types (before
+        and after the reload).
+
+        Returns:
+            dict -- Dictionary of the form {ID: {type, ...}}.
+        """
+
+        return {individual_id: set(types) for individual_id, types in
+                self.__last_changes.items()}
+
+    def saveToFile(self, save_location: str, format: str='rdfxml'):
+        """Function to save the built ontology to a file, in RDF/XML,
+        N-Triples, or as a binary quadstore snapshot ('sqlite'). Snapshots are
+        opened in place, without parsing RDF (see `PrecisWorld.fromSnapshot`),
+        and contain the entire Precis world of this Loader.
         
         Arguments:
             save_location {str} -- Location to save the file.
+
+        Keyword Arguments:
+            format {str} -- File format; one of 'rdfxml', 'ntriples' or
+                            'sqlite' (default: {'rdfxml'}).
+
+        Raises:
+            ValueError -- Raised when the file format is not valid.
         """
 
+        if format not in config.valid_save_formats:
+            message = 'Invalid save format {0}; must be one of {1}'.format(
+                format, config.valid_save_formats)
+            logging.error(message)
+            raise ValueError(message)
+
         # Attempting to save to file, throw exception if not
         try:
-            config.namespace.ontology.save(file=save_location, format='rdfxml')
+            with stage(self.stats, 'save', format=format):
+                if format == 'sqlite':
+                    self.world.saveSnapshot(file_path=save_location)
+                else:
+                    self.namespace.ontology.save(file=save_location,
+                                                 format=format)
         except:
             logging.error('Ontology could not be saved to {0}'.format(
                 save_location))
@@ -135,7 +500,7 @@ class Loader():
             str -- Namespace of the created ontology.
         """
 
-        return config.namespace.base_iri
+        return self.namespace.base_iri
 
     def __processInstance(self, candidate_object: dict):
         """Function to instantiate and add a given class instance to the
@@ -154,6 +519,11 @@ class Loader():
         # Empty container for the object to be added
         new_individual = dict()
 
+        # Recording the object (before it is consumed; see `reload`)
+        if self.track_changes:
+            flat_object = self.__flattenObject(
+                candidate_object=candidate_object)
+
         # Isolating type and id, removing from dictionary
         try:
             individual_id = candidate_object['$id']
@@ -170,12 +540,12 @@ class Loader():
         # Note: Explicit loop is necessary here to preserve order
         obj_properties = []
         for candidate_property in candidate_object.keys():
-            if candidate_property in config.object_properties.keys():
+            if candidate_property in self.world.object_properties.keys():
                 obj_properties.append(candidate_property)
 
         # Isolating list of data properties (if any exist) [order is irrelevant]
         data_properties = list(set(candidate_object.keys()).intersection(set(
-            config.data_properties.keys())))
+            self.world.data_properties.keys())))
 
         # Iterating through object property relations
         for obj_property in obj_properties:
@@ -225,12 +595,48 @@ class Loader():
         logging.debug('Adding object with ID {0} of type {1}'.format(
             individual_id, individual_type))
 
-        # Creating instance by calling class constructor
-        config.ont_classes[individual_type](
-            individual_id,
-            namespace=config.namespace,
-            **new_individual
-        )
+        # Creating instance by calling class constructor, adding to the index
+        self.__recordCreation(name=individual_id)
+        with stage(self.stats, 'create', c_type=individual_type):
+            self.__individuals[individual_id] = self.world.ont_classes[
+                individual_type](
+                individual_id,
+                namespace=self.namespace,
+                **new_individual
+            )
+        if self.stats:
+            self.stats.count('individuals', c_type=individual_type)
+
+        if not self.track_changes:
+            return
+
+        descriptions = flat_object.get('hasDescription', [])
+        self.__records[individual_id] = {
+            'hash': self.__hashObject(flat_object=flat_object),
+            'type': individual_type,
+            'properties': [k for k in flat_object if k not in ['$id', '$type']],
+            'descriptions': len(descriptions) if type(descriptions) is list
+                            else 1
+        }
+
+    def __isFunctional(self, ont_property: str, i_type: str) -> bool:
+        """Flag to check if a property is functional with respect to a class
+        (i.e. it has at most one value for individuals of the class), from the
+        property table of the Precis ontology (see
+        `bootstrap.buildPropertyTable`).
+
+        Arguments:
+            ont_property {str} -- Property name.
+            i_type {str} -- Class name.
+
+        Raises:
+            KeyError -- Raised when the class is not a Precis ontology class.
+
+        Returns:
+            bool -- True if the property is functional for the class.
+        """
+
+        return config.property_table[(i_type, ont_property)]['functional']
 
     def __handleObjectProperty(self, object_property: str, i_type: str,
         i_id: str, candidate_obj: object) -> Union[list, ThingClass]:
@@ -278,8 +684,7 @@ class Loader():
         # Check if functional property w.r.t. current class, if so return as-is
         # if not cast to list and return (incl. lookup stuff obviously)
         # See: http://bit.ly/2YY8rzz (search for 'FunctionalProperty')
-        if config.object_properties[object_property].is_functional_for(config.
-            ont_classes[i_type]):
+        if self.__isFunctional(ont_property=object_property, i_type=i_type):
             if isList:
                 message = 'Property {0} in the object {1} should not be a list'\
                     .format(object_property, i_id)
@@ -326,8 +731,7 @@ class Loader():
         # Check if functional property w.r.t. current class, if so add as-is
         # if not cast to list and append (if not list)
         # See: http://bit.ly/2YY8rzz (search for 'FunctionalProperty')
-        if config.data_properties[data_property].is_functional_for(config.
-            ont_classes[i_type]):
+        if self.__isFunctional(ont_property=data_property, i_type=i_type):
             if type(candidate_property) is list:
                 message = 'Property {0} in the object {1} should not be a list'\
                     .format(data_property, i_id)
@@ -372,18 +776,21 @@ class Loader():
                 priority = descr['hasPriority']
             else:
                 priority = 0
-            ret_obj.append(config.ont.Description(
+            self.__recordCreation(name=f"{obj_id}-description-{idx}")
+            ret_obj.append(self.world.ont.Description(
                 f"{obj_id}-description-{idx}",
-                namespace=config.namespace,
+                namespace=self.namespace,
                 hasPriority=priority,
                 hasText=descr['hasText']
             ))
+        if self.stats:
+            self.stats.count('individuals', n=len(ret_obj),
+                             c_type='Description')
         
         # Check if functional property w.r.t. current class, if so add as-is
         # if not cast to list and append (if not list)
         # See: http://bit.ly/2YY8rzz (search for 'FunctionalProperty')
-        if config.ont.hasDescription.is_functional_for(config
-            .ont_classes[obj_type]):
+        if self.__isFunctional(ont_property='hasDescription', i_type=obj_type):
             if isList:
                 message = 'Description in the object {0} should not be a list'\
                     .format(obj_id)
@@ -393,11 +800,199 @@ class Loader():
         else:
             return ret_obj
 
+    def __flattenObject(self, candidate_object: dict) -> OrderedDict:
+        """Function to get the flat representation of an object, in which
+        nested objects (in object property relations) are replaced by their
+        IDs. The object is not modified.
+
+        Arguments:
+            candidate_object {dict} -- Candidate object.
+
+        Returns:
+            OrderedDict -- Flat representation of the object.
+        """
+
+        flat_object = OrderedDict()
+
+        for key, value in candidate_object.items():
+            if key in self.world.object_properties:
+                values = value if type(value) is list else [value]
+                ids = [i.get('$id') if type(i) is OrderedDict else i
+                       for i in values]
+                flat_object[key] = ids if type(value) is list else ids[0]
+            else:
+                flat_object[key] = value
+
+        return flat_object
+
+    def __flattenDocument(self, document: list) -> OrderedDict:
+        """Function to flatten and validate a JSON document for an incremental
+        reload (see `reload`), or before it is loaded (see `bulkLoad`). Objects
+        are listed in the order they are processed by the Loader (i.e. nested
+        objects precede their parents).
+
+        Arguments:
+            document {list} -- Parsed top-level JSONArray.
+
+        Raises:
+            KeyError -- Raised when an object is missing its ID or type, or
+                        when its type is not a Precis ontology class.
+            ReferenceError -- Raised when an ID is referenced before it is
+                              defined, or is not defined in the document.
+
+        Returns:
+            OrderedDict -- Flat objects, by ID (see `__flattenObject`).
+        """
+
+        flat_objects = OrderedDict()
+
+        def visit(candidate_object: dict):
+            # Visiting nested objects first
+            for key, value in candidate_object.items():
+                if key not in self.world.object_properties: continue
+                for i in (value if type(value) is list else [value]):
+                    if type(i) is OrderedDict:
+                        visit(i)
+
+            flat_object = self.__flattenObject(
+                candidate_object=candidate_object)
+            if ('$id' not in flat_object) or ('$type' not in flat_object):
+                message = 'Missing required key "$type" or "$id$ in {0}'.\
+                    format(candidate_object)
+                logging.error(message)
+                raise KeyError(message)
+            if flat_object['$type'] not in self.world.ont_classes:
+                message = 'Invalid type {0} of object {1}'.format(
+                    flat_object['$type'], flat_object['$id'])
+                logging.error(message)
+                raise KeyError(message)
+
+            # Individuals of the loaded document that are not yet defined in
+            # the new document are either removed, or referenced before they
+            # are defined (other IDs are resolved in the ontology)
+            for key, value in flat_object.items():
+                if key not in self.world.object_properties: continue
+                for i in (value if type(value) is list else [value]):
+                    if (i not in flat_objects) and (i in self.__records):
+                        message = 'Entity {0} referenced before assignment \
+                            in {1}'.format(i, flat_object['$id'])
+                        logging.error(message)
+                        raise ReferenceError(message)
+
+            flat_objects[flat_object['$id']] = flat_object
+
+        for candidate_object in document:
+            visit(candidate_object)
+
+        return flat_objects
+
+    @staticmethod
+    def __hashObject(flat_object: dict) -> str:
+        # Content hash of a flat object (see `__flattenObject`)
+        return hashlib.sha256(json.dumps(flat_object, sort_keys=True,
+            default=str).encode('utf-8')).hexdigest()
+
+    def __resetIndividual(self, individual_id: str, old_record: dict,
+                          new_object: dict):
+        """Function to prepare an existing individual to be updated from a new
+        version of its object (see `reload`). Changes the type of the
+        individual (if it changed), clears properties that are no longer in the
+        object, and destroys descriptions beyond those in the new object.
+        Properties in the new object are then set as usual (see
+        `__processInstance`).
+
+        Arguments:
+            individual_id {str} -- ID of the individual.
+            old_record {dict} -- Record of the loaded object.
+            new_object {dict} -- New version of the object (flat).
+        """
+
+        individual = self.__findInOntology(search_id=individual_id,
+                                           obj_id=individual_id)
+        new_type = new_object['$type']
+        new_class = self.world.ont_classes[new_type]
+
+        # Changing type
+        if old_record['type'] != new_type:
+            individual.is_a.append(new_class)
+            individual.is_a.remove(self.world.ont_classes[old_record['type']])
+
+        # Clearing removed properties (unrecognized keys are not set)
+        for removed_property in set(old_record['properties']).difference(
+                new_object.keys()):
+            if (removed_property != 'hasDescription') and \
+                (removed_property not in self.world.object_properties) and \
+                (removed_property not in self.world.data_properties):
+                continue
+            if self.__isFunctional(ont_property=removed_property,
+                                   i_type=new_type):
+                setattr(individual, removed_property, None)
+            else:
+                setattr(individual, removed_property, [])
+
+        # Destroying descriptions beyond those in the new object
+        descriptions = new_object.get('hasDescription', [])
+        n_descriptions = len(descriptions) if type(descriptions) is list else 1
+        for idx in range(n_descriptions, old_record['descriptions']):
+            self.__destroyDescription(individual_id=individual_id, idx=idx)
+
+    def __destroyIndividual(self, individual_id: str):
+        """Function to destroy an individual created by this Loader, together
+        with its descriptions. References to it are removed.
+
+        Arguments:
+            individual_id {str} -- ID of the individual.
+        """
+
+        record = self.__records.pop(individual_id)
+        for idx in range(record['descriptions']):
+            self.__destroyDescription(individual_id=individual_id, idx=idx)
+
+        individual = self.__individuals.pop(individual_id, None)
+        if individual is None:
+            individual = self.__findInOntology(search_id=individual_id,
+                                               obj_id=individual_id)
+        destroy_entity(individual)
+
+        logging.debug('Destroyed object with ID {0}'.format(individual_id))
+
+    def __recordCreation(self, name: str):
+        # Recording the name of an entity before it is created (see
+        # `__rollBack`)
+        if self.__created is not None:
+            self.__created.append(name)
+
+    def __rollBack(self):
+        """Function to destroy the entities (individuals and descriptions)
+        created from a document that failed to load (see `bulkLoad`), most
+        recent first, including entities whose creation failed partway.
+        """
+
+        for name in reversed(self.__created):
+            entity = self.world.world[self.namespace.base_iri + name]
+            if entity is not None:
+                destroy_entity(entity)
+
+        self.__created = list()
+        self.__individuals = dict()
+        self.__records = dict()
+
+        logging.debug('Destroyed the individuals created in namespace {0}'.\
+            format(self.namespace.base_iri))
+
+    def __destroyDescription(self, individual_id: str, idx: int):
+        # Destroying a description of an individual (see `__handleDescription`)
+        description = self.world.world[''.join([self.namespace.base_iri,
+            '{0}-description-{1}'.format(individual_id, idx)])]
+        if description is not None:
+            destroy_entity(description)
+
     def __findInOntology(self, search_id: str, obj_id: str) -> ThingClass:
         """Function to find a specific individual in the current ontology,
-        given a search ID. This function appends the correct base IRI to the
-        search ID, and locates the individual in the current ontology, given
-        that the search ID is valid.
+        given a search ID. Individuals created by this Loader are resolved
+        through its ID index; otherwise, this function appends the correct base
+        IRI to the search ID, and locates the individual in the current
+        ontology, given that the search ID is valid.
         
         Arguments:
             search_id {str} -- ID to be searched for in the Ontology.
@@ -410,11 +1005,17 @@ class Loader():
             ThingClass -- ThingClass individual corresponding to search_id.
         """
 
+        # Looking up individuals created by this Loader first
+        if search_id in self.__individuals:
+            return self.__individuals[search_id]
+
         # Building complete candidate IRI
-        candidate_iri = config.namespace.base_iri + search_id
+        candidate_iri = self.namespace.base_iri + search_id
 
         # Locating instance in the ontology
-        res = config.ont.search(iri=candidate_iri)
+        res = self.world.ont.search(iri=candidate_iri)
+        if self.stats:
+            self.stats.count('searches')
 
         # Ensure existence
         if len(res) == 0:
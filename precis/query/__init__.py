@@ -1 +1,2 @@
 from .ont_query import OntQuery, TemplateOntQuery
+from .profiler import QueryProfiler
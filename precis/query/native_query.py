@@ -0,0 +1,429 @@
+from ..cfg import config
+
+from owlready2.namespace import Ontology
+from rdflib import BNode, Literal, OWL, RDF, RDFS, URIRef
+import logging
+
+
+class NativeQuery():
+    """This class evaluates the queries in the SPARQLQueries module directly
+    against the owlready2 quadstore, bypassing RDFLib's SPARQL engine.
+
+    Each query method follows the plan used by RDFLib to evaluate the
+    corresponding SPARQL query (i.e. the order of triple patterns, joins, and
+    the `ORDER BY` and `DISTINCT` semantics), over the same quadstore lookups.
+    Query methods return rows of RDFLib terms (with `None` for unbound
+    variables), in the same order as `Graph.query`.
+
+    Queries over the instances of a class can be scoped to the individuals of
+    a namespace (i.e. the user data of one person in a persistent world; see
+    `PrecisWorld.open`). Scoped instances are found with a range scan of the
+    quadstore IRI index, such that the cost of a query is proportional to the
+    number of individuals in the namespace, rather than in the quadstore.
+
+    Queries are read-only; IRIs are resolved to storage IDs without adding them
+    to the quadstore, and queries over IRIs that are not in the quadstore (eg:
+    unknown classes or individuals) have no results.
+    """
+
+    def __init__(self, ont: Ontology, namespace: str=None):
+        """NativeQuery initialization method. Binds the quadstore of the target
+        ontology's world, and resolves the storage IDs of constant IRIs used in
+        queries.
+
+        Arguments:
+            ont {Ontology} -- Ontology to be traversed.
+
+        Keyword Arguments:
+            namespace {str} -- Namespace IRI the instances of classes are
+                               scoped to; instances in all namespaces are
+                               queried if one is not provided
+                               (default: {None}).
+        """
+
+        self.ont = ont
+        self.namespace = namespace
+        self.triplelite = ont.world.graph
+
+        # Resolving storage IDs of constant IRIs
+        self.rdf_type = self.__constant(iri=str(RDF.type))
+        self.rdfs_label = self.__constant(iri=str(RDFS.label))
+        self.datatype_property = self.__constant(iri=str(OWL.DatatypeProperty))
+        self.object_property = self.__constant(iri=str(OWL.ObjectProperty))
+        self.precis = {name: self.__constant(iri=config.ont_base_iri + name)
+            for name in ['hasName', 'hasDate', 'employedAt', 'degreeUniversity',
+                         'hasParentOrganization', 'hasDescription',
+                         'hasPriority', 'hasText', 'affiliatedWith']}
+
+    def __constant(self, iri: str) -> int:
+        # Storage ID of a constant IRI (of the Precis ontology, or of RDF, RDFS
+        # or OWL), which must be in the quadstore
+        storid = self.__storid(iri=iri)
+        if storid is None:
+            message = 'IRI {0} is not in the quadstore; the Precis ontology \
+                must be loaded in the world of the ontology'.format(iri)
+            logging.error(message)
+            raise ValueError(message)
+        return storid
+
+    def __triples(self, s: int=None, p: int=None, o: int=None) -> list:
+        # Quadstore lookup used by the owlready2 RDFLib store (see
+        # `TripleLiteRDFlibStore.triples`), such that rows are returned in the
+        # same order
+        return self.triplelite._get_triples_spod_spod(s, p, o, None)
+
+    def __term(self, o, d=None):
+        # Conversion of a quadstore value to an RDFLib term (see
+        # `TripleLiteRDFlibStore._owlready_2_rdflib`)
+        if d is None:
+            if o < 0: return BNode(o)
+            return URIRef(self.triplelite._unabbreviate(o))
+        if isinstance(d, str) and d.startswith('@'):
+            return Literal(o, lang=d[1:])
+        if (d == '') or (d == 0):
+            return Literal(o)
+        return Literal(o, datatype=URIRef(self.triplelite._unabbreviate(d)))
+
+    @staticmethod
+    def __orderKey(term) -> tuple:
+        # Ordering of unbound variables and literals in `ORDER BY` (see
+        # `rdflib.plugins.sparql.evalutils._val`)
+        return (0,) if term is None else (3, term)
+
+    @staticmethod
+    def __distinct(rows: list) -> list:
+        # Removing duplicate rows, keeping the first occurrence
+        seen = set()
+        output = list()
+        for row in rows:
+            if row not in seen:
+                seen.add(row)
+                output.append(row)
+        return output
+
+    def __storid(self, iri: str) -> int:
+        # Storage ID of an IRI, or None if it is not in the quadstore
+        # Note: `_abbreviate` is not used, as it adds missing IRIs
+        row = self.triplelite.execute(
+            'SELECT storid FROM resources WHERE iri = ?', (iri,)).fetchone()
+        return None if row is None else row[0]
+
+    def __classInstances(self, c_type: str) -> list:
+        # Storage IDs of instances of a given type (i.e. `?s rdf:type precis:C`)
+        c_type_storid = self.__storid(iri=config.ont_base_iri + c_type)
+        if c_type_storid is None:
+            return list()
+        if self.namespace:
+            return self.__namespaceInstances(class_storids=[c_type_storid])
+        return [s for s, _, _, _ in self.__triples(p=self.rdf_type,
+                                                   o=c_type_storid)]
+
+    def __namespaceInstances(self, class_storids: list) -> list:
+        # Storage IDs of instances of any of the given types in the namespace,
+        # in the order of `__triples` (i.e. the (o, p, c) quadstore index)
+        # Note: The cross join (and the unary '+', disabling the (o, p) index)
+        #       makes SQLite scan the namespace IRI range first, and look up
+        #       the types of each individual, rather than scanning all
+        #       instances of the types
+        upper_bound = self.namespace[:-1] + chr(ord(self.namespace[-1]) + 1)
+        return [s for s, in self.triplelite.execute("""
+            SELECT q.s FROM resources r CROSS JOIN objs q
+            WHERE r.iri >= ? AND r.iri < ? AND q.s = r.storid AND q.p = ?
+                AND +q.o IN ({0})
+            ORDER BY q.o, q.c, q.rowid
+            """.format(','.join('?' * len(class_storids))),
+            [self.namespace, upper_bound, self.rdf_type] + class_storids)]
+
+    def getNamespaceInstances(self, class_iris: list) -> list:
+        """Function to get the IRIs of the instances of any of the given
+        classes, in the namespace of this query agent.
+
+        Arguments:
+            class_iris {list} -- Class IRIs.
+
+        Raises:
+            ValueError -- Raised when this query agent is not scoped to a
+                          namespace.
+
+        Returns:
+            list -- IRIs of the instances.
+        """
+
+        if not self.namespace:
+            message = 'Query agent is not scoped to a namespace'
+            logging.error(message)
+            raise ValueError(message)
+
+        class_storids = [storid for storid in
+            (self.__storid(iri=iri) for iri in class_iris) if storid is not None]
+        if not class_storids:
+            return list()
+
+        return [self.triplelite._unabbreviate(s) for s in
+            self.__namespaceInstances(class_storids=class_storids)]
+
+    def getAllOfType(self, c_type: str) -> list:
+        """Function to get all instances of a given type from the ontology
+        (see `SPARQLQueries.getAllOfType`).
+
+        Arguments:
+            c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        return self.__distinct([(self.__term(s),)
+            for s in self.__classInstances(c_type=c_type)])
+
+    def __getAllOfTypeTemporal(self, c_type: str, reverse: bool) -> list:
+        # Left join of instances with their (optional) dates, ordered by date
+        rows = list()
+        for s in self.__classInstances(c_type=c_type):
+            dates = self.__triples(s=s, p=self.precis['hasDate'])
+            if not dates:
+                rows.append((s, None))
+            for _, _, o, d in dates:
+                rows.append((s, self.__term(o, d)))
+
+        rows.sort(key=lambda row: self.__orderKey(row[1]), reverse=reverse)
+
+        return self.__distinct([(self.__term(s),) for s, _ in rows])
+
+    def getAllOfTypeAscendingTemporal(self, c_type: str) -> list:
+        """Function to get all instances of a given type in ascending temporal
+        order (see `SPARQLQueries.getAllOfTypeAscendingTemporal`).
+
+        Arguments:
+            c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        return self.__getAllOfTypeTemporal(c_type=c_type, reverse=False)
+
+    def getAllOfTypeDescendingTemporal(self, c_type: str) -> list:
+        """Function to get all instances of a given type in descending temporal
+        order (see `SPARQLQueries.getAllOfTypeDescendingTemporal`).
+
+        Arguments:
+            c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        return self.__getAllOfTypeTemporal(c_type=c_type, reverse=True)
+
+    def __getAllOfTypeAlphabetical(self, c_type: str, reverse: bool) -> list:
+        # Inner join of instances with their names, ordered by upper case name
+        rows = list()
+        for s in self.__classInstances(c_type=c_type):
+            for _, _, o, d in self.__triples(s=s, p=self.precis['hasName']):
+                rows.append((s, Literal(str(self.__term(o, d)).upper())))
+
+        rows.sort(key=lambda row: self.__orderKey(row[1]), reverse=reverse)
+
+        return self.__distinct([(self.__term(s),) for s, _ in rows])
+
+    def getAllOfTypeAlphabeticalAsc(self, c_type: str) -> list:
+        """Function to get all instances of a given type in ascending
+        alphabetical order (see `SPARQLQueries.getAllOfTypeAlphabeticalAsc`).
+
+        Arguments:
+            c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        return self.__getAllOfTypeAlphabetical(c_type=c_type, reverse=False)
+
+    def getAllOfTypeAlphabeticalDesc(self, c_type: str) -> list:
+        """Function to get all instances of a given type in descending
+        alphabetical order (see `SPARQLQueries.getAllOfTypeAlphabeticalDesc`).
+
+        Arguments:
+            c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        return self.__getAllOfTypeAlphabetical(c_type=c_type, reverse=True)
+
+    def getDataProperties(self, target_iri: str) -> list:
+        """Function to get the data properties of a given instance (see
+        `SPARQLQueries.getDataProperties`).
+
+        Arguments:
+            target_iri {str} -- Target instance IRI.
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        target = self.__storid(iri=target_iri)
+        if target is None:
+            return list()
+
+        rows = list()
+        for p, _, _, _ in self.__triples(p=self.rdf_type,
+                                         o=self.datatype_property):
+            for _, _, o, d in self.__triples(s=target, p=p):
+                rows.append((self.__term(p), self.__term(o, d)))
+
+        return self.__distinct(rows)
+
+    def __getObjectLabels(self, o: int) -> list:
+        # Second-level labels of an object property target (see
+        # `SPARQLQueries.objectLabelPattern`), as (orgname, parentOrgName)
+        labels = list()
+
+        # Organization names, for 'WorkExperience' and 'Degree' targets
+        for org_property in ['employedAt', 'degreeUniversity']:
+            for _, _, org, _ in self.__triples(s=o,
+                                               p=self.precis[org_property]):
+                for _, _, name, d in self.__triples(s=org,
+                                                    p=self.precis['hasName']):
+                    labels.append((self.__term(name, d), None))
+
+        # Parent organization names (with optional grandparent names)
+        for _, _, org, _ in self.__triples(
+                s=o, p=self.precis['hasParentOrganization']):
+            for _, _, name, d in self.__triples(s=org,
+                                                p=self.precis['hasName']):
+                parent_names = [self.__term(parent_name, parent_d)
+                    for _, _, parent_org, _ in self.__triples(
+                        s=org, p=self.precis['hasParentOrganization'])
+                    for _, _, parent_name, parent_d in self.__triples(
+                        s=parent_org, p=self.precis['hasName'])]
+                for parent_name in parent_names or [None]:
+                    labels.append((self.__term(name, d), parent_name))
+
+        return labels
+
+    def getObjectProperties(self, target_iri: str) -> list:
+        """Function to get the object properties of a given instance, with
+        second-level labels (see `SPARQLQueries.getObjectProperties`).
+
+        Arguments:
+            target_iri {str} -- Target instance IRI.
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        target = self.__storid(iri=target_iri)
+        if target is None:
+            return list()
+
+        rows = list()
+        for p, _, _, _ in self.__triples(p=self.rdf_type,
+                                         o=self.object_property):
+            for _, _, o, _ in self.__triples(s=target, p=p):
+                names = self.__triples(s=o, p=self.precis['hasName'])
+                if not names: continue
+                # Second-level labels are optional (left join)
+                labels = self.__getObjectLabels(o=o) or [(None, None)]
+                for _, _, name, d in names:
+                    for orgname, parent_name in labels:
+                        rows.append((self.__term(p), self.__term(name, d),
+                                     orgname, parent_name))
+
+        return self.__distinct(rows)
+
+    def getOrderedDescriptionText(self, target_iri: str,
+                                  max_priority: int=int(1e10)) -> list:
+        """Function to get description text for a given instance, ordered by
+        the 'hasPriority' attribute (see
+        `SPARQLQueries.getOrderedDescriptionText`).
+
+        Arguments:
+            target_iri {str} -- Target instance IRI.
+
+        Keyword Arguments:
+            max_priority {int} -- Maximum description priority
+                                  (default: {int(1e10)}).
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        max_priority = Literal(max_priority)
+
+        # Filtering by priority (rows that cannot be compared are excluded)
+        rows = list()
+        for priority, text in self.__getDescriptionRows(target_iri=target_iri):
+            try:
+                if priority < max_priority:
+                    rows.append((priority, text))
+            except TypeError:
+                logging.debug('Ignoring description with priority {0}'.format(
+                    priority))
+
+        rows.sort(key=lambda row: self.__orderKey(row[0]))
+
+        return self.__distinct([(text,) for _, text in rows])
+
+    def __getDescriptionRows(self, target_iri: str) -> list:
+        # Join of an instance's descriptions with their priority and text, as
+        # (priority, text) rows
+        target = self.__storid(iri=target_iri)
+        if target is None:
+            return list()
+
+        rows = list()
+        for _, _, descr, _ in self.__triples(
+                s=target, p=self.precis['hasDescription']):
+            for _, _, priority, priority_d in self.__triples(
+                    s=descr, p=self.precis['hasPriority']):
+                for _, _, text, text_d in self.__triples(
+                        s=descr, p=self.precis['hasText']):
+                    rows.append((self.__term(priority, priority_d),
+                                 self.__term(text, text_d)))
+
+        return rows
+
+    def getDescriptionPriorities(self, target_iri: str) -> list:
+        """Function to get the priority and text of all descriptions of a given
+        instance, ordered by the 'hasPriority' attribute (see
+        `SPARQLQueries.getDescriptionPriorities`).
+
+        Arguments:
+            target_iri {str} -- Target instance IRI.
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        rows = self.__getDescriptionRows(target_iri=target_iri)
+        rows.sort(key=lambda row: self.__orderKey(row[0]))
+
+        return rows
+
+    def getAffiliated(self, target_iri: str) -> list:
+        """Function to get instances that have listed a given instance as an
+        `affiliatedWith` instance (see `SPARQLQueries.getAffiliated`).
+
+        Arguments:
+            target_iri {str} -- Target instance IRI.
+
+        Returns:
+            list -- Query result rows.
+        """
+
+        target = self.__storid(iri=target_iri)
+        if target is None:
+            return list()
+
+        rows = list()
+        for related, _, _, _ in self.__triples(
+                p=self.precis['affiliatedWith'], o=target):
+            for _, _, c_type, _ in self.__triples(s=related, p=self.rdf_type):
+                for _, _, label, d in self.__triples(s=c_type,
+                                                     p=self.rdfs_label):
+                    rows.append((self.__term(related), self.__term(label, d)))
+
+        return self.__distinct(rows)
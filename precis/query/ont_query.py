@@ -1,11 +1,15 @@
+from .. import bootstrap
 from ..cfg import config
+from ..stats import Stats, stage
+from .native_query import NativeQuery
+from .profiler import QueryProfiler
 from .sparql_queries import SPARQLQueries
 
-from owlready2 import IRIS
 from owlready2.entity import ThingClass
 from owlready2.namespace import Ontology
 from rdflib import Graph
 import logging
+import time
 
 
 class OntQuery():
@@ -26,18 +30,177 @@ class OntQuery():
     class, instance IRI, or the entire ontology.
     """
 
-    def __init__(self, ont: Ontology, graph: Graph):
+    def __init__(self, ont: Ontology, graph: Graph, batched: bool=False,
+                 backend: str='rdflib', namespace: str=None,
+                 stats: Stats=None, profiler: QueryProfiler=None):
         """OntQuery initialization method. Binds the target ontology, and
         RDFLib graph to class variables.
+
+        In batched mode, `getAllOfType` extracts the metadata of all individuals
+        of a class with a fixed number of set-based queries, as opposed to
+        running the queries in `getIndividual` for each individual.
+
+        The 'rdflib' backend runs SPARQL queries over the RDFLib graph, and the
+        'native' backend evaluates the same queries directly against the
+        owlready2 quadstore (see `NativeQuery`). The native backend does not
+        use the RDFLib graph, and extracts each individual directly (i.e.
+        batched mode only applies to the 'rdflib' backend). The output is
+        identical in all modes.
+
+        Queries can be scoped to the individuals of one namespace (i.e. the
+        user data of one person, in a persistent world holding the user data
+        of many people; see `PrecisWorld.open`). With the native backend, the
+        instances of a class are found with the quadstore IRI index (see
+        `NativeQuery`); with the 'rdflib' backend, query results are filtered.
+
+        If a Stats object is supplied, the time taken to prepare and to run
+        each query is recorded, and queries, result rows and ontology searches
+        are counted (see `Stats`). If a query profiler is supplied, queries
+        are profiled by shape, and slow queries are logged (see
+        `QueryProfiler`).
         
         Arguments:
             ont {Ontology} -- Ontology to be traversed.
             graph {Graph} -- RDFLib graph representation of the target ontology.
+
+        Keyword Arguments:
+            batched {bool} -- Flag to use batched extraction in `getAllOfType`
+                              (default: {False}).
+            backend {str} -- Query backend, must be either 'rdflib' or 'native'
+                             (default: {'rdflib'}).
+            namespace {str} -- Namespace IRI queries are scoped to; individuals
+                               in all namespaces are queried if one is not
+                               provided (default: {None}).
+            stats {Stats} -- Stats object recording instrumentation
+                             (default: {None}).
+            profiler {QueryProfiler} -- Query profiler (default: {None}).
+
+        Raises:
+            ValueError -- Raised when the `backend` is not 'rdflib' or
+                          'native', or when batched mode is requested with the
+                          'native' backend.
         """
 
+        # Loading the Precis ontology (if not loaded already)
+        bootstrap.initialize()
+
+        # Ensuring backend selection is valid
+        if backend not in config.valid_query_backends:
+            message = 'Backend must be one of {0}'.format(
+                config.valid_query_backends)
+            logging.error(message)
+            raise ValueError(message)
+
+        # Ensuring batched mode is not requested with the native backend
+        if batched and (backend == 'native'):
+            message = 'Batched mode is not supported by the native backend'
+            logging.error(message)
+            raise ValueError(message)
+
         # Assigning class variables
         self.ont = ont
         self.graph = graph
+        self.backend = backend
+        self.batched = batched
+        self.namespace = namespace
+        self.stats = stats
+        self.profiler = profiler
+
+        # Instantiating native query agent (if required)
+        if (backend == 'native') or namespace:
+            self.native_query = NativeQuery(ont=ont, namespace=namespace)
+
+        # Property IRI -> python name table (from the Precis ontology), and
+        # individual IRI -> name cache (for affiliated individuals)
+        self.property_names = {prop.iri: prop.python_name for prop in
+            list(config.data_properties.values()) +
+            list(config.object_properties.values())}
+        self.individual_names = dict()
+
+        # Object properties looked up in reverse (i.e. from their range; see
+        # `getIndividual`)
+        self.inverse_properties = ['affiliatedWith']
+
+        # Class -> ordering index (see `getIndividualIRIs`), and the number of
+        # quadstore changes the name cache and the indexes were built at
+        self.order_index = dict()
+        self.cache_changes = None
+
+        # Number of name lookups resolved from the tables above ('cached'), and
+        # with ontology searches ('searched')
+        self.name_lookups = {'cached': 0, 'searched': 0}
+
+    def __propertyName(self, property_iri: str) -> str:
+        """Function to get the python name of a property, given its IRI.
+        
+        Arguments:
+            property_iri {str} -- Target property IRI.
+        
+        Returns:
+            str -- Python name of the property.
+        """
+
+        if property_iri in self.property_names:
+            self.name_lookups['cached'] += 1
+        else:
+            # Searching ontology for properties not in the Precis ontology
+            self.name_lookups['searched'] += 1
+            if self.stats:
+                self.stats.count('searches')
+            self.property_names[property_iri] = self.ont.search_one(
+                iri=property_iri).python_name
+
+        return self.property_names[property_iri]
+
+    def __individualName(self, individual_iri: str):
+        """Function to get the name(s) of an individual, given its IRI. Names
+        are cached until the quadstore changes (eg: when an individual is
+        renamed by an incremental reload; see `Loader.reload`).
+        
+        Arguments:
+            individual_iri {str} -- Target individual IRI.
+        
+        Returns:
+            Name(s) of the individual (i.e. its `hasName` property).
+        """
+
+        self.__syncCaches()
+        if individual_iri in self.individual_names:
+            self.name_lookups['cached'] += 1
+        else:
+            self.name_lookups['searched'] += 1
+            if self.stats:
+                self.stats.count('searches')
+            self.individual_names[individual_iri] = self.ont.search_one(
+                iri=individual_iri).hasName
+
+        return self.individual_names[individual_iri]
+
+    def __query(self, shape: str, **parameters):
+        """Function to run a query from the SPARQLQueries module, with the
+        selected backend.
+        
+        Arguments:
+            shape {str} -- Query shape (i.e. name of the query getter).
+            **parameters -- Query parameter values.
+        
+        Returns:
+            Iterable -- Query result rows.
+        """
+
+        if self.stats or self.profiler:
+            return instrumentedQuery(shape=shape, parameters=parameters,
+                                     backend=self.backend, graph=self.graph,
+                                     native_query=getattr(self, 'native_query',
+                                                          None),
+                                     stats=self.stats, profiler=self.profiler)
+
+        if self.backend == 'native':
+            return getattr(self.native_query, shape)(**parameters)
+
+        query, bindings = getattr(SPARQLQueries, shape)(**parameters)
+
+        return self.graph.query(query_object=query, initBindings=bindings)
 
     def getAllOfType(self, c_type: str, order: str=None,
                      descr_priority: int=int(1e10)) -> list:
@@ -70,6 +233,64 @@ class OntQuery():
         # Empty list to store output (naturally preserves order of course)
         output = list()
 
+        # Name lookup counts before extraction (for instrumentation)
+        name_lookups = dict(self.name_lookups)
+
+        # Get IRIs of all individuals of the class, in order
+        candidate_iris = self.getIndividualIRIs(c_type=c_type, order=order)
+
+        # Extract metadata for all individuals of the class up-front (batched)
+        if self.batched:
+            class_invds = self.__getIndividualsOfType(
+                c_type=c_type,
+                descr_priority=descr_priority
+            )
+
+        for candidate_iri in candidate_iris:
+            # Isolating candidate instance
+            logging.debug('Processing search result instance {0}'
+                .format(candidate_iri))
+            # Getting python-ified instance data
+            if self.batched:
+                output.append(class_invds.get(candidate_iri) or
+                              {'$id': self.ont.world[candidate_iri].name})
+            else:
+                candidate_individual: ThingClass = self.ont.world[
+                    candidate_iri]
+                output.append(self.getIndividual(
+                    individual=candidate_individual,
+                    descr_priority=descr_priority
+                ))
+
+        logging.debug('Resolved {0} names for class {1} ({2} ontology searches'
+            ' avoided, {3} performed)'.format(
+                sum(self.name_lookups.values()) - sum(name_lookups.values()),
+                c_type, self.name_lookups['cached'] - name_lookups['cached'],
+                self.name_lookups['searched'] - name_lookups['searched']))
+
+        return output
+
+    def getIndividualIRIs(self, c_type: str, order: str=None) -> list:
+        """Function to get the IRIs of all instances of a given class type, in
+        the order of `getAllOfType`.
+        
+        Arguments:
+            c_type {str} -- Target class type (i.e. 'Degree', 'Course', etc.).
+        
+        Keyword Arguments:
+            order {str} -- Ordering, optional. Must be either 'chron_A',
+                           'chron_D', 'alphabetical_A', or 'alphabetical_D'
+                           (see `getAllOfType`) (default: {None}).
+        
+        Raises:
+            ValueError -- Raised when the `order` is not 'chron_A', 'chron_D',
+                          'alphabetical_A', or 'alphabetical_D'.
+        
+        Returns:
+            list -- Ordered (optional) list of IRIs of all instances of
+                    `c_type`.
+        """
+
         # Ensuring order selection is valid (if one is provided)
         if (order) and (order not in config.valid_order_options):
             message = 'Order must be one of {0}'.format(
@@ -77,34 +298,177 @@ class OntQuery():
             logging.error(message)
             raise ValueError(message)
 
-        # Dynamically assign query based on type
-        if (order == 'chron_A'):
-            query = SPARQLQueries.getAllOfTypeAscendingTemporal(c_type=c_type)
-        elif (order == 'chron_D'):
-            query = SPARQLQueries.getAllOfTypeDescendingTemporal(c_type=c_type)
-        elif (order == 'alphabetical_A'):
-            query = SPARQLQueries.getAllOfTypeAlphabeticalAsc(c_type=c_type)
-        elif (order == 'alphabetical_D'):
-            query = SPARQLQueries.getAllOfTypeAlphabeticalDesc(c_type=c_type)
+        # Permuting the default order with the ordering index of the class
+        if order:
+            order_index = self.__orderIndex(c_type=c_type)
+            return [order_index['iris'][i] for i in
+                    order_index['orders'][order]]
+
+        # Execute query (scoped queries over all namespaces are filtered)
+        iris = [result[0].toPython()
+            for result in self.__query(shape='getAllOfType', c_type=c_type)]
+        if self.namespace and (self.backend != 'native'):
+            iris = [iri for iri in iris if iri.startswith(self.namespace)]
+
+        return iris
+
+    def __orderIndex(self, c_type: str) -> dict:
+        """Function to get the ordering index of a class; that is, the IRIs of
+        its instances in the default order, and their positions in each
+        ordering. The index is built once (with a single pass over the
+        instances, rather than a query for each ordering), and is kept until
+        the quadstore changes (eg: when a document is loaded or reloaded into
+        the world of the ontology; see `Loader`), or until it is invalidated
+        (see `invalidateOrders`).
+
+        The orderings match the ordering queries in the SPARQLQueries module
+        (eg: `getAllOfTypeAscendingTemporal`); instances without a date come
+        first in ascending chronological order, instances without a name are
+        left out of alphabetical orders, and names are compared in upper case.
+        Ties are broken by the default order (in both directions).
+
+        Arguments:
+            c_type {str} -- Target class type (i.e. 'Degree', 'Course', etc.).
+
+        Returns:
+            dict -- Dictionary with 'iris' (default order) and 'orders' (of the
+                    form {order: [position, ...]}) keys.
+        """
+
+        self.__syncCaches()
+        if c_type in self.order_index:
+            return self.order_index[c_type]
+
+        def values(individual: ThingClass, ont_property: str) -> list:
+            # Values of a (functional or non-functional) property
+            value = getattr(individual, ont_property)
+            if isinstance(value, list):
+                return list(value)
+            return [] if value is None else [value]
+
+        def positions(rows: list, reverse: bool) -> list:
+            # Distinct positions of (position, sort key) rows, in order
+            # Note: Sorting is stable, so ties keep the default order
+            output = list()
+            seen = set()
+            for position, _ in sorted(rows, key=lambda row: row[1],
+                                      reverse=reverse):
+                if position not in seen:
+                    seen.add(position)
+                    output.append(position)
+            return output
+
+        iris = self.getIndividualIRIs(c_type=c_type)
+
+        # (Position, sort key) rows; undated instances sort first
+        dated = list()
+        named = list()
+        for position, iri in enumerate(iris):
+            individual = self.ont.world[iri]
+            dates = values(individual=individual, ont_property='hasDate')
+            if not dates:
+                dated.append((position, (0,)))
+            dated.extend((position, (1, date)) for date in dates)
+            named.extend((position, str(name).upper()) for name in
+                         values(individual=individual, ont_property='hasName'))
+
+        self.order_index[c_type] = {
+            'iris': iris,
+            'orders': {
+                'chron_A': positions(rows=dated, reverse=False),
+                'chron_D': positions(rows=dated, reverse=True),
+                'alphabetical_A': positions(rows=named, reverse=False),
+                'alphabetical_D': positions(rows=named, reverse=True)
+            }
+        }
+
+        return self.order_index[c_type]
+
+    def __syncCaches(self):
+        """Function to invalidate the individual name cache and all ordering
+        indexes if the quadstore changed since they were built (the SQLite
+        connection counts the rows changed through it).
+        """
+
+        changes = self.ont.world.graph.db.total_changes
+        if changes != self.cache_changes:
+            self.individual_names.clear()
+            self.order_index.clear()
+            self.cache_changes = changes
+
+    def invalidateOrders(self, c_types: list=None):
+        """Function to invalidate the ordering indexes of classes (see
+        `getIndividualIRIs`). Indexes are rebuilt when they are next used.
+        Note that indexes are also invalidated when the quadstore changes.
+
+        Keyword Arguments:
+            c_types {list} -- Class types; the indexes of all classes are
+                              invalidated if not provided (default: {None}).
+        """
+
+        if c_types is None:
+            self.order_index.clear()
         else:
-            query = SPARQLQueries.getAllOfType(c_type=c_type)
+            for c_type in c_types:
+                self.order_index.pop(c_type, None)
 
-        # Execute query
-        results = self.graph.query(query_object=query)
+    def getInstances(self, c_type: str) -> list:
+        """Function to get all instances of a given class type, including
+        instances of its subclasses (i.e. `Thing.instances`), in the namespace
+        of this query agent (if scoped to one).
 
-        for result in results:
-            # Isolating candidate IRI and instance
-            candidate_iri: str = result[0].toPython()
-            candidate_individual: ThingClass = IRIS[candidate_iri]
-            logging.debug('Processing search result instance {0}'
-                .format(candidate_iri))
-            # Getting python-ified instance data
-            output.append(self.getIndividual(
-                individual=candidate_individual,
-                descr_priority=descr_priority
-            ))
+        Arguments:
+            c_type {str} -- Target class type (i.e. 'Degree', 'Course', etc.).
 
-        return output
+        Raises:
+            KeyError -- Raised when the class type is not in the Precis
+                        ontology.
+
+        Returns:
+            list -- Instances of the class.
+        """
+
+        ont_class = self.ont.world[config.ont_classes[c_type].iri]
+        if not self.namespace:
+            return list(ont_class.instances())
+
+        return [self.ont.world[iri] for iri in
+            self.native_query.getNamespaceInstances(class_iris=[c.iri
+                for c in ont_class.descendants()])]
+
+    def getInstanceNames(self, c_type: str) -> set:
+        """Function to get the names of all instances of a given class type
+        (see `getInstances`).
+
+        Arguments:
+            c_type {str} -- Target class type (i.e. 'Degree', 'Course', etc.).
+
+        Raises:
+            KeyError -- Raised when the class type is not in the Precis
+                        ontology.
+
+        Returns:
+            set -- Names of the instances.
+        """
+
+        return set([i.name for i in self.getInstances(c_type=c_type)])
+
+    def getDescriptionPriorities(self, individual_iri: str) -> list:
+        """Function to get the priority and text of all descriptions of a given
+        individual, ordered by priority. The 'hasDescription' metadata of an
+        individual (see `getIndividual`) is the distinct text of descriptions
+        with a priority below the maximum description priority.
+        
+        Arguments:
+            individual_iri {str} -- Target individual IRI.
+        
+        Returns:
+            list -- List of (priority, text) tuples.
+        """
+
+        return [(result[0].toPython(), result[1].toPython()) for result in
+            self.__query(shape='getDescriptionPriorities',
+                         target_iri=individual_iri)]
 
     def getIndividual(self, individual: ThingClass,
                       descr_priority: int) -> dict:
@@ -135,27 +499,22 @@ class OntQuery():
         individual_iri: str = individual.get_iri()
 
         # Extracting all data properties for the given individual
-        dataprop_query = SPARQLQueries.getDataProperties(
-            target_iri=individual_iri
-        )
-        for result in self.graph.query(query_object=dataprop_query):
+        for result in self.__query(shape='getDataProperties',
+                                   target_iri=individual_iri):
             # Getting datatype name
             datatype_iri = result[0].toPython()
-            datatype_name = self.ont.search_one(iri=datatype_iri).python_name
+            datatype_name = self.__propertyName(property_iri=datatype_iri)
             # Getting Python object of value
             value = result[1].toPython()
             # Adding to output dictionary (append to array if multiple)
             output.setdefault(datatype_name, []).append(value)
 
         # Extracting all object properties for the given individual
-        objectprop_query = SPARQLQueries.getObjectProperties(
-            target_iri=individual_iri
-        )
-        for result in self.graph.query(query_object=objectprop_query):
+        for result in self.__query(shape='getObjectProperties',
+                                   target_iri=individual_iri):
             # Getting object property name
             objectprop_iri = result[0].toPython()
-            objectprop_name = self.ont.search_one(
-                iri=objectprop_iri).python_name
+            objectprop_name = self.__propertyName(property_iri=objectprop_iri)
             # Building list of nested object property chain
             objectprop_chain = [i.toPython() for i in result[1:]
                 if i is not None]
@@ -164,10 +523,8 @@ class OntQuery():
 
         # Extracting all individuals that indicated they were 'affiliatedWith'
         # the current individual
-        affiliated_query = SPARQLQueries.getAffiliated(
-            target_iri=individual_iri
-        )
-        for result in self.graph.query(query_object=affiliated_query):
+        for result in self.__query(shape='getAffiliated',
+                                   target_iri=individual_iri):
             # Creating dictionary to store formatted result
             affiliated_res = dict()
             # Isolating result IRI
@@ -175,17 +532,15 @@ class OntQuery():
             # Isolating result type
             affiliated_res['type'] = result[1].toPython()
             # Isolating result name
-            affiliated_res['hasName'] = self.ont.search_one(iri=affiliated_iri)\
-                .hasName
+            affiliated_res['hasName'] = self.__individualName(
+                individual_iri=affiliated_iri)
             # Appending to global output object
             output.setdefault('affiliated', []).append(affiliated_res)
 
         # Extracting all description text for the given individual
-        descr_query = SPARQLQueries.getOrderedDescriptionText(
-            target_iri=individual_iri,
-            max_priority=descr_priority
-        )
-        for descr_object in self.graph.query(query_object=descr_query):
+        for descr_object in self.__query(shape='getOrderedDescriptionText',
+                                         target_iri=individual_iri,
+                                         max_priority=descr_priority):
             descr_text = descr_object[0].toPython()
             # Appending to description list (ordered)
             output.setdefault('hasDescription', []).append(descr_text)
@@ -196,6 +551,86 @@ class OntQuery():
 
         return output
 
+    def __getIndividualsOfType(self, c_type: str, descr_priority: int) -> dict:
+        """Function to get metadata for all individuals of a given class, using
+        a fixed number of set-based queries. Query results are grouped by
+        individual, such that the metadata of each individual is identical to
+        the output of `getIndividual`.
+        
+        Arguments:
+            c_type {str} -- Target class type (i.e. 'Degree', 'Course', etc.).
+            descr_priority {int} -- Maximum description priority.
+        
+        Returns:
+            dict -- Dictionary of individual IRI -> metadata, for individuals
+                    with at least one metadata field.
+        """
+
+        # Output dictionary (individual IRI -> metadata)
+        output = dict()
+
+        def individualOutput(individual_iri: str) -> dict:
+            # Creating metadata dictionary when an individual is first seen
+            if individual_iri not in output:
+                output[individual_iri] = {
+                    '$id': self.ont.world[individual_iri].name}
+            return output[individual_iri]
+
+        # Extracting all data properties for all individuals
+        for result in self.__query(shape='getDataPropertiesOfType',
+                                   c_type=c_type):
+            # Getting datatype name
+            datatype_iri = result[1].toPython()
+            datatype_name = self.__propertyName(property_iri=datatype_iri)
+            # Adding to output dictionary (append to array if multiple)
+            individualOutput(individual_iri=result[0].toPython())\
+                .setdefault(datatype_name, []).append(result[2].toPython())
+
+        # Extracting all object properties for all individuals
+        for result in self.__query(shape='getObjectPropertiesOfType',
+                                   c_type=c_type):
+            # Getting object property name
+            objectprop_iri = result[1].toPython()
+            objectprop_name = self.__propertyName(property_iri=objectprop_iri)
+            # Building list of nested object property chain
+            objectprop_chain = [i.toPython() for i in result[2:]
+                if i is not None]
+            # Append object property chain to output object list
+            individualOutput(individual_iri=result[0].toPython())\
+                .setdefault(objectprop_name, []).append(objectprop_chain)
+
+        # Extracting all individuals that indicated they were 'affiliatedWith'
+        # each individual
+        for result in self.__query(shape='getAffiliatedOfType',
+                                   c_type=c_type):
+            # Creating dictionary to store formatted result
+            affiliated_res = dict()
+            # Isolating result IRI
+            affiliated_iri = result[1].toPython()
+            # Isolating result type
+            affiliated_res['type'] = result[2].toPython()
+            # Isolating result name
+            affiliated_res['hasName'] = self.__individualName(
+                individual_iri=affiliated_iri)
+            # Appending to output object
+            individualOutput(individual_iri=result[0].toPython())\
+                .setdefault('affiliated', []).append(affiliated_res)
+
+        # Extracting all description text for all individuals
+        # Note: results are ordered by priority across all individuals, which
+        #       preserves the order of descriptions for each individual
+        for result in self.__query(shape='getOrderedDescriptionTextOfType',
+                                   c_type=c_type,
+                                   max_priority=descr_priority):
+            # Appending to description list (ordered)
+            individualOutput(individual_iri=result[0].toPython())\
+                .setdefault('hasDescription', []).append(result[1].toPython())
+
+        logging.debug('Queried metadata for {0} individuals of class {1}'\
+            .format(len(output), c_type))
+
+        return output
+
     def getAll(self, order: str=None) -> dict:
         """Function to get the entire ontology, in a nested dictionary.
 
@@ -242,24 +677,83 @@ class TemplateOntQuery():
     represented class individuals (in the format output by `precis.OntQuery`).
     """
 
-    def __init__(self, ont: Ontology, graph: Graph):
+    def __init__(self, ont: Ontology, graph: Graph, namespace: str=None,
+                 stats: Stats=None, profiler: QueryProfiler=None):
         """TemplateOntQuery initialization method. Binds the target ontology, and
         RDFLib graph to class variables.
         
         Arguments:
             ont {Ontology} -- Ontology to be traversed.
             graph {Graph} -- RDFLib graph representation of the target ontology.
+
+        Keyword Arguments:
+            namespace {str} -- Namespace IRI of the overridden individuals
+                               (see `OntQuery`); individuals are searched for
+                               by ID if one is not provided (default: {None}).
+            stats {Stats} -- Stats object recording the time taken by override
+                             functions, and counting their queries, result
+                             rows and ontology searches (default: {None}).
+            profiler {QueryProfiler} -- Query profiler, profiling the queries
+                                        run by override functions
+                                        (default: {None}).
         """
 
+        # Loading the Precis ontology (if not loaded already)
+        bootstrap.initialize()
+
         # Override function map
         # (also acts as registry of these functions)
         self.override_functions = {
             'Project': self.overrideProject
         }
 
+        # Classes looked up by override functions, other than through the
+        # relations of the overridden individuals (eg: awards affiliated with
+        # organizations a project is related to)
+        self.override_dependencies = {
+            'Project': ['Award']
+        }
+
         # Assigning instance variables
         self.graph = graph
         self.ont = ont
+        self.namespace = namespace
+        self.stats = stats
+        self.profiler = profiler
+
+    @staticmethod
+    def prepareQueries():
+        """Function to prepare the SPARQL queries run by override functions
+        ahead of time (prepared queries are cached; see `SPARQLQueries`), such
+        that the first override is not slowed down by query preparation.
+        """
+
+        # Queries are prepared with placeholder parameters, so any IRI will do
+        SPARQLQueries.getRelatedNameOfType(target_iri=config.ont_base_iri,
+                                           c_type='Skill')
+        SPARQLQueries.getAwards(target_iri=config.ont_base_iri)
+
+    def __query(self, shape: str, **parameters):
+        """Function to run a query from the SPARQLQueries module over the
+        RDFLib graph.
+
+        Arguments:
+            shape {str} -- Query shape (i.e. name of the query getter).
+            **parameters -- Query parameter values.
+
+        Returns:
+            Iterable -- Query result rows.
+        """
+
+        if self.stats or self.profiler:
+            return instrumentedQuery(shape=shape, parameters=parameters,
+                                     backend='rdflib', graph=self.graph,
+                                     native_query=None, stats=self.stats,
+                                     profiler=self.profiler)
+
+        query, bindings = getattr(SPARQLQueries, shape)(**parameters)
+
+        return self.graph.query(query_object=query, initBindings=bindings)
 
     def overrideExists(self, c_type: str) -> bool:
         """Flag to check if an override function exists for a given
@@ -274,6 +768,20 @@ class TemplateOntQuery():
 
         return c_type in self.override_functions.keys()
 
+    def getOverrideDependencies(self, c_type: str) -> set:
+        """Function to get the classes looked up by the override function for
+        a given ontology class, other than through the relations of the
+        overridden individuals.
+
+        Arguments:
+            c_type {str} -- Target class type.
+
+        Returns:
+            set -- Names of the classes (empty if no override function exists).
+        """
+
+        return set(self.override_dependencies.get(c_type, []))
+
     def overrideByClass(self, c_type: list, class_invds: list) -> list:
         """Function to run the registry override function over a list of JSON
         represented class individuals, given the list of individuals and the
@@ -300,10 +808,11 @@ class TemplateOntQuery():
             logging.error(message)
             raise KeyError(message)
 
-        return self.override_functions[c_type](
-            c_type=c_type,
-            class_invds=class_invds
-        )
+        with stage(self.stats, 'override', c_type=c_type):
+            return self.override_functions[c_type](
+                c_type=c_type,
+                class_invds=class_invds
+            )
 
     def overrideProject(self, c_type: list, class_invds: list) -> list:
         """Override function for the Project class.
@@ -327,27 +836,26 @@ class TemplateOntQuery():
         # Iterating through each project; getting names of 'relatedTo' skills
         for proj in class_invds:
             # Isolating IRI of the current individual (not stored in JSON)
-            target_iri = self.ont.search_one(iri=''.join(
-                ['*', proj['$id']])).iri
-
-            # Building query for the object
-            proj_query = SPARQLQueries.getRelatedNameOfType(
-                target_iri=target_iri,
-                c_type='Skill'
-            )
+            if self.namespace:
+                target_iri = self.namespace + proj['$id']
+            else:
+                target_iri = self.ont.search_one(iri=''.join(
+                    ['*', proj['$id']])).iri
+                if self.stats:
+                    self.stats.count('searches')
 
             # Running related named skill entity query
-            name_objects = self.graph.query(query_object=proj_query)
+            name_objects = self.__query(shape='getRelatedNameOfType',
+                                        target_iri=target_iri,
+                                        c_type='Skill')
 
             # Extracting related skill names and sorting alphabetically
             proj['relatedSkills'] = sorted([result[0].toPython()
                 for result in name_objects])
 
-            # Building awards query
-            awards_query = SPARQLQueries.getAwards(target_iri=target_iri)
-
             # Running awards query
-            awards_objects = self.graph.query(query_object=awards_query)
+            awards_objects = self.__query(shape='getAwards',
+                                          target_iri=target_iri)
 
             # Building dictionary of key-value pairs from org -> award
             proj['awards'] = [
@@ -359,3 +867,49 @@ class TemplateOntQuery():
 
         # Returning full list (modified)
         return class_invds
+
+
+def instrumentedQuery(shape: str, parameters: dict, backend: str, graph: Graph,
+                      native_query: NativeQuery, stats: Stats,
+                      profiler: QueryProfiler) -> list:
+    """Function to run a query from the SPARQLQueries module (or its native
+    equivalent), recording the time taken to prepare it and to evaluate it
+    (including iterating over its results) with a Stats object and a query
+    profiler (either may be `None`).
+
+    Arguments:
+        shape {str} -- Query shape (i.e. name of the query getter).
+        parameters {dict} -- Query parameter values.
+        backend {str} -- Query backend ('rdflib' or 'native').
+        graph {Graph} -- RDFLib graph (rdflib backend).
+        native_query {NativeQuery} -- Native query agent (native backend).
+        stats {Stats} -- Stats object.
+        profiler {QueryProfiler} -- Query profiler.
+
+    Returns:
+        list -- Query result rows.
+    """
+
+    query = None
+    with stage(stats, 'query', shape=shape, backend=backend):
+        t = time.perf_counter()
+        if backend == 'native':
+            parse_time = 0.0
+            rows = list(getattr(native_query, shape)(**parameters))
+        else:
+            with stage(stats, 'prepare', shape=shape):
+                query, bindings = getattr(SPARQLQueries, shape)(**parameters)
+            parse_time = time.perf_counter() - t
+            rows = list(graph.query(query_object=query,
+                                    initBindings=bindings))
+        eval_time = time.perf_counter() - t - parse_time
+
+    if stats:
+        stats.count('queries')
+        stats.count('rows', n=len(rows))
+    if profiler:
+        profiler.record(shape=shape, backend=backend, parse_time=parse_time,
+                        eval_time=eval_time, rows=len(rows),
+                        parameters=parameters, query=query)
+
+    return rows
@@ -0,0 +1,165 @@
+from ..cfg import config
+
+from io import StringIO
+from rdflib.plugins.sparql.parserutils import CompValue
+from rdflib.plugins.sparql.sparql import Query
+import json
+import logging
+
+
+class QueryProfiler():
+    """This module profiles the queries run by `OntQuery` and
+    `TemplateOntQuery` (see their `profiler` keyword argument).
+
+    The time taken to prepare (i.e. parse and translate to algebra, when the
+    prepared query is not cached; see `SPARQLQueries`) and to evaluate each
+    query, including iterating over its results, and the number of result rows
+    are recorded for each query shape (i.e. name of the query getter). Queries
+    slower than a threshold are logged (as warnings) with their parameters,
+    and kept in the slow query log. Optionally, the RDFLib algebra tree of each
+    prepared query shape is also kept, to find pathological query plans.
+    """
+
+    def __init__(self, slow_threshold: float=None, dump_algebra: bool=False):
+        """QueryProfiler initialization method.
+
+        Keyword Arguments:
+            slow_threshold {float} -- Time (in seconds) above which a query is
+                                      logged as slow. The configured slow
+                                      query threshold is used if one is not
+                                      provided (default: {None}).
+            dump_algebra {bool} -- Flag to keep the algebra tree of each query
+                                   shape (default: {False}).
+        """
+
+        if slow_threshold is None:
+            slow_threshold = config.slow_query_threshold
+
+        self.slow_threshold = slow_threshold
+        self.dump_algebra = dump_algebra
+
+        # (Shape, backend) -> aggregate timings and rows, slow queries, and
+        # shape -> algebra tree
+        self.shapes = dict()
+        self.slow_queries = list()
+        self.algebra = dict()
+
+    def record(self, shape: str, backend: str, parse_time: float,
+               eval_time: float, rows: int, parameters: dict,
+               query: Query=None):
+        """Function to record a query.
+
+        Arguments:
+            shape {str} -- Query shape (i.e. name of the query getter).
+            backend {str} -- Query backend ('rdflib' or 'native').
+            parse_time {float} -- Time taken to prepare the query (seconds).
+            eval_time {float} -- Time taken to evaluate the query, and iterate
+                                 over its results (seconds).
+            rows {int} -- Number of result rows.
+            parameters {dict} -- Query parameter values.
+
+        Keyword Arguments:
+            query {Query} -- Prepared query (rdflib backend) (default: {None}).
+        """
+
+        elapsed = parse_time + eval_time
+
+        profile = self.shapes.setdefault((shape, backend), {
+            'shape': shape, 'backend': backend, 'calls': 0, 'rows': 0,
+            'parse_seconds': 0.0, 'eval_seconds': 0.0, 'max_seconds': 0.0})
+        profile['calls'] += 1
+        profile['rows'] += rows
+        profile['parse_seconds'] += parse_time
+        profile['eval_seconds'] += eval_time
+        profile['max_seconds'] = max(profile['max_seconds'], elapsed)
+
+        if self.dump_algebra and (query is not None) and \
+            (shape not in self.algebra):
+            self.algebra[shape] = self.algebraTree(query=query)
+
+        if elapsed < self.slow_threshold:
+            return
+
+        self.slow_queries.append({
+            'shape': shape, 'backend': backend,
+            'parse_seconds': parse_time, 'eval_seconds': eval_time,
+            'rows': rows,
+            'parameters': {k: str(v) for k, v in parameters.items()}
+        })
+
+        logging.warning('Slow query {0} ({1}): {2:.4f}s ({3:.4f}s parsing),'
+            ' {4} rows, parameters {5}'.format(shape, backend, elapsed,
+                                               parse_time, rows, parameters))
+
+    @staticmethod
+    def algebraTree(query: Query) -> str:
+        """Function to get the RDFLib algebra tree of a prepared query, as
+        text (in the format of `rdflib.plugins.sparql.algebra.pprintAlgebra`,
+        which prints to stdout).
+
+        Arguments:
+            query {Query} -- Prepared query.
+
+        Returns:
+            str -- Algebra tree.
+        """
+
+        output = StringIO()
+
+        def walk(node, indent: str='    '):
+            # Writing a node of the algebra tree, and its children
+            if not isinstance(node, CompValue):
+                print(node, file=output)
+                return
+            print('{0}('.format(node.name), file=output)
+            for key in node:
+                print('{0}{1} ='.format(indent, key), end=' ', file=output)
+                walk(node[key], indent=indent + '    ')
+            print('{0})'.format(indent), file=output)
+
+        walk(query.algebra)
+
+        return output.getvalue()
+
+    def getProfile(self) -> list:
+        """Function to get the aggregate profile of each query shape, slowest
+        (by total time) first.
+
+        Returns:
+            list -- Profiles, with shape, backend, calls, rows, parse_seconds,
+                    eval_seconds and max_seconds keys.
+        """
+
+        profiles = [dict(i) for i in self.shapes.values()]
+
+        return sorted(profiles, key=lambda i: i['parse_seconds'] +
+                      i['eval_seconds'], reverse=True)
+
+    def getSlowQueries(self) -> list:
+        """Function to get the slow query log, in the order the queries were
+        run.
+
+        Returns:
+            list -- Slow queries, with shape, backend, parse_seconds,
+                    eval_seconds, rows and parameters keys.
+        """
+
+        return [dict(i) for i in self.slow_queries]
+
+    def saveReport(self, file_path: str):
+        """Function to save the query profile, the slow query log and the
+        algebra trees (if kept) to a JSON file.
+
+        Arguments:
+            file_path {str} -- Path to the JSON file.
+        """
+
+        report = {
+            'slow_threshold': self.slow_threshold,
+            'shapes': self.getProfile(),
+            'slow_queries': self.getSlowQueries(),
+            'algebra': dict(self.algebra)
+        }
+
+        with open(file_path, 'w') as f:
+            json.dump(report, f, indent=2)
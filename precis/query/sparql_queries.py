@@ -1,14 +1,21 @@
 from ..cfg import config
 
-from rdflib import Namespace, OWL
+from rdflib import Literal, Namespace, OWL, URIRef, Variable
 from rdflib.plugins.sparql import prepareQuery
+from rdflib.plugins.sparql.algebra import traverse
 from rdflib.plugins.sparql.sparql import Query
+from typing import Tuple
 import logging
 
 class SPARQLQueries():
     """This class contains getters for SPARQL queries used to extract
     information from the Precis ontology. Note that method of this class
     only returns pre-formed queries, and does not actually execute them.
+
+    Each query shape is prepared once, and cached at the class level. Getters
+    return the prepared query with the initial bindings of its parameters
+    (i.e. `target_iri`, `c_type` and `max_priority`), to be passed to
+    `Graph.query` as `initBindings`.
     """
 
     # Class variable to store namespace
@@ -17,30 +24,149 @@ class SPARQLQueries():
         'owl': OWL
     }
 
+    # Prepared query cache (query shape -> prepared query), and cache statistics
+    __preparedQueries = dict()
+    __cacheStats = {'hits': 0, 'misses': 0}
+
+    # Placeholder IRI prefix for parameters bound to IRIs (see `__prepare`)
+    __placeholderIRI = 'urn:precis:parameter:'
+
+    # Graph pattern resolving the name of an object property target `?o`, and
+    # its second-level labels (see `getObjectProperties`)
+    objectLabelPattern = """
+                    {
+                        {
+                            ?o precis:hasName ?name .
+                        }
+                        OPTIONAL
+                        {
+                            {
+                                ?o precis:employedAt ?org .
+                                ?org precis:hasName ?orgname .
+                            }
+                            UNION
+                            {
+                                ?o precis:degreeUniversity ?org .
+                                ?org precis:hasName ?orgname .
+                            }
+                            UNION
+                            {
+                                {
+                                    ?o precis:hasParentOrganization ?org .
+                                    ?org precis:hasName ?orgname .
+                                }
+                                OPTIONAL
+                                {
+                                    ?org precis:hasParentOrganization ?parentOrg .
+                                    ?parentOrg precis:hasName ?parentOrgName .
+                                }
+                            }
+                        }
+                    }
+"""
+
+    @classmethod
+    def __prepare(self, shape: str, query: str,
+                  **parameters) -> Tuple[Query, dict]:
+        """Function to get a prepared query for a given query shape (from the
+        cache, if it has been prepared before), and the initial bindings for
+        the given parameter values.
+
+        The query is prepared with placeholder IRIs in place of the `target_iri`
+        and `c_type` parameters, which are then replaced with variables in the
+        query algebra. This ensures that triple patterns are evaluated in the
+        same order as when the parameter values are part of the query text, as
+        RDFLib orders triple patterns by their number of unbound terms.
+        
+        Arguments:
+            shape {str} -- Query shape (i.e. name of the query getter).
+            query {str} -- Query text, with `{target_iri}`, `{c_type}` and
+                           `{object_label_pattern}` placeholders.
+            **parameters -- Query parameter values.
+        
+        Returns:
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
+        """
+
+        # Building initial bindings for query parameters
+        bindings = dict()
+        for parameter, value in parameters.items():
+            if parameter == 'target_iri':
+                bindings[parameter] = URIRef(value)
+            elif parameter == 'c_type':
+                bindings[parameter] = URIRef(config.ont_base_iri + value)
+            else:
+                bindings[parameter] = Literal(value)
+
+        # Returning cached query, if available
+        if shape in self.__preparedQueries:
+            self.__cacheStats['hits'] += 1
+            return self.__preparedQueries[shape], bindings
+
+        logging.debug('Preparing query shape {0}'.format(shape))
+        self.__cacheStats['misses'] += 1
+
+        # Placeholder IRI -> variable map for parameters bound to IRIs
+        placeholders = {URIRef(self.__placeholderIRI + i): Variable(i)
+            for i in ['target_iri', 'c_type']}
+
+        prepared_query = prepareQuery(query.format(
+                target_iri='<{0}target_iri>'.format(self.__placeholderIRI),
+                c_type='<{0}c_type>'.format(self.__placeholderIRI),
+                object_label_pattern=self.objectLabelPattern),
+            initNs=self.initN)
+
+        # Replacing placeholder IRIs with variables in the query algebra
+        prepared_query.algebra = traverse(prepared_query.algebra,
+            visitPost=lambda node: placeholders.get(node)
+                if isinstance(node, URIRef) else None)
+
+        self.__preparedQueries[shape] = prepared_query
+
+        return prepared_query, bindings
+
+    @classmethod
+    def cacheInfo(self) -> dict:
+        """Function to get prepared query cache statistics.
+        
+        Returns:
+            dict -- Number of cache hits, misses, and cached query shapes.
+        """
+
+        return dict(self.__cacheStats, size=len(self.__preparedQueries))
+
     @classmethod
-    def getAllOfType(self, c_type: str) -> Query:
+    def clearCache(self):
+        """Function to clear the prepared query cache, and reset its statistics.
+        """
+
+        self.__preparedQueries.clear()
+        self.__cacheStats.update(hits=0, misses=0)
+
+    @classmethod
+    def getAllOfType(self, c_type: str) -> Tuple[Query, dict]:
         """Function to get all instances of a given type from the ontology.
         
         Arguments:
             c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug("""Preparing query to extract instances of type {0}"""
             .format(c_type))
 
-        return prepareQuery("""
+        return self.__prepare(shape='getAllOfType', query="""
             SELECT DISTINCT ?s
             WHERE {{
-                ?s rdf:type precis:{c_type} .
+                ?s rdf:type {c_type} .
             }}
-            """.format(c_type=c_type),
-            initNs=self.initN)
+            """,
+            c_type=c_type)
 
     @classmethod
-    def getAllOfTypeAscendingTemporal(self, c_type: str) -> Query:
+    def getAllOfTypeAscendingTemporal(self, c_type: str) -> Tuple[Query, dict]:
         """Function to get all instances of a given type in ascending temporal
         order (based on `hasDate` property).
         
@@ -48,17 +174,17 @@ class SPARQLQueries():
             c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug('Preparing query to extract instances of type {0} in\
             ascending temporal order'.format(c_type))
 
-        return prepareQuery("""
+        return self.__prepare(shape='getAllOfTypeAscendingTemporal', query="""
             SELECT DISTINCT ?s
             WHERE {{
                 {{
-                    ?s rdf:type precis:{c_type} .
+                    ?s rdf:type {c_type} .
                 }}
                 OPTIONAL
                 {{
@@ -66,11 +192,11 @@ class SPARQLQueries():
                 }}
             }}
             ORDER BY ?date
-            """.format(c_type=c_type),
-            initNs=self.initN)
+            """,
+            c_type=c_type)
     
     @classmethod
-    def getAllOfTypeDescendingTemporal(self, c_type: str) -> Query:
+    def getAllOfTypeDescendingTemporal(self, c_type: str) -> Tuple[Query, dict]:
         """Function to get all instances of a given type in descending temporal
         order (based on `hasDate` property).
         
@@ -78,17 +204,17 @@ class SPARQLQueries():
             c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug('Preparing query to extract instances of type {0} in\
             descending temporal order'.format(c_type))
 
-        return prepareQuery("""
+        return self.__prepare(shape='getAllOfTypeDescendingTemporal', query="""
             SELECT DISTINCT ?s
             WHERE {{
                 {{
-                    ?s rdf:type precis:{c_type} .
+                    ?s rdf:type {c_type} .
                 }}
                 OPTIONAL
                 {{
@@ -96,11 +222,11 @@ class SPARQLQueries():
                 }}
             }}
             ORDER BY DESC(?date)
-            """.format(c_type=c_type),
-            initNs=self.initN)
+            """,
+            c_type=c_type)
 
     @classmethod
-    def getAllOfTypeAlphabeticalAsc(self, c_type: str) -> Query:
+    def getAllOfTypeAlphabeticalAsc(self, c_type: str) -> Tuple[Query, dict]:
         """Function to get all instances of a given type in ascending
         alphabetical order (based on `hasName` property).
         
@@ -108,24 +234,24 @@ class SPARQLQueries():
             c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug('Preparing query to extract instances of type {0} in\
             ascending alphabetical order'.format(c_type))
         
-        return prepareQuery("""
+        return self.__prepare(shape='getAllOfTypeAlphabeticalAsc', query="""
             SELECT DISTINCT ?s
             WHERE {{
-                ?s rdf:type precis:{c_type} .
+                ?s rdf:type {c_type} .
                 ?s precis:hasName ?name .
             }}
             ORDER BY ASC(UCASE(STR(?name)))
-            """.format(c_type=c_type),
-            initNs=self.initN)
+            """,
+            c_type=c_type)
 
     @classmethod
-    def getAllOfTypeAlphabeticalDesc(self, c_type: str) -> Query:
+    def getAllOfTypeAlphabeticalDesc(self, c_type: str) -> Tuple[Query, dict]:
         """Function to get all instances of a given type in descending
         alphabetical order (based on `hasName` property).
         
@@ -133,24 +259,24 @@ class SPARQLQueries():
             c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug('Preparing query to extract instances of type {0} in\
             descending alphabetical order'.format(c_type))
         
-        return prepareQuery("""
+        return self.__prepare(shape='getAllOfTypeAlphabeticalDesc', query="""
             SELECT DISTINCT ?s
             WHERE {{
-                ?s rdf:type precis:{c_type} .
+                ?s rdf:type {c_type} .
                 ?s precis:hasName ?name .
             }}
             ORDER BY DESC(UCASE(STR(?name)))
-            """.format(c_type=c_type),
-            initNs=self.initN)
+            """,
+            c_type=c_type)
 
     @classmethod
-    def getDataProperties(self, target_iri: str) -> Query:
+    def getDataProperties(self, target_iri: str) -> Tuple[Query, dict]:
         """SPARQL query to return the data properties of a given instance,
         given its IRI.
         
@@ -158,20 +284,20 @@ class SPARQLQueries():
             target_iri {str} -- Target instance IRI.
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
-        return prepareQuery("""
+        return self.__prepare(shape='getDataProperties', query="""
                 SELECT DISTINCT ?p ?o
                 WHERE {{
-                    <{target_iri}> ?p ?o .
+                    {target_iri} ?p ?o .
                     ?p rdf:type owl:DatatypeProperty .
                 }}
-            """.format(target_iri=target_iri),
-            initNs=self.initN)
+            """,
+            target_iri=target_iri)
 
     @classmethod
-    def getObjectProperties(self, target_iri: str) -> Query:
+    def getObjectProperties(self, target_iri: str) -> Tuple[Query, dict]:
         """SPARQL query to return the object properties of a given instance,
         given its IRI.
 
@@ -190,53 +316,26 @@ class SPARQLQueries():
             target_iri {str} -- Target instance IRI.
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug('Preparing query to get object properties for {0}'.format(
             target_iri))
 
-        return prepareQuery("""
+        return self.__prepare(shape='getObjectProperties', query="""
                 SELECT DISTINCT ?p ?name ?orgname ?parentOrgName
                 WHERE {{
-                    <{target_iri}> ?p ?o .
+                    {target_iri} ?p ?o .
                     ?p rdf:type owl:ObjectProperty .
-                    {{
-                        {{
-                            ?o precis:hasName ?name .
-                        }}
-                        OPTIONAL
-                        {{
-                            {{
-                                ?o precis:employedAt ?org .
-                                ?org precis:hasName ?orgname .
-                            }}
-                            UNION
-                            {{
-                                ?o precis:degreeUniversity ?org .
-                                ?org precis:hasName ?orgname .
-                            }}
-                            UNION
-                            {{
-                                {{
-                                    ?o precis:hasParentOrganization ?org .
-                                    ?org precis:hasName ?orgname .
-                                }}
-                                OPTIONAL
-                                {{
-                                    ?org precis:hasParentOrganization ?parentOrg .
-                                    ?parentOrg precis:hasName ?parentOrgName .
-                                }}
-                            }}
-                        }}
-                    }}
+                    {object_label_pattern}
                 }}
-            """.format(target_iri=target_iri),
-            initNs=self.initN)
+            """,
+            target_iri=target_iri)
 
     @classmethod
     def getOrderedDescriptionText(self, target_iri: str,
-                                  max_priority: int=int(1e10)) -> Query:
+                                  max_priority: int=int(1e10)
+                                  ) -> Tuple[Query, dict]:
         """SPARQL query to get description text for a given instance IRI, as
         ordered by the 'hasPriority' attribute (in ascending order, so priority
         0 > 1 > 2 > ...).
@@ -249,26 +348,53 @@ class SPARQLQueries():
                                   (default: {int(1e10)}).
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug('Preparing description query for individual {0}'.format(
             target_iri))
 
-        return prepareQuery("""
+        return self.__prepare(shape='getOrderedDescriptionText', query="""
                 SELECT DISTINCT ?text
                 WHERE {{
-                    <{target_iri}> precis:hasDescription ?descr .
+                    {target_iri} precis:hasDescription ?descr .
                     ?descr precis:hasPriority ?priority .
-                    FILTER (?priority < {max_priority}) .
+                    FILTER (?priority < ?max_priority) .
                     ?descr precis:hasText ?text .
                 }}
                 ORDER BY ?priority
-            """.format(target_iri=target_iri, max_priority=max_priority),
-            initNs=self.initN)
+            """,
+            target_iri=target_iri, max_priority=max_priority)
 
     @classmethod
-    def getAffiliated(self, target_iri: str) -> Query:
+    def getDescriptionPriorities(self, target_iri: str) -> Tuple[Query, dict]:
+        """SPARQL query to get the priority and text of all descriptions of a
+        given instance IRI, ordered by the 'hasPriority' attribute (i.e. the
+        unfiltered equivalent of `getOrderedDescriptionText`).
+        
+        Arguments:
+            target_iri {str} -- Target instance IRI.
+        
+        Returns:
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
+        """
+
+        logging.debug('Preparing description priority query for individual\
+            {0}'.format(target_iri))
+
+        return self.__prepare(shape='getDescriptionPriorities', query="""
+                SELECT ?priority ?text
+                WHERE {{
+                    {target_iri} precis:hasDescription ?descr .
+                    ?descr precis:hasPriority ?priority .
+                    ?descr precis:hasText ?text .
+                }}
+                ORDER BY ?priority
+            """,
+            target_iri=target_iri)
+
+    @classmethod
+    def getAffiliated(self, target_iri: str) -> Tuple[Query, dict]:
         """SPARQL query to get instances that have listed the current
         `target_iri` as an `affiliatedWith` instance.
         
@@ -276,24 +402,25 @@ class SPARQLQueries():
             target_iri {str} -- Target instance IRI.
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug('Preparing affiliated with query for individual {0}'.\
             format(target_iri))
 
-        return prepareQuery("""
+        return self.__prepare(shape='getAffiliated', query="""
             SELECT DISTINCT ?related ?label
             WHERE {{
-                ?related precis:affiliatedWith <{target_iri}> .
+                ?related precis:affiliatedWith {target_iri} .
                 ?related rdf:type ?type .
                 ?type rdfs:label ?label .
             }}
-            """.format(target_iri=target_iri),
-            initNs=self.initN)
+            """,
+            target_iri=target_iri)
 
     @classmethod
-    def getRelatedNameOfType(self, target_iri: str, c_type: str) -> Query:
+    def getRelatedNameOfType(self, target_iri: str,
+                             c_type: str) -> Tuple[Query, dict]:
         """SPARQL query to get the name of 'relatedTo` entities of a specific
         type, given a `target_iri`, and `c_type`.
         
@@ -302,24 +429,24 @@ class SPARQLQueries():
             c_type {str} -- Target type (eg: 'Skill', 'WorkExperience', etc.)
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug('Preparing related name query for individual {0} with\
             type {1}'.format(target_iri, c_type))
         
-        return prepareQuery("""
+        return self.__prepare(shape='getRelatedNameOfType', query="""
             SELECT ?name
             WHERE {{
-                <{target_iri}> precis:relatedTo ?targets .
-                ?targets rdf:type precis:{c_type} .
+                {target_iri} precis:relatedTo ?targets .
+                ?targets rdf:type {c_type} .
                 ?targets precis:hasName ?name .
             }}
-            """.format(target_iri=target_iri, c_type=c_type),
-            initNs=self.initN)
+            """,
+            target_iri=target_iri, c_type=c_type)
 
     @classmethod
-    def getAwards(self, target_iri: str) -> Query:
+    def getAwards(self, target_iri: str) -> Tuple[Query, dict]:
         """SPARQL query to get the name and affiliated organizations issuing
         awards from given a `target_iri` 'relatedTo' entities.
         
@@ -327,20 +454,134 @@ class SPARQLQueries():
             target_iri {str} -- Target instance IRI.
         
         Returns:
-            Query -- Prepared query.
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
         """
 
         logging.debug('Preparing awards query for individual {0}'.\
             format(target_iri))
 
-        return prepareQuery("""
+        return self.__prepare(shape='getAwards', query="""
             SELECT ?award_name ?org_name
             WHERE {{
-                <{target_iri}> precis:relatedTo ?org .
+                {target_iri} precis:relatedTo ?org .
                 ?org precis:hasName ?org_name .
                 ?award precis:affiliatedWith ?org .
                 ?award rdf:type precis:Award .
                 ?award precis:hasName ?award_name .
             }}
-        """.format(target_iri=target_iri),
-        initNs=self.initN)
+        """,
+            target_iri=target_iri)
+
+    @classmethod
+    def getDataPropertiesOfType(self, c_type: str) -> Tuple[Query, dict]:
+        """SPARQL query to return the data properties of all instances of a
+        given type (batched equivalent of `getDataProperties`).
+        
+        Arguments:
+            c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
+        
+        Returns:
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
+        """
+
+        logging.debug('Preparing query to get data properties for instances\
+            of type {0}'.format(c_type))
+
+        return self.__prepare(shape='getDataPropertiesOfType', query="""
+                SELECT DISTINCT ?s ?p ?o
+                WHERE {{
+                    ?s rdf:type {c_type} .
+                    ?s ?p ?o .
+                    ?p rdf:type owl:DatatypeProperty .
+                }}
+            """,
+            c_type=c_type)
+
+    @classmethod
+    def getObjectPropertiesOfType(self, c_type: str) -> Tuple[Query, dict]:
+        """SPARQL query to return the object properties of all instances of a
+        given type, with second-level labels (batched equivalent of
+        `getObjectProperties`).
+        
+        Arguments:
+            c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
+        
+        Returns:
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
+        """
+
+        logging.debug('Preparing query to get object properties for instances\
+            of type {0}'.format(c_type))
+
+        return self.__prepare(shape='getObjectPropertiesOfType', query="""
+                SELECT DISTINCT ?s ?p ?name ?orgname ?parentOrgName
+                WHERE {{
+                    ?s rdf:type {c_type} .
+                    ?s ?p ?o .
+                    ?p rdf:type owl:ObjectProperty .
+                    {object_label_pattern}
+                }}
+            """,
+            c_type=c_type)
+
+    @classmethod
+    def getOrderedDescriptionTextOfType(self, c_type: str,
+                                        max_priority: int=int(1e10)
+                                        ) -> Tuple[Query, dict]:
+        """SPARQL query to get description text for all instances of a given
+        type, ordered by the 'hasPriority' attribute (batched equivalent of
+        `getOrderedDescriptionText`).
+        
+        Arguments:
+            c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
+
+        Keyword Arguments:
+            max_priority {int} -- Maximum description priority
+                                  (default: {int(1e10)}).
+        
+        Returns:
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
+        """
+
+        logging.debug('Preparing description query for instances of type {0}'\
+            .format(c_type))
+
+        return self.__prepare(shape='getOrderedDescriptionTextOfType', query="""
+                SELECT DISTINCT ?s ?text
+                WHERE {{
+                    ?s rdf:type {c_type} .
+                    ?s precis:hasDescription ?descr .
+                    ?descr precis:hasPriority ?priority .
+                    FILTER (?priority < ?max_priority) .
+                    ?descr precis:hasText ?text .
+                }}
+                ORDER BY ?priority
+            """,
+            c_type=c_type, max_priority=max_priority)
+
+    @classmethod
+    def getAffiliatedOfType(self, c_type: str) -> Tuple[Query, dict]:
+        """SPARQL query to get instances that have listed an instance of a given
+        type as an `affiliatedWith` instance (batched equivalent of
+        `getAffiliated`).
+        
+        Arguments:
+            c_type {str} -- Target type (eg: 'Degree', 'WorkExperience', etc.).
+        
+        Returns:
+            Tuple[Query, dict] -- Prepared query, and its initial bindings.
+        """
+
+        logging.debug('Preparing affiliated with query for instances of type\
+            {0}'.format(c_type))
+
+        return self.__prepare(shape='getAffiliatedOfType', query="""
+            SELECT DISTINCT ?target ?related ?label
+            WHERE {{
+                ?target rdf:type {c_type} .
+                ?related precis:affiliatedWith ?target .
+                ?related rdf:type ?type .
+                ?type rdfs:label ?label .
+            }}
+            """,
+            c_type=c_type)
@@ -0,0 +1,223 @@
+from contextlib import contextmanager, nullcontext
+import json
+import os
+import threading
+import time
+
+
+class Stats():
+    """This module records opt-in instrumentation of the load, query and render
+    pipeline; that is, the wall time of each stage (in total, and for each
+    ontology class), and counters (eg: SPARQL queries, query result rows,
+    owlready2 searches, and individuals created).
+
+    A Stats object is attached to a `Loader`, `OntQuery`, `TemplateOntQuery`
+    or `TemplateDriver` with their `stats` keyword argument, and may be shared
+    by all of them to instrument a complete render. Instrumentation is disabled
+    unless a Stats object is supplied; stages are then timed with a shared
+    no-op context manager (see `stage`), and counters are not updated.
+
+    Stage timings are inclusive (i.e. nested stages are also counted in the
+    enclosing stage). Counts made within a stage attributed to an ontology
+    class (in the same thread) are also attributed to that class. Recorded
+    stages can be exported as JSON (see `toDict`), or as a Chrome trace file
+    (see `saveChromeTrace`), which can be opened in chrome://tracing or
+    Perfetto.
+    """
+
+    def __init__(self):
+        """Stats initialization method. Initializes empty timings, counters
+        and stage events.
+        """
+
+        # Stage name -> {calls, seconds}, and class -> stage name -> seconds
+        self.stage_timings = dict()
+        self.class_timings = dict()
+
+        # Counter name -> value, and class -> counter name -> value
+        self.counters = dict()
+        self.class_counters = dict()
+
+        # Recorded stages (name, class, start, duration, thread ID, arguments)
+        self.events = list()
+
+        # Start of recording (event start times are relative to this), and lock
+        # (a Stats object may be shared by several threads)
+        self.origin = time.perf_counter()
+        self.lock = threading.Lock()
+
+        # Ontology class of the innermost class stage, in each thread
+        self.local = threading.local()
+
+    @contextmanager
+    def stage(self, name: str, c_type: str=None, **args):
+        """Context manager to time a stage.
+
+        Arguments:
+            name {str} -- Stage name (eg: 'parse' or 'render').
+
+        Keyword Arguments:
+            c_type {str} -- Ontology class the stage is attributed to
+                            (default: {None}).
+            **args -- Additional stage arguments (recorded in the trace).
+        """
+
+        outer_c_type = getattr(self.local, 'c_type', None)
+        if c_type:
+            self.local.c_type = c_type
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.local.c_type = outer_c_type
+            with self.lock:
+                timing = self.stage_timings.setdefault(name, {'calls': 0,
+                                                              'seconds': 0.0})
+                timing['calls'] += 1
+                timing['seconds'] += elapsed
+                if c_type:
+                    class_timings = self.class_timings.setdefault(c_type,
+                                                                  dict())
+                    class_timings[name] = class_timings.get(name, 0.0) + \
+                        elapsed
+                self.events.append((name, c_type, start - self.origin,
+                                    elapsed, threading.get_ident(), args))
+
+    def count(self, counter: str, n: int=1, c_type: str=None):
+        """Function to increment a counter.
+
+        Arguments:
+            counter {str} -- Counter name (eg: 'queries').
+
+        Keyword Arguments:
+            n {int} -- Increment (default: {1}).
+            c_type {str} -- Ontology class the count is attributed to; the
+                            class of the enclosing class stage is used if
+                            one is not provided (default: {None}).
+        """
+
+        c_type = c_type or getattr(self.local, 'c_type', None)
+        with self.lock:
+            self.counters[counter] = self.counters.get(counter, 0) + n
+            if c_type:
+                class_counters = self.class_counters.setdefault(c_type, dict())
+                class_counters[counter] = class_counters.get(counter, 0) + n
+
+    def getStageTimings(self) -> dict:
+        """Function to get the number of calls of, and the total time taken by
+        each stage.
+
+        Returns:
+            dict -- Dictionary of the form {stage: {calls, seconds}}.
+        """
+
+        return {name: dict(timing) for name, timing in
+                self.stage_timings.items()}
+
+    def getCounters(self) -> dict:
+        """Function to get the value of each counter.
+
+        Returns:
+            dict -- Dictionary of the form {counter: value}.
+        """
+
+        return dict(self.counters)
+
+    def toDict(self) -> dict:
+        """Function to get the recorded timings and counters, in total and for
+        each ontology class (JSON-serializable).
+
+        Returns:
+            dict -- Dictionary with 'stages', 'counters', 'classes' (of the
+                    form {class: {stages, counters}}) and 'wall_time' keys.
+        """
+
+        classes = dict()
+        for c_type in sorted(set(self.class_timings.keys()).union(
+            self.class_counters.keys())):
+            classes[c_type] = {
+                'stages': dict(self.class_timings.get(c_type, dict())),
+                'counters': dict(self.class_counters.get(c_type, dict()))
+            }
+
+        return {
+            'stages': self.getStageTimings(),
+            'counters': self.getCounters(),
+            'classes': classes,
+            'wall_time': time.perf_counter() - self.origin
+        }
+
+    def saveJSON(self, file_path: str):
+        """Function to save the recorded timings and counters (see `toDict`)
+        to a JSON file.
+
+        Arguments:
+            file_path {str} -- Path to the JSON file.
+        """
+
+        with open(file_path, 'w') as f:
+            json.dump(self.toDict(), f, indent=2)
+
+    def saveChromeTrace(self, file_path: str):
+        """Function to save the recorded stages to a Chrome trace file (Trace
+        Event Format), with a complete event for each stage, and the final
+        value of each counter.
+
+        Arguments:
+            file_path {str} -- Path to the trace file.
+        """
+
+        pid = os.getpid()
+        threads = dict()
+        trace_events = list()
+        for name, c_type, start, elapsed, thread, args in list(self.events):
+            trace_events.append({
+                'name': name if c_type is None else '{0} ({1})'.format(name,
+                                                                       c_type),
+                'cat': name,
+                'ph': 'X',
+                'ts': start * 1e6,
+                'dur': elapsed * 1e6,
+                'pid': pid,
+                'tid': threads.setdefault(thread, len(threads)),
+                'args': dict(args, c_type=c_type) if c_type else args
+            })
+
+        if self.counters:
+            trace_events.append({
+                'name': 'counters',
+                'ph': 'C',
+                'ts': (time.perf_counter() - self.origin) * 1e6,
+                'pid': pid,
+                'args': self.getCounters()
+            })
+
+        with open(file_path, 'w') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+
+
+# Shared no-op stage (instrumentation disabled)
+_NO_STAGE = nullcontext()
+
+def stage(stats: Stats, name: str, c_type: str=None, **args):
+    """Function to time a stage with a Stats object, if one is supplied (see
+    `Stats.stage`); a shared no-op context manager is returned otherwise.
+
+    Arguments:
+        stats {Stats} -- Stats object (None if instrumentation is disabled).
+        name {str} -- Stage name.
+
+    Keyword Arguments:
+        c_type {str} -- Ontology class the stage is attributed to
+                        (default: {None}).
+        **args -- Additional stage arguments (recorded in the trace).
+
+    Returns:
+        Context manager timing the stage.
+    """
+
+    if stats is None:
+        return _NO_STAGE
+
+    return stats.stage(name, c_type=c_type, **args)
@@ -1,3 +1,24 @@
 from . import util
-from .driver import TemplateDriver
+from .bytecode_cache import TemplateBytecodeCache
+from .render_cache import RenderCache
 from .template import PrecisTemplate
+
+
+def __getattr__(name: str):
+    # TemplateDriver, CompiledData and the batch rendering and render server
+    # classes are imported lazily, as they depend on the ontology query modules
+    # (see `precis.__getattr__`)
+    if name in ['BatchJob', 'BatchRenderer', 'BatchResult']:
+        from . import batch
+        return getattr(batch, name)
+    elif name in ['RenderClient', 'RenderServer']:
+        from . import server
+        return getattr(server, name)
+    elif name == 'TemplateDriver':
+        from .driver import TemplateDriver
+        return TemplateDriver
+    elif name == 'CompiledData':
+        from .compiled import CompiledData
+        return CompiledData
+    raise AttributeError('module {0} has no attribute {1}'.format(
+        __name__, name))
@@ -0,0 +1,281 @@
+from .render_cache import RenderCache
+from .template import PrecisTemplate
+from .. import bootstrap, util
+from ..stats import Stats
+
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from io import StringIO
+from typing import Iterator, NamedTuple, TYPE_CHECKING
+import json
+import logging
+import os
+import time
+
+# Only imported for type annotations; the query modules are loaded lazily
+if TYPE_CHECKING:
+    from ..query import QueryProfiler
+
+
+class BatchJob(NamedTuple):
+    """Template rendering job (see `BatchRenderer`).
+
+    Arguments:
+        data_file {str} -- Path to the user data file (RDF or JSON).
+        template_folder {str} -- Path to the template folder.
+        prefs_file {str} -- Path to the user template preferences file.
+
+    Keyword Arguments:
+        output_file {str} -- Path to write the rendered template to. The
+                             rendered template is returned with the result if
+                             one is not provided (default: {None}).
+        override_files {tuple} -- Paths of JSON data files overriding the
+                                  (JSON) user data file, in ascending order of
+                                  specificity (see `util.buildData`)
+                                  (default: {()}).
+        namespace {str} -- Namespace IRI of the user data, if the user data
+                           file is a persistent world holding the user data of
+                           many people (see `PrecisWorld.open`)
+                           (default: {None}).
+    """
+
+    data_file: str
+    template_folder: str
+    prefs_file: str
+    output_file: str = None
+    override_files: tuple = ()
+    namespace: str = None
+
+
+class BatchResult(NamedTuple):
+    """Result of a template rendering job (see `BatchRenderer`).
+
+    Arguments:
+        job {BatchJob} -- Rendering job.
+        output {str} -- Rendered template (None if the job failed, or if the
+                        output was written to the job output file).
+        error {str} -- Error message (None if the job succeeded).
+        timings {dict} -- Time taken (in seconds) to build the template data
+                          ('build'), to render the template ('render'), and in
+                          total ('total').
+        worker {int} -- Process ID of the worker that ran the job.
+    """
+
+    job: BatchJob
+    output: str
+    error: str
+    timings: dict
+    worker: int
+
+
+# Templates loaded by the current process (template folder -> template)
+_loaded_templates = dict()
+
+
+def warmUp(template_folders: list=[]):
+    """Function to pre-warm the current process for rendering jobs. Loads the
+    Precis ontology and the query and templating modules, prepares the SPARQL
+    queries run by template overrides, and loads (and compiles) the templates.
+
+    Keyword Arguments:
+        template_folders {list} -- Paths of template folders to be loaded
+                                   (default: {[]}).
+    """
+
+    bootstrap.initialize()
+    from .. import TemplateOntQuery
+    # Importing the driver module (and the query modules it depends on), such
+    # that it is not imported by the first job
+    from . import driver  # noqa: F401
+
+    TemplateOntQuery.prepareQueries()
+    for template_folder in template_folders:
+        getTemplate(template_folder=template_folder)
+
+    logging.debug('Pre-warmed process {0} with {1} templates'.format(
+        os.getpid(), len(template_folders)))
+
+
+def getTemplate(template_folder: str) -> PrecisTemplate:
+    """Function to get a template, loaded once per process.
+
+    Arguments:
+        template_folder {str} -- Path to the template folder.
+
+    Returns:
+        PrecisTemplate -- Loaded template.
+    """
+
+    template_folder = os.path.abspath(template_folder)
+    if template_folder not in _loaded_templates:
+        _loaded_templates[template_folder] = PrecisTemplate(
+            template_folder=template_folder)
+    return _loaded_templates[template_folder]
+
+
+def renderJob(job: BatchJob, render_cache: RenderCache=None,
+              stats: Stats=None, profiler: 'QueryProfiler'=None) -> BatchResult:
+    """Function to run a rendering job in the current process. Errors are
+    returned with the result, such that they do not affect other jobs.
+
+    User data is loaded into an isolated Precis world (JSON data files), from
+    compiled user data (RDF data files; see `CompiledData.fromRDF`), or is
+    queried in place (persistent worlds, if the job has a namespace).
+    Override files are applied to JSON data files before they are loaded.
+
+    Arguments:
+        job {BatchJob} -- Rendering job.
+
+    Keyword Arguments:
+        render_cache {RenderCache} -- Render cache (default: {None}).
+        stats {Stats} -- Stats object recording instrumentation of loading,
+                         querying and rendering (see `Stats`)
+                         (default: {None}).
+        profiler {QueryProfiler} -- Query profiler (see `QueryProfiler`)
+                                    (default: {None}).
+
+    Returns:
+        BatchResult -- Job result.
+    """
+
+    from .driver import TemplateDriver
+    from .. import Loader
+    from ..world import PrecisWorld
+
+    timings = dict()
+    output = None
+    error = None
+
+    t_start = time.perf_counter()
+    try:
+        template = getTemplate(template_folder=job.template_folder)
+
+        # Building template data
+        t = time.perf_counter()
+        data_world = None
+        user_ont, user_graph, data_file = None, None, job.data_file
+        if job.override_files:
+            if not job.data_file.endswith('.json'):
+                message = 'Override files cannot be applied to data file \
+                    {0} (JSON only)'.format(job.data_file)
+                logging.error(message)
+                raise ValueError(message)
+            data = util.buildData(data_file=job.data_file,
+                                  override_files=list(job.override_files))
+            data_world = PrecisWorld()
+            loader = Loader(ingest_file=StringIO(json.dumps(data)),
+                            namespace=job.namespace, world=data_world,
+                            stats=stats)
+            user_ont = loader.getOntology()
+            user_graph = loader.getRDFLibGraph()
+            data_file = None
+        try:
+            with open(job.prefs_file) as user_prefs:
+                driver = TemplateDriver(template=template, user_ont=user_ont,
+                                        user_graph=user_graph,
+                                        user_prefs=user_prefs,
+                                        render_cache=render_cache,
+                                        data_file=data_file,
+                                        namespace=job.namespace,
+                                        stats=stats, profiler=profiler)
+        finally:
+            if data_world:
+                data_world.close()
+        timings['build'] = time.perf_counter() - t
+
+        # Rendering template
+        t = time.perf_counter()
+        output = driver.buildTemplate()
+        timings['render'] = time.perf_counter() - t
+
+        if job.output_file:
+            with open(job.output_file, 'w') as f:
+                f.write(output)
+            output = None
+    except Exception as e:
+        error = '{0}: {1}'.format(type(e).__name__, e)
+        logging.error('Batch job for {0} failed with {1}'.format(
+            job.data_file, error))
+    timings['total'] = time.perf_counter() - t_start
+
+    return BatchResult(job=job, output=output, error=error, timings=timings,
+                       worker=os.getpid())
+
+
+class BatchRenderer():
+    """This module encapsulates parallel template rendering.
+
+    Rendering jobs (see `BatchJob`) are distributed over a pool of worker
+    processes. Workers are pre-warmed when the pool is started (see `warmUp`);
+    each worker loads the Precis ontology, prepares template queries, and loads
+    and compiles the given templates (templates used by jobs that were not
+    pre-loaded are loaded on first use).
+    The user data of each job is loaded into an isolated world (see
+    `PrecisWorld`), which is freed once the template data is built, such that
+    workers can run any number of jobs.
+
+    Results (see `BatchResult`) are returned as soon as each job completes,
+    with the job's rendered template (or error) and timings.
+
+    Workers may share a render cache (see `RenderCache`), as its entries are
+    written atomically. Instrumentation (see `Stats` and `QueryProfiler`) is
+    recorded in the process running a job, so it is only available when jobs
+    are run in the current process (see `renderJob`).
+    """
+
+    def __init__(self, template_folders: list=[], max_workers: int=None,
+                 render_cache: RenderCache=None):
+        """BatchRenderer initialization method. Starts the worker pool.
+
+        Keyword Arguments:
+            template_folders {list} -- Paths of template folders to be loaded
+                                       by each worker when it is started
+                                       (default: {[]}).
+            max_workers {int} -- Number of worker processes. The number of
+                                 CPUs is used if one is not provided
+                                 (default: {None}).
+            render_cache {RenderCache} -- Render cache used by all workers
+                                          (cache statistics are kept by each
+                                          worker) (default: {None}).
+        """
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.render_cache = render_cache
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=warmUp,
+            initargs=(list(template_folders),)
+        )
+
+        logging.debug('Started batch renderer with {0} workers'.format(
+            self.max_workers))
+
+    def render(self, jobs: list) -> Iterator[BatchResult]:
+        """Function to run rendering jobs on the worker pool. Results are
+        yielded in order of completion (not in order of submission).
+
+        Arguments:
+            jobs {list} -- Rendering jobs.
+
+        Returns:
+            Iterator[BatchResult] -- Iterator over job results.
+        """
+
+        futures = [self.executor.submit(renderJob, job,
+                                        render_cache=self.render_cache)
+                   for job in jobs]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+    def close(self):
+        """Function to shut down the worker pool, waiting for running jobs to
+        complete.
+        """
+
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'BatchRenderer':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,145 @@
+from .. import bootstrap
+from ..cfg import config
+
+from jinja2 import Environment
+from jinja2.bccache import Bucket, BytecodeCache
+import hashlib
+import io
+import json
+import logging
+import os
+
+
+class TemplateBytecodeCache(BytecodeCache):
+    """This module encapsulates a persistent cache of compiled Jinja templates
+    (i.e. the Python bytecode generated from them), so that templates are not
+    lexed, parsed and compiled again in every new process (see
+    `PrecisTemplate`).
+
+    Cache entries are keyed by the SHA-256 digest of the template source and
+    the Jinja environment configuration (see `templateKey`), and are stored as
+    individual files in the cache folder. Entries written by a different
+    version of Jinja or Python are ignored (and replaced). As entries are
+    written atomically, a cache folder may be shared by several processes.
+    """
+
+    def __init__(self, cache_folder: str=None):
+        """TemplateBytecodeCache initialization method. Binds the cache folder
+        to a class variable, and initializes statistics.
+
+        Keyword Arguments:
+            cache_folder {str} -- Cache folder. The 'templates' folder in the
+                                  Precis cache folder is used if one is not
+                                  provided (default: {None}).
+        """
+
+        if cache_folder is None:
+            cache_folder = os.path.join(config.cache_folder, 'templates')
+
+        self.cache_folder = cache_folder
+        self.stats = {'hits': 0, 'misses': 0}
+
+    @staticmethod
+    def templateKey(source: str) -> str:
+        """Function to build the cache key of a template.
+
+        Arguments:
+            source {str} -- Template source.
+
+        Returns:
+            str -- Cache key.
+        """
+
+        return hashlib.sha256(json.dumps([source, config.jinja_env_config],
+            sort_keys=True).encode('utf-8')).hexdigest()
+
+    def get_bucket(self, environment: Environment, name: str, filename: str,
+                   source: str) -> Bucket:
+        """Function to get the cache bucket of a template, with its compiled
+        bytecode if it is in the cache (called by Jinja).
+
+        Arguments:
+            environment {Environment} -- Jinja environment.
+            name {str} -- Template name.
+            filename {str} -- Template file path (may be None).
+            source {str} -- Template source.
+
+        Returns:
+            Bucket -- Cache bucket.
+        """
+
+        bucket = Bucket(environment=environment,
+                        key=self.templateKey(source=source),
+                        checksum=self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+
+        if bucket.code is None:
+            self.stats['misses'] += 1
+            logging.debug('Template bytecode cache miss {0}'.format(name))
+        else:
+            self.stats['hits'] += 1
+            logging.debug('Template bytecode cache hit {0}'.format(name))
+
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket):
+        """Function to load the compiled bytecode of a bucket from the cache,
+        if it exists (called by Jinja).
+
+        Arguments:
+            bucket {Bucket} -- Cache bucket.
+        """
+
+        try:
+            with open(self.__entryFile(key=bucket.key), 'rb') as f:
+                bucket.load_bytecode(f)
+        except OSError:
+            pass
+
+    def dump_bytecode(self, bucket: Bucket):
+        """Function to add the compiled bytecode of a bucket to the cache
+        (called by Jinja). Failures are logged, but are not fatal.
+
+        Arguments:
+            bucket {Bucket} -- Cache bucket.
+        """
+
+        output = io.BytesIO()
+        bucket.write_bytecode(output)
+
+        try:
+            bootstrap.atomicWrite(file_path=self.__entryFile(key=bucket.key),
+                                  contents=output.getvalue())
+        except OSError:
+            logging.warning('Template bytecode cache folder {0} is not \
+                writable'.format(self.cache_folder))
+
+    def cacheInfo(self) -> dict:
+        """Function to get template bytecode cache statistics.
+
+        Returns:
+            dict -- Number of cache hits and misses.
+        """
+
+        return dict(self.stats)
+
+    def clear(self):
+        """Function to remove all entries from the cache, and reset statistics.
+        """
+
+        try:
+            files = os.listdir(self.cache_folder)
+        except OSError:
+            files = list()
+
+        for f in files:
+            if not f.endswith('.jinja'): continue
+            try:
+                os.remove(os.path.join(self.cache_folder, f))
+            except OSError:
+                pass
+
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def __entryFile(self, key: str) -> str:
+        return os.path.join(self.cache_folder, '{0}.jinja'.format(key))
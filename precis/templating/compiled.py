@@ -0,0 +1,309 @@
+from .. import bootstrap, OntQuery, TemplateOntQuery
+from ..cfg import config
+from ..world import PrecisWorld
+
+from owlready2.namespace import Ontology
+from rdflib import Graph
+import gzip
+import logging
+import os
+import pickle
+
+
+# Compiled user data format version (compiled user data with a different
+# format is discarded)
+COMPILED_FORMAT = 2
+
+
+class CompiledData():
+    """This module encapsulates compiled user data; that is, the metadata of
+    every individual of every class in a user data ontology (as output by
+    `OntQuery.getAllOfType`, with template overrides applied), together with
+    each ordering of the individuals of each class.
+
+    Compiled user data is independent of the template and user preferences,
+    and can be used to build any number of templates (see `TemplateDriver`)
+    without querying the ontology. It is stored on disk in a compressed binary
+    format, and is cached by the SHA-256 digest of the source RDF file.
+    """
+
+    def __init__(self, classes: dict, digest: str=None):
+        """CompiledData initialization method. Binds compiled class data to
+        class variables.
+
+        Arguments:
+            classes {dict} -- Dictionary of class name -> compiled class data
+                              (see `compile`).
+
+        Keyword Arguments:
+            digest {str} -- SHA-256 digest of the source RDF file
+                            (default: {None}).
+        """
+
+        self.classes = classes
+        self.digest = digest
+
+    @classmethod
+    def compile(self, user_ont: Ontology, user_graph: Graph,
+                digest: str=None) -> 'CompiledData':
+        """Function to compile user data from a user data ontology.
+
+        Arguments:
+            user_ont {Ontology} -- User data ontology.
+            user_graph {Graph} -- RDFLib graph representation of the ontology.
+
+        Keyword Arguments:
+            digest {str} -- SHA-256 digest of the source RDF file
+                            (default: {None}).
+
+        Returns:
+            CompiledData -- Compiled user data.
+        """
+
+        # Loading the Precis ontology (if not loaded already)
+        bootstrap.initialize()
+
+        query = OntQuery(ont=user_ont, graph=user_graph, backend='native')
+        template_query = TemplateOntQuery(ont=user_ont, graph=user_graph)
+
+        classes = dict()
+
+        for c_type in config.ont_classes.keys():
+            # Skip Description objects (blank nodes)
+            if c_type == 'Description': continue
+
+            # Individual IRIs, in the default order
+            iris = query.getIndividualIRIs(c_type=c_type)
+            positions = {iri: i for i, iri in enumerate(iris)}
+
+            # Individual metadata (with all descriptions)
+            individuals = [query.getIndividual(individual=user_ont.world[iri],
+                descr_priority=int(1e10)) for iri in iris]
+
+            # Applying template overrides (independent of ordering)
+            if template_query.overrideExists(c_type=c_type):
+                individuals = template_query.overrideByClass(c_type=c_type,
+                    class_invds=individuals)
+
+            classes[c_type] = {
+                'individuals': individuals,
+                # Positions of individuals, for each ordering
+                'orders': {order: [positions[iri] for iri in
+                    query.getIndividualIRIs(c_type=c_type, order=order)]
+                    for order in config.valid_order_options},
+                # Description (priority, text) of each individual
+                'descriptions': [query.getDescriptionPriorities(
+                    individual_iri=iri) for iri in iris],
+                # Names of all instances of the class (for item overrides)
+                'instances': query.getInstanceNames(c_type=c_type)
+            }
+
+            logging.debug('Compiled {0} individuals of class {1}'.format(
+                len(individuals), c_type))
+
+        return self(classes=classes, digest=digest)
+
+    @classmethod
+    def fromRDF(self, rdf_file: str) -> 'CompiledData':
+        """Function to get compiled user data for an RDF file (RDF/XML or
+        N-Triples), or a quadstore snapshot (see `Loader.saveToFile`). Compiled
+        user data is loaded from the cache if available; otherwise, the file is
+        loaded into an isolated Precis world (see `PrecisWorld`), or the
+        snapshot is opened in place, and compiled, and the compiled user data
+        is cached.
+
+        Arguments:
+            rdf_file {str} -- Path to the user data RDF or snapshot file.
+
+        Returns:
+            CompiledData -- Compiled user data.
+        """
+
+        digest = bootstrap.fileDigest(file_path=rdf_file)
+        compiled_file = self.cacheFile(digest=digest)
+
+        # Loading from cache (if available and valid)
+        if os.path.isfile(compiled_file):
+            try:
+                return self.load(file_path=compiled_file)
+            except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+                logging.debug('Discarding compiled user data {0}'.format(
+                    compiled_file))
+
+        # Loading the user data ontology into an isolated world (or opening the
+        # snapshot), and compiling
+        snapshot = PrecisWorld.isSnapshot(file_path=rdf_file)
+        if snapshot:
+            world = PrecisWorld.fromSnapshot(file_path=rdf_file)
+        else:
+            world = PrecisWorld()
+        try:
+            if snapshot:
+                user_ont = world.ont
+            else:
+                user_ont = world.world.get_ontology(
+                    os.path.abspath(rdf_file)).load()
+            compiled = self.compile(user_ont=user_ont,
+                                    user_graph=world.getRDFLibGraph(),
+                                    digest=digest)
+        finally:
+            world.close()
+
+        # Caching (failures are not fatal)
+        try:
+            compiled.save(file_path=compiled_file)
+        except OSError:
+            logging.warning('Compiled user data could not be saved to {0}'\
+                .format(compiled_file))
+
+        return compiled
+
+    @classmethod
+    def cacheFile(self, digest: str) -> str:
+        """Function to get the cache file path of compiled user data, given the
+        digest of the source RDF file.
+
+        Arguments:
+            digest {str} -- SHA-256 digest of the source RDF file.
+
+        Returns:
+            str -- Path to the cached compiled user data.
+        """
+
+        return os.path.join(config.cache_folder, 'compiled',
+                            '{0}.pickle.gz'.format(digest))
+
+    @classmethod
+    def load(self, file_path: str) -> 'CompiledData':
+        """Function to load compiled user data from a file.
+
+        Arguments:
+            file_path {str} -- Path to the compiled user data file.
+
+        Raises:
+            ValueError -- Raised when the compiled user data has a different
+                          format, or was compiled with a different version of
+                          the Precis ontology.
+
+        Returns:
+            CompiledData -- Compiled user data.
+        """
+
+        with gzip.open(file_path, 'rb') as f:
+            contents = pickle.load(f)
+
+        if contents.get('format') != COMPILED_FORMAT or \
+            contents.get('ont_version') != config.ont_version:
+            message = 'Compiled user data {0} is stale'.format(file_path)
+            logging.error(message)
+            raise ValueError(message)
+
+        logging.debug('Loaded compiled user data from {0}'.format(file_path))
+
+        return self(classes=contents['classes'], digest=contents['digest'])
+
+    def save(self, file_path: str):
+        """Function to save compiled user data to a file.
+
+        Arguments:
+            file_path {str} -- Path to the compiled user data file.
+        """
+
+        contents = {
+            'format': COMPILED_FORMAT,
+            'ont_version': config.ont_version,
+            'digest': self.digest,
+            'classes': self.classes
+        }
+
+        bootstrap.atomicWrite(file_path=file_path, contents=gzip.compress(
+            pickle.dumps(contents, protocol=pickle.HIGHEST_PROTOCOL)))
+
+        logging.debug('Saved compiled user data to {0}'.format(file_path))
+
+    def getAllOfType(self, c_type: str, order: str=None,
+                     descr_priority: int=int(1e10)) -> list:
+        """Function to get all individuals of a given class type, with optional
+        ordering and description priority restriction (see
+        `OntQuery.getAllOfType`), with template overrides applied.
+
+        Arguments:
+            c_type {str} -- Target class type (i.e. 'Degree', 'Course', etc.).
+
+        Keyword Arguments:
+            order {str} -- Ordering, optional. Must be either 'chron_A',
+                           'chron_D', 'alphabetical_A', or 'alphabetical_D'
+                           (default: {None}).
+            descr_priority {int} -- Maximum priority of description items
+                                    (default: {int(1e10)}).
+
+        Raises:
+            ValueError -- Raised when the `order` is not 'chron_A', 'chron_D',
+                          'alphabetical_A', or 'alphabetical_D'.
+
+        Returns:
+            list -- Ordered (optional) list of all individuals of `c_type`.
+        """
+
+        # Ensuring order selection is valid (if one is provided)
+        if (order) and (order not in config.valid_order_options):
+            message = 'Order must be one of {0}'.format(
+                config.valid_order_options)
+            logging.error(message)
+            raise ValueError(message)
+
+        compiled_class = self.classes[c_type]
+
+        if order:
+            positions = compiled_class['orders'][order]
+        else:
+            positions = range(len(compiled_class['individuals']))
+
+        return [self.__getIndividual(
+            individual=compiled_class['individuals'][i],
+            descriptions=compiled_class['descriptions'][i],
+            descr_priority=descr_priority) for i in positions]
+
+    def getInstanceNames(self, c_type: str) -> set:
+        """Function to get the names of all instances of a given class type.
+
+        Arguments:
+            c_type {str} -- Target class type (i.e. 'Degree', 'Course', etc.).
+
+        Returns:
+            set -- Set of instance names.
+        """
+
+        return self.classes[c_type]['instances']
+
+    def __getIndividual(self, individual: dict, descriptions: list,
+                        descr_priority: int) -> dict:
+        """Function to get the metadata of an individual, with descriptions
+        restricted to a maximum description priority.
+
+        Arguments:
+            individual {dict} -- Compiled individual metadata.
+            descriptions {list} -- Ordered (priority, text) descriptions of the
+                                   individual.
+            descr_priority {int} -- Maximum description priority.
+
+        Returns:
+            dict -- Individual metadata (a copy of the compiled metadata).
+        """
+
+        # Distinct description text below the maximum priority (in order)
+        description_text = list()
+        for priority, text in descriptions:
+            if priority < descr_priority and text not in description_text:
+                description_text.append(text)
+
+        # Copying metadata (preserving key order)
+        output = dict()
+        for key, value in individual.items():
+            if key == 'hasDescription':
+                if description_text:
+                    output[key] = description_text
+            else:
+                output[key] = value
+
+        return output
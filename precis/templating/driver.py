@@ -1,13 +1,32 @@
+from .compiled import CompiledData
+from .render_cache import RenderCache
 from .template import PrecisTemplate
-from .. import OntQuery, TemplateOntQuery
+from .. import bootstrap, Loader, OntQuery, TemplateOntQuery
+from ..query import QueryProfiler
 from ..cfg import config
+from ..stats import Stats, stage
+from ..world import PrecisWorld
 
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from io import TextIOWrapper
+from itertools import repeat
+from owlready2.entity import ThingClass
+from owlready2.individual import Thing
 from owlready2.namespace import Ontology
+from owlready2.prop import ObjectPropertyClass
 from rdflib import Graph
 from yaml import load as yaml_load, SafeLoader
 from yaml.parser import ParserError
 import logging
+import os
+import tempfile
+import time
+
+
+# Query agents of the user data snapshot opened by each worker process
+# extracting classes concurrently (see `openExtractionSnapshot`)
+_extraction_queries = dict()
 
 
 class TemplateDriver():
@@ -20,7 +39,11 @@ class TemplateDriver():
     """
     
     def __init__(self, template: PrecisTemplate, user_ont: Ontology,
-                 user_graph: Graph, user_prefs: TextIOWrapper):
+                 user_graph: Graph, user_prefs: TextIOWrapper,
+                 compiled_data: CompiledData=None,
+                 render_cache: RenderCache=None, data_file: str=None,
+                 max_workers: int=None, namespace: str=None,
+                 stats: Stats=None, profiler: QueryProfiler=None):
         """TemplateDriver initialization method. Validates user preferences
         against the supplied ontology, and against the template configuration.
 
@@ -29,12 +52,66 @@ class TemplateDriver():
         using restrictions from the user preferences, and only required classes
         from the template configuraion. Intelligent logging and error messages
         pinpoint errors in user preferences for easy debugging.
+
+        If compiled user data is supplied, template data is built from the
+        compiled user data, without querying the ontology (`user_ont` and
+        `user_graph` are not used, and may be `None`).
+
+        If a render cache and the user data file (RDF or JSON) are supplied,
+        the rendered template is looked up by the contents of the user data
+        file, the template and the user preferences. On a cache hit, user data
+        is not loaded or queried. On a cache miss, if `user_ont` is `None`, the
+        user data file is loaded (RDF files through `CompiledData.fromRDF`, and
+        JSON files into an isolated Precis world, which is closed once the
+        template data is built).
+
+        If a namespace is supplied, template data is built from the user data
+        in that namespace only (i.e. the user data of one person, in a
+        persistent world holding the user data of many people; see
+        `PrecisWorld.open`). If `user_ont` is `None`, the user data file must
+        then be a persistent world (or a snapshot), which is queried in place,
+        without being loaded or compiled. The render cache is not used (the
+        user data file is not hashed).
+
+        If more than one worker is requested, the individuals of the classes
+        required by the template are extracted concurrently from the user data
+        ontology, by a pool of processes reading a snapshot of its quadstore
+        (see `PrecisWorld.saveSnapshot`), and are merged in the order of the
+        required classes. The output is identical to serial extraction. Saving
+        the snapshot and starting the workers takes a fixed time, so that this
+        only pays off for large user data, on several CPUs. The time taken to
+        extract the individuals of each class is available with
+        `getClassTimings`.
+
+        If a Stats object is supplied, it records the time taken by each stage
+        of building and rendering the template (loading the user data file,
+        validating preferences, extracting each class, running queries and
+        template overrides, and rendering), and counts queries, result rows,
+        ontology searches and individuals created (see `Stats`). If a query
+        profiler is supplied, the queries run to extract template data are
+        profiled (see `QueryProfiler`).
         
         Arguments:
             template {Template} -- Template to be rendered.
             user_ont {Ontology} -- User data ontology.
             user_graph {Graph} -- RDFLib graph representation of the ontology.
             user_prefs {TextIOWrapper} -- User template preferences file.
+
+        Keyword Arguments:
+            compiled_data {CompiledData} -- Compiled user data (see
+                                            `CompiledData`) (default: {None}).
+            render_cache {RenderCache} -- Render cache (default: {None}).
+            data_file {str} -- Path to the user data file (RDF or JSON)
+                               (default: {None}).
+            max_workers {int} -- Number of processes extracting classes
+                                 concurrently; classes are extracted serially
+                                 if not greater than 1, or from compiled user
+                                 data (default: {None}).
+            namespace {str} -- Namespace IRI of the user data
+                               (default: {None}).
+            stats {Stats} -- Stats object recording instrumentation
+                             (default: {None}).
+            profiler {QueryProfiler} -- Query profiler (default: {None}).
     
         Raises:
             AttributeError -- Raised when a attribute required by the template
@@ -46,9 +123,11 @@ class TemplateDriver():
                            YAML syntax.
             ValueError -- Raised when an invalid ordering scheme is specified.
         """
-        
+
         # Binding class variables
         self.template = template
+        self.compiled_data = compiled_data
+        self.stats = stats
 
         # Parsing user preferences, saving to class variable
         try:
@@ -70,74 +149,117 @@ class TemplateDriver():
             raise AttributeError(message)
         
         logging.debug('User prefs validated with all required keys present')
+
+        # Looking up rendered template in the render cache
+        # Note: User preferences are hashed before overrides are expanded
+        self.render_cache = render_cache
+        self.render_key = None
+        self.cached_output = None
+        if self.render_cache and data_file and (not namespace):
+            self.render_key = RenderCache.renderKey(data_file=data_file,
+                template_digest=self.template.getDigest(),
+                user_prefs=self.user_prefs)
+            self.cached_output = self.render_cache.get(key=self.render_key)
+            if self.cached_output is not None:
+                logging.info('Using cached template rendering for {0}'.format(
+                    data_file))
+                return
+
+        # Loading the Precis ontology (if not loaded already)
+        bootstrap.initialize()
+
+        # Loading user data file (if the user data ontology is not supplied)
+        data_world = None
+        if (user_ont is None) and (not self.compiled_data) and data_file:
+            with stage(self.stats, 'load'):
+                if data_file.endswith('.json'):
+                    data_world = PrecisWorld()
+                    with open(data_file) as f:
+                        loader = Loader(ingest_file=f, world=data_world,
+                                        stats=stats)
+                    user_ont = loader.getOntology()
+                    user_graph = loader.getRDFLibGraph()
+                elif namespace:
+                    data_world = PrecisWorld.fromSnapshot(file_path=data_file)
+                    user_ont = data_world.ont
+                    user_graph = data_world.getRDFLibGraph()
+                else:
+                    self.compiled_data = CompiledData.fromRDF(
+                        rdf_file=data_file)
+        self.user_ont = user_ont
         
         # Building template data
         self.template_data = dict()
 
-        # Ensuring order overrides and item overrides are valid
-        order_overrides = self.__getOrderOverrides()
-        item_overrides = self.__getItemOverrides()
+        # Instantiating query agent (compiled user data is queried directly)
+        # Note: The native backend extracts each individual directly from the
+        #       quadstore, so batched extraction (see `OntQuery`) is not used
+        if self.compiled_data:
+            self.query = self.compiled_data
+        else:
+            self.query = OntQuery(ont=user_ont, graph=user_graph,
+                                  backend='native', namespace=namespace,
+                                  stats=stats, profiler=profiler)
 
-        # Instantiating query agent
-        self.query = OntQuery(ont=user_ont, graph=user_graph)
+            # Instantiating generic template-specific query agent
+            self.generic_template_query = TemplateOntQuery(
+                ont=user_ont,
+                graph=user_graph,
+                namespace=namespace,
+                stats=stats,
+                profiler=profiler
+            )
 
-        # Instantiating generic template-specific query agent
-        self.generic_template_query = TemplateOntQuery(
-            ont=user_ont,
-            graph=user_graph
-        )
+        # Ensuring order overrides and item overrides are valid
+        # Note: Item overrides are expanded in place, so the original item
+        #       overrides are kept to be re-evaluated on updates (see `update`)
+        self.item_override_prefs = deepcopy(self.user_prefs.get(
+            'item_overrides'))
+        with stage(self.stats, 'preferences'):
+            order_overrides = self.__getOrderOverrides()
+            item_overrides = self.__getItemOverrides()
+        self.order_overrides = order_overrides
+        self.item_overrides = item_overrides
 
-        # Dictionary to store user data
+        # Dictionary to store user data, and extraction time of each class
         self.user_data = dict()
+        self.class_timings = dict()
 
-        # Extracting template data from the ontology
-        for ont_class in self.template.getRequiredClasses():
-            # Isolating order override (if any)
-            if ont_class in order_overrides.keys():
-                order = order_overrides[ont_class]
-            else:
-                order = None
-
-            # Get class individuals depending on whether description priority
-            # restriction is imposed
-            # Getting all of type 'ont_class', with order and description
-            # restrictions
-            if 'max_description_priority' in self.user_prefs.keys():
-                class_invds = self.query.getAllOfType(
-                    c_type=ont_class,
-                    order=order,
-                    descr_priority=self.user_prefs['max_description_priority']
-                )
-            else:
-                class_invds = self.query.getAllOfType(
-                    c_type=ont_class,
-                    order=order
-                )
-
-            # If override function exists for current class, run override
-            if self.generic_template_query.overrideExists(c_type=ont_class):
-                class_invds = self.generic_template_query.overrideByClass(
-                    c_type=ont_class,
-                    class_invds=class_invds
-                )
-
-            # Apply item overrides (if they exist for current `ont_class`)
-            if ont_class in item_overrides.keys():
-                # Keep if the individual ID is in item overrides
-                # Note: This preserves ordering from retrieval function
-                class_invds = [i for i in class_invds if i['$id']
-                    in item_overrides[ont_class]]
-
-            logging.debug('Extracted {0} individuals of class {1} for template'\
-                .format(len(class_invds), ont_class))
-
-            # Appending to user data dictionary
+        # Extracting template data from the ontology, one class at a time or
+        # concurrently (merged in the order of the required classes)
+        required_classes = list(self.template.getRequiredClasses())
+        if max_workers and (max_workers > 1) and (not self.compiled_data):
+            extracted = self.__extractConcurrently(classes=required_classes,
+                order_overrides=order_overrides, item_overrides=item_overrides,
+                namespace=namespace, max_workers=max_workers)
+        else:
+            extracted = [self.__extractClass(ont_class=ont_class,
+                order_overrides=order_overrides, item_overrides=item_overrides)
+                for ont_class in required_classes]
+
+        for ont_class, (class_invds, elapsed) in zip(required_classes,
+                                                     extracted):
             self.user_data[ont_class] = class_invds
+            self.class_timings[ont_class] = elapsed
+
+        # Recording the individuals and classes the data of each class was
+        # derived from (see `update`)
+        self.class_dependencies = dict()
+        if not self.compiled_data:
+            for ont_class in required_classes:
+                with stage(self.stats, 'dependencies', c_type=ont_class):
+                    self.class_dependencies[ont_class] = \
+                        self.__getClassDependencies(ont_class=ont_class)
         
         # Appending required fields from user preferences to user data
         for field in self.template.getRequiredInput():
             self.user_data[field] = self.user_prefs[field]
 
+        # Freeing the user data world (if loaded from the user data file)
+        if data_world:
+            data_world.close()
+            self.user_ont = None
+
         logging.info('Successfully built user data object for template\
             rendering with {0} fields'.format(len(self.user_data.keys())))
 
@@ -149,7 +271,242 @@ class TemplateDriver():
             str -- Built template.
         """
 
-        return self.template.renderTemplate(render_data=self.user_data)
+        # Cache hit (see `__init__`)
+        if self.cached_output is not None:
+            return self.cached_output
+
+        with stage(self.stats, 'render'):
+            # Cache keyed by the user data file (see `__init__`)
+            if self.render_key:
+                output = self.template.renderTemplate(
+                    render_data=self.user_data)
+                self.render_cache.put(key=self.render_key, output=output)
+                return output
+
+            return self.template.renderTemplate(render_data=self.user_data,
+                render_cache=self.render_cache)
+
+    def update(self, changes: dict) -> list:
+        """Function to update template data after the user data ontology has
+        changed (eg: after an incremental reload; see `Loader.reload`). Only
+        the classes whose data was derived from changed individuals (or
+        from individuals of changed classes) are extracted again. The template
+        is rendered from the updated data by `buildTemplate`.
+
+        The data of each class depends on the individuals of the class, the
+        individuals they relate to (up to three relations away, for names and
+        affiliations), the individuals relating to them through properties
+        looked up in reverse (eg: awards affiliated with work experiences),
+        and the classes looked up by template overrides (eg: awards of
+        projects).
+
+        Arguments:
+            changes {dict} -- Changed (added, updated or removed) individuals,
+                              of the form {ID: {type, ...}} (see
+                              `Loader.getLastChanges`).
+
+        Raises:
+            KeyError -- Raised when item overrides refer to removed
+                        individuals.
+            ValueError -- Raised when template data was not built from a user
+                          data ontology held by this driver.
+
+        Returns:
+            list -- Classes that were extracted again.
+        """
+
+        if self.compiled_data or (getattr(self, 'user_ont', None) is None):
+            message = 'Template data built from compiled user data or from a \
+                user data file cannot be updated'
+            logging.error(message)
+            raise ValueError(message)
+
+        # Changed classes, including superclasses of the changed individuals
+        changed_ids = set(changes.keys())
+        changed_types = set()
+        for individual_types in changes.values():
+            for individual_type in individual_types:
+                changed_types.update(c.name for c in self.user_ont.world[
+                    config.ont_classes[individual_type].iri].ancestors())
+
+        # Classes of the individuals that changed individuals relate to through
+        # relations looked up in reverse (eg: an added award affiliated with a
+        # work experience)
+        linked_types = set()
+        for property_name in self.query.inverse_properties:
+            for subject, target in self.user_ont.world[config.object_properties[
+                property_name].iri].get_relations():
+                if (subject.name in changed_ids) and isinstance(target, Thing):
+                    linked_types.update(c.name for target_class in target.is_a
+                        if isinstance(target_class, ThingClass)
+                        for c in target_class.ancestors())
+
+        # Re-evaluating item overrides (negated item overrides are expanded
+        # from the individuals of each class)
+        item_overrides = self.item_overrides
+        if self.item_override_prefs is not None:
+            self.user_prefs['item_overrides'] = deepcopy(
+                self.item_override_prefs)
+        self.item_overrides = self.__getItemOverrides()
+
+        affected_classes = list()
+        for ont_class, (dependency_ids, dependency_types) in \
+            self.class_dependencies.items():
+            if dependency_ids.intersection(changed_ids) or \
+                dependency_types.intersection(changed_types) or \
+                (ont_class in linked_types) or \
+                set(item_overrides.get(ont_class, [])) != \
+                set(self.item_overrides.get(ont_class, [])):
+                affected_classes.append(ont_class)
+
+        for ont_class in affected_classes:
+            class_invds, elapsed = self.__extractClass(ont_class=ont_class,
+                order_overrides=self.order_overrides,
+                item_overrides=self.item_overrides)
+            self.user_data[ont_class] = class_invds
+            self.class_timings[ont_class] = elapsed
+            self.class_dependencies[ont_class] = self.__getClassDependencies(
+                ont_class=ont_class)
+
+        # The rendered template is no longer valid
+        self.cached_output = None
+        self.render_key = None
+
+        logging.info('Updated template data for classes {0}'.format(
+            affected_classes))
+
+        return affected_classes
+
+    def getClassTimings(self) -> dict:
+        """Function to get the time taken to extract the individuals of each
+        class required by the template (empty on a render cache hit).
+
+        Returns:
+            dict -- Dictionary of the form {OntologyClass: seconds}, in the
+                    order of the required classes.
+        """
+
+        return dict(getattr(self, 'class_timings', dict()))
+
+    def __extractClass(self, ont_class: str, order_overrides: dict,
+                       item_overrides: dict) -> tuple:
+        """Function to extract the individuals of a class required by the
+        template, applying order, description priority, template and item
+        overrides.
+
+        Arguments:
+            ont_class {str} -- Ontology class name.
+            order_overrides {dict} -- Order overrides.
+            item_overrides {dict} -- Item overrides.
+
+        Returns:
+            tuple -- Individuals of the class, and the time taken (in seconds).
+        """
+
+        t = time.perf_counter()
+
+        with stage(self.stats, 'extract', c_type=ont_class):
+            class_invds = extractClass(query=self.query,
+                template_query=None if self.compiled_data else
+                    self.generic_template_query,
+                ont_class=ont_class, order_overrides=order_overrides,
+                item_overrides=item_overrides,
+                descr_priority=self.user_prefs.get('max_description_priority'))
+
+        elapsed = time.perf_counter() - t
+
+        logging.debug('Extracted {0} individuals of class {1} for template in \
+            {2:.4f}s'.format(len(class_invds), ont_class, elapsed))
+
+        return class_invds, elapsed
+
+    def __extractConcurrently(self, classes: list, order_overrides: dict,
+                              item_overrides: dict, namespace: str,
+                              max_workers: int) -> list:
+        """Function to extract the individuals of classes required by the
+        template concurrently, by a pool of processes reading a snapshot of
+        the quadstore of the user data ontology (see `extractClassJob`).
+
+        Arguments:
+            classes {list} -- Ontology class names.
+            order_overrides {dict} -- Order overrides.
+            item_overrides {dict} -- Item overrides.
+            namespace {str} -- Namespace IRI of the user data (may be None).
+            max_workers {int} -- Number of worker processes.
+
+        Returns:
+            list -- Individuals of each class, and the time taken (in seconds),
+                    in the order of `classes`.
+        """
+
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            snapshot_file = os.path.join(tmp_folder, 'user_data.sqlite')
+            with stage(self.stats, 'snapshot'):
+                PrecisWorld(world=self.user_ont.world).saveSnapshot(
+                    file_path=snapshot_file)
+
+            # Note: Instrumentation is not recorded by worker processes
+            with stage(self.stats, 'extract', workers=max_workers):
+                with ProcessPoolExecutor(
+                    max_workers=min(max_workers, len(classes)) or 1,
+                    initializer=openExtractionSnapshot,
+                    initargs=(snapshot_file, namespace)
+                ) as executor:
+                    extracted = list(executor.map(extractClassJob, classes,
+                        repeat(order_overrides), repeat(item_overrides),
+                        repeat(self.user_prefs.get(
+                            'max_description_priority'))))
+
+        logging.debug('Extracted {0} classes for template with {1} worker \
+            processes'.format(len(classes), max_workers))
+
+        return extracted
+
+    def __getClassDependencies(self, ont_class: str) -> tuple:
+        """Function to get the individuals and classes the data of a class
+        required by the template is derived from (see `update`).
+
+        Arguments:
+            ont_class {str} -- Ontology class name.
+
+        Returns:
+            tuple -- IDs of the individuals of the class, the individuals they
+                     relate to (up to three relations away) and the
+                     individuals relating to them through properties looked up
+                     in reverse, and names of the classes the data depends on.
+        """
+
+        dependency_ids = set()
+        individuals = self.query.getInstances(c_type=ont_class)
+        instances = set(individuals)
+
+        # Following object property relations (eg: a degree, its university,
+        # and the parent organization of the university)
+        for _ in range(4):
+            related = list()
+            for individual in individuals:
+                if individual.name in dependency_ids: continue
+                dependency_ids.add(individual.name)
+                for ont_property in individual.get_properties():
+                    if not isinstance(ont_property, ObjectPropertyClass):
+                        continue
+                    related.extend(i for i in ont_property[individual]
+                                   if isinstance(i, Thing))
+            individuals = related
+
+        dependency_types = set([ont_class]).union(
+            self.generic_template_query.getOverrideDependencies(
+                c_type=ont_class))
+
+        # Following relations looked up in reverse (eg: awards affiliated with
+        # a work experience; see `update` for individuals that are added)
+        for property_name in self.query.inverse_properties:
+            dependency_ids.update(subject.name for subject, target in
+                self.user_ont.world[config.object_properties[
+                    property_name].iri].get_relations()
+                if target in instances)
+
+        return dependency_ids, dependency_types
 
     def __getItemOverrides(self) -> dict:
         """Function to get specific item overrides, in a dictionary of the form
@@ -173,8 +530,7 @@ class TemplateDriver():
         for item_type in self.user_prefs['item_overrides']:
             # Getting IDs of individuals of the given type (from the key)
             try:
-                indv_ids = set([i.name for i in
-                    config.ont_classes[item_type].instances()])
+                indv_ids = self.query.getInstanceNames(c_type=item_type)
             except KeyError:
                 message = 'Item override type {0} in item overrides not valid'.\
                     format(item_type)
@@ -270,3 +626,124 @@ class TemplateDriver():
                 raise ValueError(message)
 
         return self.user_prefs['order_overrides']
+
+
+def extractClass(query: OntQuery, template_query: TemplateOntQuery,
+                 ont_class: str, order_overrides: dict, item_overrides: dict,
+                 descr_priority: int=None) -> list:
+    """Function to extract the individuals of a class required by a template,
+    applying order, description priority, template and item overrides (see
+    `TemplateDriver`).
+
+    Arguments:
+        query {OntQuery} -- Query agent (or compiled user data).
+        template_query {TemplateOntQuery} -- Template-specific query agent;
+                                             template overrides are not run
+                                             if it is None (i.e. they are
+                                             already applied to compiled user
+                                             data).
+        ont_class {str} -- Ontology class name.
+        order_overrides {dict} -- Order overrides.
+        item_overrides {dict} -- Item overrides.
+
+    Keyword Arguments:
+        descr_priority {int} -- Maximum description priority; all descriptions
+                                are extracted if not provided
+                                (default: {None}).
+
+    Returns:
+        list -- Individuals of the class.
+    """
+
+    # Isolating order override (if any)
+    if ont_class in order_overrides.keys():
+        order = order_overrides[ont_class]
+    else:
+        order = None
+
+    # Get class individuals depending on whether description priority
+    # restriction is imposed
+    # Getting all of type 'ont_class', with order and description
+    # restrictions
+    if descr_priority is not None:
+        class_invds = query.getAllOfType(
+            c_type=ont_class,
+            order=order,
+            descr_priority=descr_priority
+        )
+    else:
+        class_invds = query.getAllOfType(
+            c_type=ont_class,
+            order=order
+        )
+
+    # If override function exists for current class, run override
+    if template_query and template_query.overrideExists(c_type=ont_class):
+        class_invds = template_query.overrideByClass(
+            c_type=ont_class,
+            class_invds=class_invds
+        )
+
+    # Apply item overrides (if they exist for current `ont_class`)
+    if ont_class in item_overrides.keys():
+        # Keep if the individual ID is in item overrides
+        # Note: This preserves ordering from retrieval function
+        class_invds = [i for i in class_invds if i['$id']
+            in item_overrides[ont_class]]
+
+    return class_invds
+
+
+def openExtractionSnapshot(snapshot_file: str, namespace: str=None):
+    """Function to open a snapshot of user data in the current process, and to
+    instantiate the query agents extracting classes from it (called once by
+    each worker process extracting classes concurrently; see
+    `TemplateDriver`).
+
+    Arguments:
+        snapshot_file {str} -- Path to the snapshot file.
+
+    Keyword Arguments:
+        namespace {str} -- Namespace IRI of the user data (default: {None}).
+    """
+
+    world = PrecisWorld.fromSnapshot(file_path=snapshot_file)
+    graph = world.getRDFLibGraph()
+
+    _extraction_queries['world'] = world
+    _extraction_queries['query'] = OntQuery(ont=world.ont, graph=graph,
+                                            backend='native',
+                                            namespace=namespace)
+    _extraction_queries['template_query'] = TemplateOntQuery(
+        ont=world.ont, graph=graph, namespace=namespace)
+
+    logging.debug('Opened user data snapshot {0} in process {1}'.format(
+        snapshot_file, os.getpid()))
+
+
+def extractClassJob(ont_class: str, order_overrides: dict,
+                    item_overrides: dict, descr_priority: int=None) -> tuple:
+    """Function to extract the individuals of a class from the user data
+    snapshot opened in the current process (see `openExtractionSnapshot` and
+    `extractClass`).
+
+    Arguments:
+        ont_class {str} -- Ontology class name.
+        order_overrides {dict} -- Order overrides.
+        item_overrides {dict} -- Item overrides.
+
+    Keyword Arguments:
+        descr_priority {int} -- Maximum description priority
+                                (default: {None}).
+
+    Returns:
+        tuple -- Individuals of the class, and the time taken (in seconds).
+    """
+
+    t = time.perf_counter()
+    class_invds = extractClass(query=_extraction_queries['query'],
+        template_query=_extraction_queries['template_query'],
+        ont_class=ont_class, order_overrides=order_overrides,
+        item_overrides=item_overrides, descr_priority=descr_priority)
+
+    return class_invds, time.perf_counter() - t
@@ -0,0 +1,224 @@
+from .. import bootstrap
+from ..cfg import config
+
+import hashlib
+import json
+import logging
+import os
+
+
+class RenderCache():
+    """This module encapsulates a persistent, content-addressed cache of
+    rendered templates.
+
+    Cache entries are keyed by the SHA-256 digest of the render inputs (see
+    `renderKey` and `dataKey`), and are stored as individual files in the cache
+    folder. The cache is bounded in size; when it grows larger than the maximum
+    size, the least recently used entries (by file modification time, which is
+    updated on every hit) are evicted. As entries are written atomically, a
+    cache folder may be shared by several processes.
+
+    The size of the cache is tracked as entries are written, and the cache
+    folder is only scanned when the cache is first written to, and when it
+    grows larger than the maximum size. Entries written by other processes are
+    counted when the cache folder is next scanned.
+    """
+
+    def __init__(self, cache_folder: str=None, max_size: int=None):
+        """RenderCache initialization method. Binds the cache folder and the
+        maximum cache size to class variables, and initializes statistics.
+
+        Keyword Arguments:
+            cache_folder {str} -- Cache folder. The 'renders' folder in the
+                                  Precis cache folder is used if one is not
+                                  provided (default: {None}).
+            max_size {int} -- Maximum cache size, in bytes. The configured
+                              render cache size is used if one is not
+                              provided (default: {None}).
+        """
+
+        if cache_folder is None:
+            cache_folder = os.path.join(config.cache_folder, 'renders')
+        if max_size is None:
+            max_size = config.render_cache_size
+
+        self.cache_folder = cache_folder
+        self.max_size = max_size
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+        # Size of the cache, in bytes (unknown until the cache folder is
+        # scanned; see `put`)
+        self.size = None
+
+    @staticmethod
+    def renderKey(data_file: str, template_digest: str,
+                  user_prefs: dict) -> str:
+        """Function to build the cache key of a template rendered from a user
+        data file (RDF or JSON).
+
+        Arguments:
+            data_file {str} -- Path to the user data file.
+            template_digest {str} -- Template digest (see
+                                     `PrecisTemplate.getDigest`).
+            user_prefs {dict} -- Parsed user template preferences.
+
+        Returns:
+            str -- Cache key.
+        """
+
+        return RenderCache.__digest(contents=[
+            bootstrap.fileDigest(file_path=data_file),
+            template_digest,
+            user_prefs,
+            config.ont_version
+        ])
+
+    @staticmethod
+    def dataKey(template_digest: str, render_data: dict) -> str:
+        """Function to build the cache key of a template rendered from template
+        data (see `PrecisTemplate.renderTemplate`).
+
+        Arguments:
+            template_digest {str} -- Template digest (see
+                                     `PrecisTemplate.getDigest`).
+            render_data {dict} -- Data for the template.
+
+        Returns:
+            str -- Cache key.
+        """
+
+        return RenderCache.__digest(contents=[template_digest, render_data])
+
+    def get(self, key: str) -> str:
+        """Function to get a rendered template from the cache.
+
+        Arguments:
+            key {str} -- Cache key.
+
+        Returns:
+            str -- Rendered template, or None if it is not in the cache.
+        """
+
+        entry_file = self.__entryFile(key=key)
+
+        try:
+            with open(entry_file, encoding='utf-8') as f:
+                output = f.read()
+            # Marking as recently used
+            os.utime(entry_file)
+        except OSError:
+            self.stats['misses'] += 1
+            logging.debug('Render cache miss {0}'.format(key))
+            return None
+
+        self.stats['hits'] += 1
+        logging.debug('Render cache hit {0}'.format(key))
+
+        return output
+
+    def put(self, key: str, output: str):
+        """Function to add a rendered template to the cache, evicting the least
+        recently used entries if the cache exceeds its maximum size. Failures
+        are logged, but are not fatal.
+
+        Arguments:
+            key {str} -- Cache key.
+            output {str} -- Rendered template.
+        """
+
+        entry_file = self.__entryFile(key=key)
+        contents = output.encode('utf-8')
+
+        try:
+            if self.size is None:
+                self.size = sum(size for _, _, size in self.__listEntries())
+
+            # Size of the entry replaced by this entry (if any)
+            try:
+                replaced_size = os.stat(entry_file).st_size
+            except OSError:
+                replaced_size = 0
+
+            bootstrap.atomicWrite(file_path=entry_file, contents=contents)
+            self.size += len(contents) - replaced_size
+
+            if self.size > self.max_size:
+                self.__evict()
+        except OSError:
+            logging.warning('Render cache folder {0} is not writable'.format(
+                self.cache_folder))
+
+    def cacheInfo(self) -> dict:
+        """Function to get render cache statistics.
+
+        Returns:
+            dict -- Number of cache hits, misses and evictions, and the number
+                    of entries and total size (in bytes) of the cache.
+        """
+
+        entries = self.__listEntries()
+
+        return dict(hits=self.stats['hits'], misses=self.stats['misses'],
+                    evictions=self.stats['evictions'], entries=len(entries),
+                    size=sum(size for _, _, size in entries))
+
+    def clear(self):
+        """Function to remove all entries from the cache, and reset statistics.
+        """
+
+        for entry_file, _, _ in self.__listEntries():
+            try:
+                os.remove(entry_file)
+            except OSError:
+                pass
+
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self.size = None
+
+    def __evict(self):
+        # Removing least recently used entries until the cache fits
+        entries = sorted(self.__listEntries(), key=lambda entry: entry[1])
+        size = sum(entry_size for _, _, entry_size in entries)
+
+        for entry_file, _, entry_size in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(entry_file)
+            except OSError:
+                continue
+            size -= entry_size
+            self.stats['evictions'] += 1
+            logging.debug('Evicted render cache entry {0}'.format(entry_file))
+
+        self.size = size
+
+    def __listEntries(self) -> list:
+        # Cache entries, as (path, last used time, size)
+        entries = list()
+
+        try:
+            files = os.scandir(self.cache_folder)
+        except OSError:
+            return entries
+
+        with files:
+            for f in files:
+                if not f.name.endswith('.tex'): continue
+                try:
+                    stat = f.stat()
+                except OSError:
+                    continue
+                entries.append((f.path, stat.st_mtime, stat.st_size))
+
+        return entries
+
+    def __entryFile(self, key: str) -> str:
+        return os.path.join(self.cache_folder, '{0}.tex'.format(key))
+
+    @staticmethod
+    def __digest(contents: list) -> str:
+        # Canonical JSON representation (values that are not JSON-serializable,
+        # such as dates, are represented as strings)
+        return hashlib.sha256(json.dumps(contents, sort_keys=True,
+            default=str).encode('utf-8')).hexdigest()
@@ -0,0 +1,234 @@
+from .batch import BatchJob, BatchResult, renderJob, warmUp
+from .render_cache import RenderCache
+
+import json
+import logging
+import os
+import socket
+import socketserver
+
+
+class RenderServer():
+    """This module encapsulates a local rendering daemon, answering rendering
+    requests (see `RenderClient`) over a Unix domain socket.
+
+    The server process is pre-warmed once, when the server is started (see
+    `warmUp`); it loads the Precis ontology, prepares template queries, and
+    loads and compiles the given templates. Rendering requests are then served
+    without paying for interpreter start-up, ontology loading or template
+    compilation. Requests are handled one at a time, in the server process,
+    with the user data of each request loaded into an isolated world (see
+    `renderJob`).
+
+    Requests and responses are JSON objects, one per line. A request is either
+    a rendering job (the fields of `BatchJob`; paths must be absolute, or
+    relative to the working directory of the server), answered with the
+    fields of `BatchResult`, or a command ({"command": "ping"} or
+    {"command": "shutdown"}), answered with {"status": "ok"}.
+    """
+
+    def __init__(self, socket_path: str, template_folders: list=[],
+                 render_cache: RenderCache=None):
+        """RenderServer initialization method. Pre-warms the server process,
+        and binds the server to the socket.
+
+        Arguments:
+            socket_path {str} -- Path of the Unix domain socket. A stale socket
+                                 file at this path is replaced.
+
+        Keyword Arguments:
+            template_folders {list} -- Paths of template folders to be loaded
+                                       when the server is started
+                                       (default: {[]}).
+            render_cache {RenderCache} -- Render cache (default: {None}).
+        """
+
+        self.socket_path = socket_path
+        self.render_cache = render_cache
+        self.stats = {'requests': 0, 'errors': 0}
+        self.stopped = False
+
+        warmUp(template_folders=template_folders)
+
+        # Replacing stale socket file (left by a server that was not closed)
+        if os.path.exists(self.socket_path):
+            if RenderClient(socket_path=self.socket_path).isAlive():
+                message = 'A render server is already running on {0}'.format(
+                    self.socket_path)
+                logging.error(message)
+                raise OSError(message)
+            os.remove(self.socket_path)
+
+        self.server = socketserver.UnixStreamServer(self.socket_path,
+                                                    self.__handlerClass())
+
+        logging.info('Render server listening on {0}'.format(self.socket_path))
+
+    def serveForever(self):
+        """Function to serve requests until the server is shut down (with a
+        'shutdown' command, or an interrupt). The server is closed on exit.
+        """
+
+        try:
+            while not self.stopped:
+                self.server.handle_request()
+        except KeyboardInterrupt:
+            logging.info('Render server interrupted')
+        finally:
+            self.close()
+
+    def close(self):
+        """Function to close the server, and remove its socket file.
+        """
+
+        self.server.server_close()
+        try:
+            os.remove(self.socket_path)
+        except OSError:
+            pass
+
+        logging.info('Render server closed after {0} requests'.format(
+            self.stats['requests']))
+
+    def handleRequest(self, request: dict) -> dict:
+        """Function to answer a request (see the class documentation).
+
+        Arguments:
+            request {dict} -- Parsed request.
+
+        Returns:
+            dict -- Response.
+        """
+
+        command = request.get('command', 'render')
+
+        if command == 'ping':
+            return {'status': 'ok'}
+        elif command == 'shutdown':
+            # The serving loop exits once this request has been answered
+            self.stopped = True
+            return {'status': 'ok'}
+        elif command != 'render':
+            return {'status': 'error',
+                    'error': 'Invalid command {0}'.format(command)}
+
+        self.stats['requests'] += 1
+        try:
+            job = BatchJob(**{k: v for k, v in request.items()
+                              if k != 'command'})
+        except TypeError as e:
+            self.stats['errors'] += 1
+            return {'status': 'error', 'error': str(e)}
+
+        result = renderJob(job=job, render_cache=self.render_cache)
+        if result.error:
+            self.stats['errors'] += 1
+
+        return dict(result._asdict(), job=job._asdict(), status='ok')
+
+    def __handlerClass(self) -> type:
+        # Request handler bound to this server (one request per connection)
+        render_server = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    request = json.loads(self.rfile.readline().decode('utf-8'))
+                    response = render_server.handleRequest(request=request)
+                except ValueError as e:
+                    response = {'status': 'error',
+                                'error': 'Malformed request: {0}'.format(e)}
+                self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+        return RequestHandler
+
+
+class RenderClient():
+    """This module encapsulates a client of a local rendering daemon (see
+    `RenderServer`). It does not load the Precis ontology.
+    """
+
+    def __init__(self, socket_path: str):
+        """RenderClient initialization method.
+
+        Arguments:
+            socket_path {str} -- Path of the Unix domain socket of the server.
+        """
+
+        self.socket_path = socket_path
+
+    def render(self, job: BatchJob) -> BatchResult:
+        """Function to run a rendering job on the server. Relative paths in
+        the job are resolved against the working directory of the client.
+
+        Arguments:
+            job {BatchJob} -- Rendering job.
+
+        Raises:
+            OSError -- Raised when the server cannot be reached.
+
+        Returns:
+            BatchResult -- Job result.
+        """
+
+        def absolute(path: str) -> str:
+            return os.path.abspath(path) if path else path
+
+        job = job._replace(data_file=absolute(job.data_file),
+                           template_folder=absolute(job.template_folder),
+                           prefs_file=absolute(job.prefs_file),
+                           output_file=absolute(job.output_file),
+                           override_files=tuple(absolute(f)
+                                                for f in job.override_files))
+
+        response = self.request(request=dict(job._asdict(), command='render'))
+        if response['status'] != 'ok':
+            return BatchResult(job=job, output=None, error=response['error'],
+                               timings=dict(), worker=None)
+
+        return BatchResult(job=job, output=response['output'],
+                           error=response['error'],
+                           timings=response['timings'],
+                           worker=response['worker'])
+
+    def isAlive(self) -> bool:
+        """Flag to check if the server is running.
+
+        Returns:
+            bool -- True if the server answered a 'ping' command.
+        """
+
+        try:
+            return self.request(request={'command': 'ping'})['status'] == 'ok'
+        except (OSError, ValueError):
+            return False
+
+    def shutdown(self):
+        """Function to shut the server down (once the current request has been
+        answered).
+
+        Raises:
+            OSError -- Raised when the server cannot be reached.
+        """
+
+        self.request(request={'command': 'shutdown'})
+
+    def request(self, request: dict) -> dict:
+        """Function to send a request to the server, and wait for its response.
+
+        Arguments:
+            request {dict} -- Request (see `RenderServer`).
+
+        Raises:
+            OSError -- Raised when the server cannot be reached.
+
+        Returns:
+            dict -- Response.
+        """
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            with sock.makefile('rwb') as f:
+                f.write(json.dumps(request).encode('utf-8') + b'\n')
+                f.flush()
+                return json.loads(f.readline().decode('utf-8'))
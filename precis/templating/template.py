@@ -1,8 +1,11 @@
 from . import util
+from .bytecode_cache import TemplateBytecodeCache
+from .render_cache import RenderCache
 from ..cfg import config
 
-from jinja2 import Environment, FileSystemLoader, TemplateSyntaxError
+from jinja2 import Environment, FileSystemLoader
 from yaml import load as yaml_load, SafeLoader
+import hashlib
 import logging
 import os
 
@@ -19,17 +22,36 @@ class PrecisTemplate():
     underlying template, given user data.
     """
 
-    def __init__(self, template_folder: str):
+    def __init__(self, template_folder: str,
+                 bytecode_cache: TemplateBytecodeCache=None):
         """Template initialization method. Validates a candidate template, given
-        its folder path. Binds necessary data to class variables to enable
-        getter functionality.
+        its folder path, compiling it once. Binds necessary data to class
+        variables to enable getter functionality.
+
+        If a bytecode cache is provided (or if the persistent cache is enabled
+        in the configuration), the compiled template is kept in the cache (see
+        `TemplateBytecodeCache`), so that it is not compiled again in other
+        processes, unless the template changes.
         
         Arguments:
             template_folder {str} -- Path to the template folder.
+
+        Keyword Arguments:
+            bytecode_cache {TemplateBytecodeCache} -- Template bytecode cache
+                                                      (default: {None}).
         """
 
-        # Validating candidate template
-        util.validateTemplate(template_folder=template_folder)
+        # Setting up Jinja2 environment, with the bytecode cache
+        # See: http://bit.ly/2VTzOcb
+        if bytecode_cache is None and config.template_bytecode_cache:
+            bytecode_cache = TemplateBytecodeCache()
+        self.env = Environment(loader=FileSystemLoader(
+                searchpath=template_folder
+            ), bytecode_cache=bytecode_cache, **config.jinja_env_config)
+
+        # Validating candidate template (compiling it with the environment)
+        self.template = util.validateTemplate(template_folder=template_folder,
+                                              env=self.env)
         logging.debug('Successfully validated template in {0}'.format(
             template_folder))
 
@@ -46,14 +68,13 @@ class PrecisTemplate():
             logging.debug('Loaded template configuration file {0}'.format(
                 f.name))
 
-        # Setting up Jinja2 environment and template
-        # See: http://bit.ly/2VTzOcb
-        self.env = Environment(loader=FileSystemLoader(
-                searchpath=template_folder
-            ), **config.jinja_env_config)
-        self.template = self.env.get_template(
-                name=config.template_files['template']
-            )
+        # Computing template digest (over the template and its configuration)
+        template_hash = hashlib.sha256()
+        for template_file in [self.template_file, os.path.join(template_folder,
+            config.template_files['config'])]:
+            with open(template_file, 'rb') as f:
+                template_hash.update(f.read())
+        self.digest = template_hash.hexdigest()
 
     def getTemplateConfiguration(self) -> dict:
         """Function to get the complete template configuration.
@@ -110,15 +131,44 @@ class PrecisTemplate():
         
         return set(self.template_config['required_classes'])
 
-    def renderTemplate(self, render_data: dict) -> str:
+    def getDigest(self) -> str:
+        """Function to get the SHA-256 digest of the template file and the
+        template configuration file.
+
+        Returns:
+            str -- Template digest.
+        """
+
+        return self.digest
+
+    def renderTemplate(self, render_data: dict,
+                       render_cache: RenderCache=None) -> str:
         """Function to render the template file, given rendering data pusuant
         to the restrictions in the template configuration file.
+
+        If a render cache is provided, the rendered template is looked up by
+        the template digest and the rendering data, and added to the cache if
+        it is not found.
         
         Arguments:
             render_data {dict} -- Data for the template.
+
+        Keyword Arguments:
+            render_cache {RenderCache} -- Render cache (default: {None}).
         
         Returns:
             str -- Rendered template.
         """
 
-        return self.template.render(render_data)
+        if render_cache is None:
+            return self.template.render(render_data)
+
+        key = RenderCache.dataKey(template_digest=self.digest,
+                                  render_data=render_data)
+        output = render_cache.get(key=key)
+        if output is None:
+            output = self.template.render(render_data)
+            render_cache.put(key=key, output=output)
+
+        return output
+
@@ -1,6 +1,7 @@
 from ..cfg import config
 
-from jinja2 import Environment, TemplateSyntaxError
+from jinja2 import Environment, FileSystemLoader, Template, \
+    TemplateSyntaxError
 from yaml import load as yaml_load, SafeLoader
 from yaml.parser import ParserError
 import logging
@@ -31,14 +32,20 @@ def listAllTemplateFolders() -> list:
     return available_template_folders
 
 
-def validateTemplate(template_folder: str):
+def validateTemplate(template_folder: str, env: Environment=None) -> Template:
     """Function to validate a template, given its folder path. Verifies that the
     folder contains the necessary files that compose a template, that the Jinja
-    file is valid, and that the template configuration file has the
-    necessary attributes.
+    file is valid (by compiling it), and that the template configuration file
+    has the necessary attributes.
     
     Arguments:
         template_folder {str} -- Path to the template folder.
+
+    Keyword Arguments:
+        env {Environment} -- Jinja environment to compile the template with; an
+                             environment with the Precis Jinja configuration,
+                             loading templates from the template folder, is
+                             used if one is not provided (default: {None}).
     
     Raises:
         AttributeError -- Raised when the template configuration file does not
@@ -48,6 +55,9 @@ def validateTemplate(template_folder: str):
         ParserError -- Raised when the template configuration file has
                        malformed YAML syntax.
         TemplateSyntaxError -- Raised when the Jinja template is invalid.
+
+    Returns:
+        Template -- Compiled Jinja template.
     """
 
     template_file_set = set(os.listdir(path=template_folder))
@@ -66,16 +76,18 @@ def validateTemplate(template_folder: str):
     template_file = os.path.join(template_folder,
                                  config.template_files['template'])
 
-    # Checking template validity
-    with open(template_file) as f:
-        try:
-            env = Environment()
-            env.parse(source=f.read())
-            logging.debug('Template Jinja {0} validated'.format(template_file))
-        except TemplateSyntaxError:
-            message = 'Template file {0} is invalid'.format(template_file)
-            logging.error(message)
-            raise
+    # Checking template validity (the compiled template is returned, so that
+    # it is not compiled again)
+    if env is None:
+        env = Environment(loader=FileSystemLoader(searchpath=template_folder),
+                          **config.jinja_env_config)
+    try:
+        template = env.get_template(name=config.template_files['template'])
+        logging.debug('Template Jinja {0} validated'.format(template_file))
+    except TemplateSyntaxError:
+        message = 'Template file {0} is invalid'.format(template_file)
+        logging.error(message)
+        raise
 
     # Checking template configuration validity
     with open(template_config_file) as f:
@@ -103,3 +115,5 @@ def validateTemplate(template_folder: str):
                 template_config_file))
 
     logging.debug('Validated template in {0}'.format(template_folder))
+
+    return template
@@ -1,19 +1,34 @@
-import collections
+from io import TextIOWrapper
+from typing import Iterator
+import collections.abc
 import json
 import logging
 
 
-def buildData(data_file: str, override_files: list=[]) -> dict:
-    """Initializes the static configuration variables used in the
-    PaperRank system. Provides a method to override base configuration.
+def buildData(data_file: str, override_files: list=[]) -> list:
+    """Function to build user data from a base data file, and a list of
+    override data files applied in ascending order of specificity; i.e.
+    data_file < override 1 < override 2 < ... < override n.
+
+    Precis data files (top-level JSONArrays) are overridden object by object
+    (see `applyArrayOverride`); other JSON documents are overridden key by key
+    (see `applyOverride`).
+
+    Arguments:
+        data_file {str} -- File path of the base JSON data file.
 
     Keyword Arguments:
-        override {str} -- File name in the `config/` directory
-            that may be used to override the `base.json` configuration
-            (default: {''}).
+        override_files {list} -- File paths of JSON override data files
+                                 (default: {[]}).
 
     Raises:
-        RuntimeError -- Raised when configuration files cannot be found.
+        FileNotFoundError -- Raised if a data file is not found.
+        JSONDecodeError -- Raised if there is an error parsing a data file.
+        TypeError -- Raised if an override file is not of the same type
+                     (JSONArray or JSONObject) as the base data file.
+
+    Returns:
+        list -- Built user data (dict, if the base data file is a JSONObject).
     """
 
     # Parsing base data file
@@ -22,7 +37,16 @@ def buildData(data_file: str, override_files: list=[]) -> dict:
     # Iterate through override files, parse and apply each to base data file
     for override_file in override_files:
         override_data = parseJSON(file_path=override_file)
-        data = applyOverride(base_dict=data, override_dict=override_data)
+        if type(override_data) is not type(data):
+            message = 'Override file {0} is not of the same type as data \
+                file {1}'.format(override_file, data_file)
+            logging.error(message)
+            raise TypeError(message)
+        if isinstance(data, list):
+            data = applyArrayOverride(base_array=data,
+                                      override_array=override_data)
+        else:
+            data = applyOverride(base_dict=data, override_dict=override_data)
 
     return data
 
@@ -67,8 +91,144 @@ def applyOverride(base_dict: dict, override_dict: dict) -> dict:
     """
 
     for k, v in override_dict.items():
-        if isinstance(v, collections.Mapping):
+        if isinstance(v, collections.abc.Mapping):
             base_dict[k] = applyOverride(base_dict.get(k, {}), v)
         else:
             base_dict[k] = v
     return base_dict
+
+
+def applyArrayOverride(base_array: list, override_array: list) -> list:
+    """Function to apply an override to a Precis data JSONArray with objects
+    from another. Objects in the override array with the same '$id' as a
+    top-level object in the base array are applied to it (see
+    `applyOverride`); other objects are appended to the base array, in order.
+
+    Arguments:
+        base_array {list} -- Base JSONArray.
+        override_array {list} -- Override JSONArray.
+
+    Returns:
+        list -- Updated JSONArray.
+    """
+
+    # Index of identified top-level objects in the base array
+    base_objects = {obj['$id']: obj for obj in base_array
+                    if isinstance(obj, collections.abc.Mapping) and
+                    '$id' in obj}
+
+    for obj in override_array:
+        if isinstance(obj, collections.abc.Mapping) and \
+            obj.get('$id') in base_objects:
+            applyOverride(base_dict=base_objects[obj['$id']],
+                          override_dict=obj)
+        else:
+            base_array.append(obj)
+    return base_array
+
+
+def iterJSONArray(file_obj: TextIOWrapper, chunk_size: int=2 ** 16,
+                  object_pairs_hook: type=None) -> Iterator[object]:
+    """Function to incrementally parse a top-level JSONArray from a file,
+    yielding one element at a time (in order). Only the current element, and a
+    chunk of the file are held in memory at any given time. Elements larger
+    than a chunk are buffered geometrically (doubling the buffered text before
+    decoding them again), so that they are decoded a logarithmic number of
+    times.
+
+    Arguments:
+        file_obj {TextIOWrapper} -- Target JSON file object.
+
+    Keyword Arguments:
+        chunk_size {int} -- Number of characters read from the file at a time
+                            (default: {2 ** 16}).
+        object_pairs_hook {type} -- Object pairs hook passed to the JSON
+                                    decoder (eg: OrderedDict) (default: {None}).
+
+    Raises:
+        JSONDecodeError -- Raised when the file is not a well-formed JSONArray
+                           (including when there is data after the array).
+
+    Yields:
+        object -- Parsed elements of the JSONArray.
+    """
+
+    decoder = json.JSONDecoder(object_pairs_hook=object_pairs_hook)
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def fill(size: int=0) -> bool:
+        # Reading chunks into the buffer (dropping consumed characters), until
+        # at least `size` characters are buffered (reading at least one chunk)
+        nonlocal buffer, pos, eof
+        chunks = [buffer[pos:]]
+        buffered = len(chunks[0])
+        while True:
+            chunk = file_obj.read(chunk_size)
+            eof = len(chunk) == 0
+            chunks.append(chunk)
+            buffered += len(chunk)
+            if eof or (buffered >= size):
+                break
+        buffer = ''.join(chunks)
+        pos = 0
+        return not eof
+
+    def nextToken() -> str:
+        # Skipping whitespace, returning the next character ('' at EOF)
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return buffer[pos:pos + 1]
+
+    def malformed(expected: str):
+        raise json.decoder.JSONDecodeError('Expecting {0}'.format(expected),
+                                           buffer, pos)
+
+    def finish():
+        # Only whitespace may follow the array (as in `json.load`)
+        nonlocal pos
+        pos += 1
+        if nextToken() != '':
+            raise json.decoder.JSONDecodeError('Extra data', buffer, pos)
+
+    if nextToken() != '[':
+        malformed(expected="'['")
+    pos += 1
+
+    # Empty array
+    if nextToken() == ']':
+        finish()
+        return
+
+    while True:
+        # Decoding the next element, reading more of the file if the element
+        # is incomplete in the current buffer
+        nextToken()
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+                # A number may be cut off at the end of the buffer, so the
+                # element must be followed by a delimiter (or EOF)
+                if eof or (end < len(buffer) and buffer[end] in ' \t\n\r,]'):
+                    break
+            except json.decoder.JSONDecodeError:
+                if eof:
+                    raise
+            if not fill(size=2 * (len(buffer) - pos)) and \
+                buffer[pos:].strip() == '':
+                malformed(expected='value')
+        pos = end
+        yield element
+
+        # Element separator, or end of the array
+        token = nextToken()
+        if token == ']':
+            finish()
+            return
+        elif token != ',':
+            malformed(expected="',' or ']'")
+        pos += 1
@@ -0,0 +1,394 @@
+from . import bootstrap
+from .cfg import config
+
+from owlready2 import default_world, World
+from owlready2.namespace import Namespace
+import owlready2.namespace
+import owlready2.prop
+from owlready2.rdflib_store import TripleLiteRDFlibGraph
+import collections.abc
+import logging
+import os
+import sqlite3
+
+
+# owlready2 versions whose private module-level caches are used (see
+# `owlreadyCaches`)
+OWLREADY2_CACHE_VERSIONS = ['0.14']
+
+def owlreadyCaches() -> tuple:
+    """Function to get the private, module-level caches of owlready2 (shared by
+    all worlds); namely, the cache of recently used entities, and the cache of
+    functional properties. owlready2 has no public API for these caches, so
+    they are only used with the owlready2 versions they are known for (see
+    `OWLREADY2_CACHE_VERSIONS`); with other versions, Precis worlds do not
+    seed or release them (functional flags are then computed by owlready2, and
+    entities of closed worlds are released when they are evicted).
+
+    Returns:
+        tuple -- Entity cache (list) and functional property cache (mapping),
+                 or (None, None) if they are not available.
+    """
+
+    if owlready2.VERSION not in OWLREADY2_CACHE_VERSIONS:
+        logging.debug('owlready2 caches are not used with owlready2 {0}'.format(
+            owlready2.VERSION))
+        return None, None
+
+    entity_cache = getattr(owlready2.namespace, '_cache', None)
+    functional_cache = getattr(owlready2.prop, '_FUNCTIONAL_FOR_CACHE', None)
+    if not isinstance(entity_cache, list) or not isinstance(functional_cache,
+        collections.abc.MutableMapping):
+        logging.warning('owlready2 {0} caches were not found'.format(
+            owlready2.VERSION))
+        return None, None
+
+    return entity_cache, functional_cache
+
+
+
+class PrecisWorld():
+    """This module encapsulates an owlready2 world containing the Precis
+    ontology, together with the class and property lookup maps bound to the
+    entities of that world.
+
+    By default, a new world is created, isolated from the owlready2 default
+    world (and from every other world), such that user data loaded into it
+    (see `Loader`) is not visible to queries over other worlds. The Precis
+    ontology is loaded into the new world from the local ontology cache (see
+    `bootstrap.resolveOntologyFile`), without being downloaded or validated
+    again. A world can be closed once it is no longer needed, freeing its
+    quadstore.
+
+    The owlready2 default world (used by Precis before isolated worlds were
+    introduced) is available with `PrecisWorld.default`.
+
+    The quadstore of a world can be saved to a binary snapshot file (see
+    `saveSnapshot`), which is attached in place when it is opened (see
+    `fromSnapshot`), without parsing any RDF.
+
+    A world can also be persistent (see `open`), storing the user data of any
+    number of people (one namespace per person; see `Loader`) in an on-disk
+    quadstore, which is read on demand. The user data of a person is queried
+    directly from the quadstore (see `OntQuery` and `TemplateDriver`), without
+    being loaded into memory.
+    """
+
+    # Header of SQLite database files (i.e. quadstore snapshots)
+    __snapshotHeader = b'SQLite format 3\x00'
+
+    # Precis world wrapping the owlready2 default world (see `default`)
+    __default = None
+
+    def __init__(self, world: World=None):
+        """PrecisWorld initialization method. Loads the Precis ontology into the
+        target world, and binds the class and property lookup maps to its
+        entities.
+
+        Keyword Arguments:
+            world {World} -- Target owlready2 world. A new, isolated world is
+                             created if one is not provided (default: {None}).
+        """
+
+        # Loading the Precis ontology (if not loaded already)
+        bootstrap.initialize()
+
+        if world is None:
+            world = World()
+
+        # Loading the Precis ontology into the target world (unless the world
+        # is a snapshot already containing it)
+        if world is config.ont.world:
+            self.ont = config.ont
+        elif config.ont_base_iri in world.ontologies:
+            self.ont = world.ontologies[config.ont_base_iri]
+        else:
+            self.ont = bootstrap.loadOntology(ont_file=config.ont_file,
+                                              world=world)
+
+        self.world = world
+        self.file_path = None
+        self.bulk = False
+
+        # Binding lookup maps to the entities of the target world
+        self.object_properties = self.__bindLookupMap(
+            lookup_map=config.object_properties)
+        self.ont_classes = self.__bindLookupMap(lookup_map=config.ont_classes)
+        self.data_properties = self.__bindLookupMap(
+            lookup_map=config.data_properties)
+
+        # Seeding the owlready2 functional property cache (queried whenever
+        # properties of individuals are set) from the property table
+        self.__seedFunctionalCache()
+
+        logging.debug('Initialized Precis world with {0} triples'.format(
+            len(self.world.graph)))
+
+    @classmethod
+    def default(self) -> 'PrecisWorld':
+        """Function to get the Precis world wrapping the owlready2 default
+        world.
+
+        Returns:
+            PrecisWorld -- Default Precis world.
+        """
+
+        if self.__default is None:
+            self.__default = self(world=default_world)
+
+        return self.__default
+
+    @classmethod
+    def fromSnapshot(self, file_path: str) -> 'PrecisWorld':
+        """Function to open a quadstore snapshot (see `saveSnapshot`) as a
+        Precis world. The snapshot is attached in place (i.e. it is read on
+        demand, and is not parsed or copied into memory), and must not be
+        modified.
+
+        Arguments:
+            file_path {str} -- Path to the snapshot file.
+
+        Raises:
+            ValueError -- Raised when the file is not a quadstore snapshot.
+
+        Returns:
+            PrecisWorld -- Precis world attached to the snapshot.
+        """
+
+        if not self.isSnapshot(file_path=file_path):
+            message = 'File {0} is not a Precis world snapshot'.format(
+                file_path)
+            logging.error(message)
+            raise ValueError(message)
+
+        # Note: The snapshot is not locked, so it can be shared by processes
+        return self(world=World(filename=os.path.abspath(file_path),
+                                exclusive=False))
+
+    @classmethod
+    def open(self, file_path: str, bulk: bool=False) -> 'PrecisWorld':
+        """Function to open a persistent Precis world, backed by an on-disk
+        quadstore (created if it does not exist). Changes to the world are
+        committed to the quadstore with `save`, by a `Loader` once a document
+        is loaded, and when the world is closed.
+
+        The quadstore uses write-ahead logging, such that it can be read by
+        other processes (eg: opened with `fromSnapshot`) while it is written.
+        In bulk mode, changes are only committed with `save` (or when the world
+        is closed), and are not synced to disk (i.e. an interrupted ingest may
+        be lost), which speeds up ingesting many documents.
+
+        Arguments:
+            file_path {str} -- Path to the quadstore file.
+
+        Keyword Arguments:
+            bulk {bool} -- Flag to open the world in bulk mode
+                           (default: {False}).
+
+        Returns:
+            PrecisWorld -- Persistent Precis world.
+        """
+
+        world = World(filename=os.path.abspath(file_path), exclusive=False)
+        world.graph.execute('PRAGMA journal_mode = WAL')
+        if bulk:
+            world.graph.execute('PRAGMA synchronous = OFF')
+
+        precis_world = self(world=world)
+        precis_world.file_path = file_path
+        precis_world.bulk = bulk
+        precis_world.save()
+
+        logging.debug('Opened persistent Precis world {0}{1}'.format(
+            file_path, ' (bulk mode)' if bulk else ''))
+
+        return precis_world
+
+    @classmethod
+    def isSnapshot(self, file_path: str) -> bool:
+        """Flag to check if a file is a quadstore snapshot (see
+        `saveSnapshot`).
+
+        Arguments:
+            file_path {str} -- Path to the file.
+
+        Returns:
+            bool -- True if the file is a quadstore snapshot.
+        """
+
+        with open(file_path, 'rb') as f:
+            return f.read(len(self.__snapshotHeader)) == self.__snapshotHeader
+
+    def saveSnapshot(self, file_path: str):
+        """Function to save the quadstore of this world (i.e. the Precis
+        ontology, and all individuals in it) to a binary snapshot file, that
+        can be opened without parsing RDF (see `fromSnapshot`). The snapshot is
+        written atomically.
+
+        Arguments:
+            file_path {str} -- Path to the snapshot file.
+        """
+
+        self.world.graph.commit()
+
+        tmp_path = '{0}.{1}.tmp'.format(file_path, os.getpid())
+        try:
+            snapshot = sqlite3.connect(tmp_path)
+            try:
+                self.world.graph.db.backup(snapshot)
+                self.__mergeOntologies(snapshot=snapshot)
+            finally:
+                snapshot.close()
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logging.debug('Saved Precis world snapshot to {0}'.format(file_path))
+
+    def isPersistent(self) -> bool:
+        """Flag to check if this Precis world is persistent (see `open`).
+
+        Returns:
+            bool -- True if this is a persistent Precis world.
+        """
+
+        return self.file_path is not None
+
+    def save(self):
+        """Function to commit changes to the quadstore of a persistent Precis
+        world (see `open`). Has no effect on other worlds.
+        """
+
+        if self.isPersistent():
+            self.world.graph.commit()
+
+    def isDefault(self) -> bool:
+        """Flag to check if this Precis world wraps the owlready2 default world.
+
+        Returns:
+            bool -- True if this is the default Precis world.
+        """
+
+        return self.world is default_world
+
+    def getNamespace(self, namespace: str) -> Namespace:
+        """Function to get a namespace in the Precis ontology of this world.
+
+        Arguments:
+            namespace {str} -- Namespace IRI.
+
+        Returns:
+            Namespace -- Namespace in this world.
+        """
+
+        return self.ont.get_namespace(namespace)
+
+    def getRDFLibGraph(self) -> TripleLiteRDFlibGraph:
+        """Function to get the rdflib graph representation of this world.
+
+        Returns:
+            TripleLiteRDFlibGraph -- RDFlib compatible graph.
+        """
+
+        return self.world.as_rdflib_graph()
+
+    def close(self):
+        """Function to close this Precis world, freeing its quadstore (changes
+        to persistent worlds are committed first). The world, and any
+        ontology, namespace or individual in it, must not be used after it is
+        closed.
+
+        Raises:
+            ValueError -- Raised when closing the default Precis world.
+        """
+
+        if self.isDefault():
+            message = 'The default Precis world cannot be closed'
+            logging.error(message)
+            raise ValueError(message)
+
+        self.save()
+        self.world.close()
+
+        # Releasing references to entities of the closed world held by owlready2
+        # module-level caches (see `owlreadyCaches`)
+        entity_cache, functional_cache = owlreadyCaches()
+        if entity_cache is not None:
+            for i, entity in enumerate(entity_cache):
+                if (entity is not None) and self.__inWorld(entity=entity):
+                    entity_cache[i] = None
+            for entity in list(functional_cache.keys()):
+                if self.__inWorld(entity=entity):
+                    del functional_cache[entity]
+
+        # Releasing references to entities of the closed world
+        self.ont = None
+        self.object_properties = dict()
+        self.ont_classes = dict()
+        self.data_properties = dict()
+
+        logging.debug('Closed Precis world')
+
+    @staticmethod
+    def __mergeOntologies(snapshot: sqlite3.Connection):
+        """Function to merge ontologies sharing an IRI in a snapshot into the
+        first of them (eg: an RDF file exported by Precis, declaring the IRI of
+        the Precis ontology, loaded into a world holding the Precis ontology),
+        as owlready2 cannot open quadstores with such ontologies.
+
+        Arguments:
+            snapshot {sqlite3.Connection} -- Connection to the snapshot.
+        """
+
+        duplicates = snapshot.execute("""
+            SELECT duplicate.c, MIN(original.c) FROM ontologies duplicate
+            JOIN ontologies original ON original.iri = duplicate.iri
+                AND original.c < duplicate.c
+            GROUP BY duplicate.c""").fetchall()
+        if not duplicates:
+            return
+
+        # Triple tables (depending on the owlready2 version)
+        tables = [row[0] for row in snapshot.execute("""
+            SELECT name FROM sqlite_master WHERE type = 'table'
+                AND name IN ('quads', 'objs', 'datas')""")]
+
+        for c, original_c in duplicates:
+            for table in tables:
+                snapshot.execute('UPDATE {0} SET c = ? WHERE c = ?'.format(
+                    table), (original_c, c))
+            snapshot.execute('DELETE FROM ontologies WHERE c = ?', (c,))
+        snapshot.commit()
+
+        logging.debug('Merged {0} ontologies sharing an IRI in snapshot'.format(
+            len(duplicates)))
+
+    def __inWorld(self, entity) -> bool:
+        # Flag to check if an owlready2 entity belongs to this world
+        namespace = getattr(entity, 'namespace', None)
+        return (namespace is not None) and (namespace.world is self.world)
+
+    def __seedFunctionalCache(self):
+        # Functional flags of (class, property) pairs of this world, from the
+        # property table (see `bootstrap.buildPropertyTable`), such that they
+        # are not computed from class restrictions by owlready2 in each world
+        _, functional_cache = owlreadyCaches()
+        if functional_cache is None:
+            return
+
+        ont_properties = dict(self.object_properties, **self.data_properties)
+        ont_properties['hasDescription'] = self.ont.hasDescription
+        for (class_name, property_name), schema in \
+            config.property_table.items():
+            if (class_name in self.ont_classes) and \
+                (property_name in ont_properties):
+                functional_cache.setdefault(self.ont_classes[class_name],
+                    dict())[ont_properties[property_name]] = \
+                    schema['functional']
+
+    def __bindLookupMap(self, lookup_map: dict) -> dict:
+        # Rebinding a lookup map (bound to the default world) to this world
+        return bootstrap.bindLookupMap(ont=self.ont, iri_map={
+            name: entity.iri for name, entity in lookup_map.items()})
@@ -19,5 +19,8 @@ setup(
     url="https://github.com/rukmal/precis",
     install_requires=requirements_list,
     include_package_data=True,
-    python_requires=">=3.6"
+    entry_points={
+        "console_scripts": ["precis=precis.cli:main"]
+    },
+    python_requires=">=3.7"
 )
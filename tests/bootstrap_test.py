@@ -0,0 +1,158 @@
+from context import precis
+from precis.world import OWLREADY2_CACHE_VERSIONS, owlreadyCaches
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import unittest
+
+
+class TestBootstrap(unittest.TestCase):
+    """Test the `bootstrap` module.
+    """
+
+    def setUp(self):
+        # Ensuring the ontology is loaded (it is loaded lazily)
+        precis.bootstrap.initialize()
+
+        # Using an empty, temporary cache folder for each test
+        self.cache_folder = tempfile.TemporaryDirectory()
+        self.original_cache_folder = precis.config.cache_folder
+        precis.config.cache_folder = self.cache_folder.name
+
+    def tearDown(self):
+        precis.config.cache_folder = self.original_cache_folder
+        self.cache_folder.cleanup()
+
+    def test_resolveOntologyFile(self):
+        """Tests that the cache is seeded from the bundled ontology, and that
+        the cached copy is content-addressed.
+        """
+
+        ont_file = precis.bootstrap.resolveOntologyFile(
+            version=precis.config.ont_version)
+
+        # Cached copy is named by, and matches, the pinned checksum
+        digest = precis.config.ont_checksums[precis.config.ont_version]
+        self.assertEqual(os.path.basename(ont_file), digest + '.rdf')
+        self.assertEqual(precis.bootstrap.fileDigest(file_path=ont_file),
+                         digest)
+
+    def test_resolveCorruptOntologyFile(self):
+        """Tests that a corrupted cache entry is replaced.
+        """
+
+        ont_file = precis.bootstrap.resolveOntologyFile(
+            version=precis.config.ont_version)
+
+        # Corrupting cached file
+        with open(ont_file, 'w') as f:
+            f.write('corrupted')
+
+        ont_file = precis.bootstrap.resolveOntologyFile(
+            version=precis.config.ont_version)
+        self.assertEqual(precis.bootstrap.fileDigest(file_path=ont_file),
+                         precis.config.ont_checksums[
+                             precis.config.ont_version])
+
+    def test_snapshot(self):
+        """Tests that the lookup map snapshot round-trips, and that it is
+        discarded when the digest does not match.
+        """
+
+        snapshot = precis.bootstrap.buildSnapshot(ont=precis.config.ont,
+                                                  digest='test-digest')
+        precis.bootstrap.saveSnapshot(snapshot=snapshot)
+
+        # Round trip
+        self.assertEqual(precis.bootstrap.loadSnapshot(digest='test-digest'),
+                         snapshot)
+
+        # Lookup maps match those bound at initialization
+        self.assertEqual(set(snapshot['ont_classes']),
+                         set(precis.config.ont_classes))
+        self.assertNotIn('hasDescription', snapshot['object_properties'])
+
+        # Stale snapshot
+        self.assertIsNone(precis.bootstrap.loadSnapshot(digest='other'))
+
+    def test_propertyTable(self):
+        """Tests that the property table matches the functional properties
+        computed by owlready2 from class restrictions, and the cardinality and
+        range of a known property.
+        """
+
+        table = precis.config.property_table
+        self.assertEqual(table[('WorkExperience', 'employedAt')],
+                         {'functional': True, 'min': 1, 'max': 1,
+                          'range': ['Organization']})
+        self.assertFalse(table[('WorkExperience', 'hasDescription')][
+            'functional'])
+
+        # Clearing the functional property cache (seeded from the table)
+        world = precis.PrecisWorld()
+        _, functional_cache = owlreadyCaches()
+        for ont_class in world.ont_classes.values():
+            functional_cache.pop(ont_class, None)
+
+        for (class_name, property_name), schema in table.items():
+            ont_property = world.object_properties.get(property_name) or \
+                world.data_properties.get(property_name) or \
+                world.ont.hasDescription
+            self.assertEqual(schema['functional'], bool(
+                ont_property.is_functional_for(world.ont_classes[class_name])),
+                (class_name, property_name))
+
+        world.close()
+
+    def test_owlreadyCaches(self):
+        """Tests that the private owlready2 caches used by Precis worlds are
+        available with the installed owlready2 version (failing if owlready2 is
+        upgraded, or the caches are removed), and that closing a world releases
+        its entities from them.
+        """
+
+        import owlready2
+
+        self.assertIn(owlready2.VERSION, OWLREADY2_CACHE_VERSIONS,
+                      'owlready2 {0} is not supported; verify its caches, and '
+                      'add it to OWLREADY2_CACHE_VERSIONS'.format(
+                          owlready2.VERSION))
+        entity_cache, functional_cache = owlreadyCaches()
+        self.assertIsNotNone(entity_cache)
+        self.assertIsNotNone(functional_cache)
+
+        # Functional flags are seeded, and released when the world is closed
+        world = precis.PrecisWorld()
+        ont_class = world.ont_classes['WorkExperience']
+        self.assertIn(ont_class, functional_cache)
+        world.close()
+        self.assertNotIn(ont_class, functional_cache)
+        self.assertFalse([entity for entity in entity_cache if
+            getattr(getattr(entity, 'namespace', None), 'world', None) is
+            world.world])
+
+    def test_lazyImport(self):
+        """Tests that importing Precis does not load the ontology (or import
+        owlready2 and rdflib).
+        """
+
+        # Running in a fresh interpreter, from the top-level project folder
+        code = 'import sys, precis; print(sorted(set(sys.modules) & ' + \
+            '{"owlready2", "rdflib"}))'
+        output = subprocess.check_output([sys.executable, '-c', code],
+            cwd=os.path.dirname(os.path.dirname(precis.__file__)))
+
+        self.assertEqual(output.decode().strip(), '[]')
+
+        # Lazily imported modules are available as attributes
+        code = 'import precis; print(precis.query.__name__, ' + \
+            'precis.templating.__name__)'
+        output = subprocess.check_output([sys.executable, '-c', code],
+            cwd=os.path.dirname(os.path.dirname(precis.__file__)),
+            stderr=subprocess.DEVNULL)
+
+        self.assertEqual(output.decode().split(),
+                         ['precis.query', 'precis.templating'])
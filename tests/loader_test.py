@@ -1,6 +1,9 @@
 from test_cfg import TestConfig
 from context import precis
+from precis.util import iterJSONArray
 
+import io
+import json
 import os
 
 import unittest
@@ -75,3 +78,239 @@ class TestLoader(unittest.TestCase):
 
         # Making sure the returned namespace matches
         self.assertEqual(test_namespace, loader.getNamespace())
+
+    def test_idReferences(self):
+        """Tests that ID references resolve to individuals defined earlier in
+        the file, and that forward references raise an error.
+        """
+
+        skill = {'$type': 'Skill', '$id': 'sk:python', 'hasName': 'Python'}
+        project = {'$type': 'Project', '$id': 'proj:test', 'hasName': 'Test',
+                   'relatedTo': ['sk:python'],
+                   'hasDescription': [{'hasText': 'Test project.'}]}
+
+        # Reference after definition
+        loader = precis.Loader(ingest_file=io.StringIO(json.dumps(
+            [skill, project])))
+        related = loader.getOntology().search_one(
+            iri=loader.getNamespace() + 'proj:test').relatedTo
+        self.assertEqual([i.name for i in related], ['sk:python'])
+
+        # Reference before definition
+        with self.assertRaises(ReferenceError):
+            precis.Loader(ingest_file=io.StringIO(json.dumps(
+                [project, skill])))
+
+    def test_streamingLoader(self):
+        """Tests that streaming ingestion adds the same individuals as loading
+        the complete file.
+        """
+
+        candidates = []
+        for stream in [False, True]:
+            with open(TestConfig.sample_json_data, 'r') as f:
+                loader = precis.Loader(ingest_file=f, stream=stream)
+
+            # Isolating names of individuals in the loader namespace
+            candidates.append(sorted([i.name for i in precis.config.ont.search(
+                iri=loader.getNamespace() + '*')]))
+
+        self.assertEqual(candidates[0], candidates[1])
+        self.assertTrue(len(candidates[0]) > 0)
+
+    def test_iterJSONArray(self):
+        """Tests that incrementally parsed JSONArrays match `json.loads`, with
+        elements larger than a chunk, and that malformed arrays (including
+        arrays followed by other data) are rejected.
+        """
+
+        document = json.dumps([1, {'text': 'x' * 1000, 'list': list(
+            range(500))}, 'string', [], 2.5, None])
+        self.assertEqual(list(iterJSONArray(
+            file_obj=io.StringIO(document + '\n'), chunk_size=7)),
+            json.loads(document))
+        self.assertEqual(list(iterJSONArray(
+            file_obj=io.StringIO(' [ ] '))), [])
+
+        for malformed in ['[1, 2] garbage', '[] []', '[1, 2', '[1 2]', '{}']:
+            with self.assertRaises(json.decoder.JSONDecodeError):
+                list(iterJSONArray(
+                    file_obj=io.StringIO(malformed), chunk_size=3))
+
+    def test_isolatedWorlds(self):
+        """Tests that documents loaded into isolated Precis worlds are not
+        visible in other worlds, and that isolated worlds can be closed.
+        """
+
+        skill = {'$type': 'Skill', '$id': 'sk:python', 'hasName': 'Python'}
+        worlds = [precis.PrecisWorld(), precis.PrecisWorld()]
+
+        # Loading the same document (and namespace) into both worlds
+        loaders = [precis.Loader(ingest_file=io.StringIO(json.dumps(
+            [dict(skill)])), namespace=TestConfig.namespace, world=world)
+            for world in worlds]
+        loaders.append(precis.Loader(ingest_file=io.StringIO(json.dumps(
+            [dict(skill, **{'$id': 'sk:java', 'hasName': 'Java'})])),
+            namespace=TestConfig.namespace, world=worlds[1]))
+
+        # Each world only contains its own individuals
+        for world, expected in zip(worlds, [['Python'], ['Java', 'Python']]):
+            query = precis.OntQuery(ont=world.ont,
+                                    graph=world.getRDFLibGraph())
+            self.assertEqual(sorted([i['hasName'][0] for i in
+                query.getAllOfType(c_type='Skill')]), expected)
+
+        # The config namespace is only bound by the default world
+        self.assertNotEqual(precis.config.namespace, loaders[0].namespace)
+
+        for world in worlds:
+            world.close()
+        with self.assertRaises(ValueError):
+            precis.PrecisWorld.default().close()
+
+    def test_incrementalReload(self):
+        """Tests that an incremental reload only changes edited individuals,
+        and that the reloaded ontology matches an ontology loaded from the
+        edited document.
+        """
+
+        with open(TestConfig.sample_json_data, 'r') as f:
+            document = json.load(f)
+
+        # Editing a nested object and an individual (removing a property and
+        # a description), removing an individual, and adding an individual
+        edited = json.loads(json.dumps(document))
+        edited[0]['inCity'] = 'Starbase'
+        edited[0]['employedAt']['hasName'] = 'SpaceX Corp'
+        edited[0]['hasDescription'] = edited[0]['hasDescription'][:1]
+        del edited[0]['inState']
+        edited = [i for i in edited if i['$id'] != 'talk:leap_motion']
+        edited.append({'$type': 'Skill', '$id': 'sk:rust', 'hasName': 'Rust'})
+
+        # Documents loaded without tracking changes cannot be reloaded
+        world = precis.PrecisWorld()
+        with self.assertRaises(ValueError):
+            precis.Loader(ingest_file=io.StringIO(json.dumps(document)),
+                          world=world).reload(
+                ingest_file=io.StringIO(json.dumps(edited)))
+        world.close()
+
+        worlds = [precis.PrecisWorld(), precis.PrecisWorld()]
+        loader = precis.Loader(ingest_file=io.StringIO(json.dumps(document)),
+                               namespace=TestConfig.namespace,
+                               world=worlds[0], track_changes=True)
+        stats = loader.reload(ingest_file=io.StringIO(json.dumps(edited)))
+        self.assertEqual(stats['added'], 1)
+        self.assertEqual(stats['updated'], 2)
+        self.assertEqual(stats['removed'], 1)
+        self.assertEqual(loader.reload(ingest_file=io.StringIO(json.dumps(
+            edited)))['unchanged'], stats['unchanged'] + 3)
+
+        precis.Loader(ingest_file=io.StringIO(json.dumps(edited)),
+                      namespace=TestConfig.namespace, world=worlds[1])
+
+        # Note: Multi-valued properties are unordered, so triples are compared
+        self.assertEqual(*[set(world.getRDFLibGraph().triples((None, None,
+            None))) for world in worlds])
+
+        # References to individuals that are removed are not allowed
+        with self.assertRaises(ReferenceError):
+            loader.reload(ingest_file=io.StringIO(json.dumps(
+                [i for i in edited if i['$id'] != 'award:ieee'])))
+
+        for world in worlds:
+            world.close()
+
+    def test_saveFormats(self):
+        """Tests that user data saved in each format is reopened with the same
+        triples, and that unknown formats are rejected.
+        """
+
+        world = precis.PrecisWorld()
+        with open(TestConfig.sample_json_data, 'r') as f:
+            loader = precis.Loader(ingest_file=f,
+                                   namespace=TestConfig.namespace, world=world)
+
+        # Note: Blank node IDs differ between worlds; user data is compared
+        def userTriples(world: precis.PrecisWorld) -> set:
+            return set(t for t in world.getRDFLibGraph().triples((None, None,
+                None)) if str(t[0]).startswith(loader.namespace.base_iri))
+
+        expected = userTriples(world=world)
+
+        for save_format in ['ntriples', 'sqlite']:
+            loader.saveToFile(save_location=TestConfig.test_save_location,
+                              format=save_format)
+
+            if save_format == 'sqlite':
+                self.assertTrue(precis.PrecisWorld.isSnapshot(
+                    file_path=TestConfig.test_save_location))
+                saved_world = precis.PrecisWorld.fromSnapshot(
+                    file_path=TestConfig.test_save_location)
+            else:
+                self.assertFalse(precis.PrecisWorld.isSnapshot(
+                    file_path=TestConfig.test_save_location))
+                saved_world = precis.PrecisWorld()
+                saved_world.world.get_ontology(os.path.abspath(
+                    TestConfig.test_save_location)).load()
+
+            self.assertEqual(userTriples(world=saved_world), expected)
+            saved_world.close()
+            os.remove(TestConfig.test_save_location)
+
+        with self.assertRaises(ValueError):
+            loader.saveToFile(save_location=TestConfig.test_save_location,
+                              format='turtle')
+
+        world.close()
+
+    def test_bulkLoad(self):
+        """Tests that documents are bulk-loaded into their namespaces, and that
+        a document that fails to load is reported, leaves no individuals
+        behind, and does not abort the other documents.
+        """
+
+        with open(TestConfig.sample_json_data, 'r') as f:
+            document = json.load(f)
+
+        # Referring to an undefined individual after some objects are created
+        invalid = json.loads(json.dumps(document))
+        invalid.insert(3, {'$type': 'Skill', '$id': 'sk:rust',
+                           'hasName': 'Rust', 'relatedTo': 'undefined'})
+
+        # Failing to create an individual after its descriptions are created
+        # (organizations have at most one description)
+        invalid_description = json.loads(json.dumps(document))
+        invalid_description.insert(3, {'$type': 'Organization',
+            '$id': 'org:test', 'hasName': 'Test',
+            'hasDescription': [{'hasText': 'One.'}, {'hasText': 'Two.'}]})
+
+        namespaces = ['http://precis.rukmal.me/ontology/{0}#'.format(name)
+                      for name in ['musk', 'invalid', 'musk2',
+                                   'invalid_description']]
+        world = precis.PrecisWorld()
+        results = precis.Loader.bulkLoad(ingest_files=[io.StringIO(
+            json.dumps(data)) for data in [document, invalid, document,
+                                           invalid_description]],
+            namespaces=namespaces, world=world)
+
+        self.assertEqual([r.namespace for r in results], namespaces)
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[1].loader)
+        self.assertIn('ReferenceError', results[1].error)
+        self.assertIsNone(results[2].error)
+        self.assertIn('TypeError', results[3].error)
+
+        triples = list(world.getRDFLibGraph().triples((None, None, None)))
+        counts = [sum(1 for t in triples if str(t[0]).startswith(namespace))
+                  for namespace in namespaces]
+        self.assertEqual(counts[1], 0)
+        self.assertEqual(counts[3], 0)
+        self.assertEqual(counts[0], counts[2])
+        self.assertGreater(counts[0], 0)
+
+        with self.assertRaises(ValueError):
+            precis.Loader.bulkLoad(ingest_files=[], namespaces=namespaces,
+                                   world=world)
+
+        world.close()
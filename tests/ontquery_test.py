@@ -2,7 +2,11 @@ from test_cfg import TestConfig
 from context import precis
 
 from owlready2 import get_ontology, default_world
+from rdflib.plugins.sparql.algebra import pprintAlgebra
 
+import contextlib
+import io
+import json
 import unittest
 
 
@@ -77,3 +81,252 @@ class TestOntQuery(unittest.TestCase):
         # Ensuring difference between sets is empty, meaning all expected
         # classes were present in the candidate classes set
         self.assertEqual(len(expected_classes.difference(candidate_classes)), 0)
+
+    def test_getAllBatched(self):
+        """Tests that batched extraction in OntQuery matches the output of
+        per-individual extraction.
+        """
+
+        # Instantiating batched OntQuery
+        batched_query = precis.OntQuery(ont=self.ont, graph=self.graph,
+                                        batched=True)
+
+        # Comparing output, for each ordering scheme and description priority
+        for order in [None] + precis.config.valid_order_options:
+            self.assertEqual(batched_query.getAll(order=order),
+                             self.query.getAll(order=order))
+        self.assertEqual(
+            batched_query.getAllOfType(c_type='Project', descr_priority=1),
+            self.query.getAllOfType(c_type='Project', descr_priority=1))
+
+        # Batched mode is not supported by the native backend
+        with self.assertRaises(ValueError):
+            precis.OntQuery(ont=self.ont, graph=self.graph, batched=True,
+                            backend='native')
+
+    def test_preparedQueryCache(self):
+        """Tests that query shapes are prepared once, and reused thereafter.
+        """
+
+        # Preparing all query shapes
+        self.query.getAll()
+        cache_info = precis.query.sparql_queries.SPARQLQueries.cacheInfo()
+
+        # Repeating queries should not prepare any new query shapes
+        self.query.getAll()
+        self.assertEqual(
+            precis.query.sparql_queries.SPARQLQueries.cacheInfo()['misses'],
+            cache_info['misses'])
+        self.assertGreater(
+            precis.query.sparql_queries.SPARQLQueries.cacheInfo()['hits'],
+            cache_info['hits'])
+
+    def test_getAllNative(self):
+        """Tests that the native OntQuery backend matches the output of the
+        RDFLib backend.
+        """
+
+        # Instantiating OntQuery with the native backend
+        native_query = precis.OntQuery(ont=self.ont, graph=self.graph,
+                                       backend='native')
+
+        # Comparing output, for each ordering scheme and description priority
+        for order in [None] + precis.config.valid_order_options:
+            self.assertEqual(native_query.getAll(order=order),
+                             self.query.getAll(order=order))
+        self.assertEqual(
+            native_query.getAllOfType(c_type='Project', descr_priority=1),
+            self.query.getAllOfType(c_type='Project', descr_priority=1))
+
+        # Invalid backend
+        with self.assertRaises(ValueError):
+            precis.OntQuery(ont=self.ont, graph=self.graph, backend='other')
+
+    def test_nativeQueryReadOnly(self):
+        """Tests that native queries over IRIs that are not in the quadstore
+        have no results, and do not add the IRIs to the quadstore.
+        """
+
+        native_query = precis.query.native_query.NativeQuery(ont=self.ont)
+        graph = self.ont.world.graph
+        unknown_iri = 'http://example.com/unknown#individual'
+
+        def resources() -> int:
+            return graph.execute('SELECT COUNT(*) FROM resources').fetchone()[0]
+
+        n_resources = resources()
+        self.assertEqual(native_query.getAllOfType(c_type='UnknownClass'), [])
+        self.assertEqual(native_query.getAllOfTypeAscendingTemporal(
+            c_type='UnknownClass'), [])
+        for shape in ['getDataProperties', 'getObjectProperties',
+                      'getDescriptionPriorities', 'getAffiliated']:
+            self.assertEqual(getattr(native_query, shape)(
+                target_iri=unknown_iri), [])
+        self.assertEqual(resources(), n_resources)
+        self.assertIsNone(graph.execute('SELECT storid FROM resources WHERE ' +
+            'iri = ?', (unknown_iri,)).fetchone())
+
+    def test_nameLookups(self):
+        """Tests that property and affiliated individual names are resolved
+        without searching the ontology, after the first lookup.
+        """
+
+        # Instantiating OntQuery, so that name lookup counts start at zero
+        query = precis.OntQuery(ont=self.ont, graph=self.graph)
+
+        # Property names are resolved from the Precis ontology
+        query.getAllOfType(c_type='WorkExperience')
+        self.assertGreater(query.name_lookups['cached'], 0)
+        searched = query.name_lookups['searched']
+
+        # Affiliated individual names are only searched once
+        query.getAllOfType(c_type='WorkExperience')
+        self.assertEqual(query.name_lookups['searched'], searched)
+
+    def test_queryProfiler(self):
+        """Tests that queries are profiled by shape without changing their
+        results, that slow queries are logged, and that algebra trees are kept.
+        """
+
+        # Profiling every query as slow
+        profiler = precis.QueryProfiler(slow_threshold=0.0, dump_algebra=True)
+        query = precis.OntQuery(ont=self.ont, graph=self.graph,
+                                profiler=profiler)
+        self.assertEqual(query.getAllOfType(c_type='Degree'),
+                         self.query.getAllOfType(c_type='Degree'))
+
+        profile = profiler.getProfile()
+        self.assertIn('getAllOfType', [i['shape'] for i in profile])
+        self.assertGreater(sum(i['rows'] for i in profile), 0)
+        self.assertEqual(len(profiler.getSlowQueries()),
+                         sum(i['calls'] for i in profile))
+        self.assertIn('SelectQuery', profiler.algebra['getAllOfType'])
+
+        # Algebra trees match `pprintAlgebra` (which prints to stdout)
+        prepared_query, _ = precis.query.sparql_queries.SPARQLQueries.\
+            getAllOfType(c_type='Degree')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            pprintAlgebra(prepared_query)
+        self.assertEqual(profiler.algebra['getAllOfType'], output.getvalue())
+
+        # The default threshold is the configured threshold when the profiler
+        # is created
+        slow_query_threshold = precis.config.slow_query_threshold
+        precis.config.slow_query_threshold = 1.5
+        try:
+            self.assertEqual(precis.QueryProfiler().slow_threshold, 1.5)
+        finally:
+            precis.config.slow_query_threshold = slow_query_threshold
+
+    def test_orderIndex(self):
+        """Tests that ordered IRIs are served from the ordering index of each
+        class, in the order of the ordering queries, without running them.
+        """
+
+        profiler = precis.QueryProfiler()
+        query = precis.OntQuery(ont=self.ont, graph=self.graph,
+                                profiler=profiler)
+        shapes = {'chron_A': 'getAllOfTypeAscendingTemporal',
+                  'chron_D': 'getAllOfTypeDescendingTemporal',
+                  'alphabetical_A': 'getAllOfTypeAlphabeticalAsc',
+                  'alphabetical_D': 'getAllOfTypeAlphabeticalDesc'}
+
+        # Comparing with the ordering queries, for each class and ordering
+        for c_type in precis.config.ont_classes:
+            for order, shape in shapes.items():
+                prepared_query, bindings = getattr(
+                    precis.query.sparql_queries.SPARQLQueries, shape)(
+                        c_type=c_type)
+                self.assertEqual(
+                    query.getIndividualIRIs(c_type=c_type, order=order),
+                    [i[0].toPython() for i in self.graph.query(
+                        query_object=prepared_query, initBindings=bindings)])
+
+        # Ordering queries are not run, and indexes are rebuilt when invalid
+        query.getAll(order='chron_D')
+        query.invalidateOrders(c_types=['Degree'])
+        self.assertNotIn('Degree', query.order_index)
+        query.getAll(order='alphabetical_A')
+        self.assertIn('Degree', query.order_index)
+        self.assertFalse(set(shapes.values()).intersection(
+            i['shape'] for i in profiler.getProfile()))
+
+    def test_orderIndexReload(self):
+        """Tests that ordering indexes are rebuilt after individuals are added
+        to, or removed from the quadstore (eg: by an incremental reload).
+        """
+
+        with open(TestConfig.sample_json_data, 'r') as f:
+            document = json.load(f)
+
+        world = precis.PrecisWorld()
+        loader = precis.Loader(ingest_file=io.StringIO(json.dumps(document)),
+                               world=world, track_changes=True)
+        query = precis.OntQuery(ont=loader.getOntology(),
+                                graph=loader.getRDFLibGraph())
+
+        def assertOrdered():
+            # Ordered IRIs are a permutation of the instances
+            iris = query.getIndividualIRIs(c_type='WorkExperience')
+            for order in ['chron_A', 'chron_D']:
+                self.assertEqual(sorted(query.getIndividualIRIs(
+                    c_type='WorkExperience', order=order)), sorted(iris))
+            return iris
+
+        n_individuals = len(assertOrdered())
+
+        # Adding an individual
+        document.append({'$type': 'WorkExperience', '$id': 'we:new',
+                         'hasName': 'New', 'hasDate': '2020-01-01',
+                         'employedAt': 'spacex'})
+        loader.reload(ingest_file=io.StringIO(json.dumps(document)))
+        self.assertEqual(len(assertOrdered()), n_individuals + 1)
+        self.assertEqual(query.getIndividualIRIs(c_type='WorkExperience',
+            order='chron_D')[0], loader.getNamespace() + 'we:new')
+
+        # Removing the individual
+        loader.reload(ingest_file=io.StringIO(json.dumps(document[:-1])))
+        self.assertEqual(len(assertOrdered()), n_individuals)
+        self.assertNotIn(loader.getNamespace() + 'we:new',
+                         query.getIndividualIRIs(c_type='WorkExperience',
+                                                 order='chron_D'))
+
+        world.close()
+
+    def test_individualNamesReload(self):
+        """Tests that the names of affiliated individuals are resolved again
+        after they are renamed in the quadstore (eg: by an incremental reload).
+        """
+
+        with open(TestConfig.sample_json_data, 'r') as f:
+            document = json.load(f)
+
+        world = precis.PrecisWorld()
+        loader = precis.Loader(ingest_file=io.StringIO(json.dumps(document)),
+                               world=world, track_changes=True)
+        queries = [precis.OntQuery(ont=loader.getOntology(),
+                                   graph=loader.getRDFLibGraph(),
+                                   backend=backend)
+                   for backend in precis.config.valid_query_backends]
+
+        def affiliatedNames(query: precis.OntQuery) -> list:
+            return [affiliated['hasName'] for i in query.getAllOfType(
+                c_type='WorkExperience') if i['$id'] == 'we_tesla_ceo'
+                for affiliated in i['affiliated']]
+
+        for query in queries:
+            self.assertIn('IEEE Honorary Membership', affiliatedNames(query))
+
+        # Renaming an affiliated award
+        for individual in document:
+            if individual['$id'] == 'award:ieee':
+                individual['hasName'] = 'Renamed Award'
+        loader.reload(ingest_file=io.StringIO(json.dumps(document)))
+
+        for query in queries:
+            names = affiliatedNames(query)
+            self.assertIn('Renamed Award', names)
+            self.assertNotIn('IEEE Honorary Membership', names)
+
+        world.close()
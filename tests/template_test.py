@@ -3,6 +3,11 @@ from context import precis
 
 from owlready2 import default_world, get_ontology
 
+import io
+import json
+import os
+import tempfile
+import threading
 import unittest
 
 
@@ -33,6 +38,71 @@ class TestTemplate(unittest.TestCase):
         # If no errors, we passed
         self.assertTrue(True)
 
+    def test_bytecodeCache(self):
+        """Function to test the template bytecode cache. Validates that a
+        compiled template is cached, reused by templates loaded later, and
+        compiled again if its cache entry is corrupted.
+        """
+
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            bytecode_cache = precis.templating.TemplateBytecodeCache(
+                cache_folder=tmp_folder)
+
+            # Cache miss; the template is compiled (once) and cached
+            cv_template = precis.templating.PrecisTemplate(
+                template_folder=TestConfig.template_cv,
+                bytecode_cache=bytecode_cache)
+            self.assertEqual(bytecode_cache.cacheInfo(),
+                             {'hits': 0, 'misses': 1})
+            entries = os.listdir(tmp_folder)
+            self.assertEqual(len(entries), 1)
+
+            # Cache hit; the cached template renders the same output
+            cached_template = precis.templating.PrecisTemplate(
+                template_folder=TestConfig.template_cv,
+                bytecode_cache=precis.templating.TemplateBytecodeCache(
+                    cache_folder=tmp_folder))
+            self.assertEqual(
+                cached_template.env.bytecode_cache.cacheInfo(),
+                {'hits': 1, 'misses': 0})
+            render_data = {'last_updated': 'January 1, 2020'}
+            self.assertEqual(cached_template.renderTemplate(render_data),
+                             cv_template.renderTemplate(render_data))
+
+            # Corrupted entries are ignored
+            with open(os.path.join(tmp_folder, entries[0]), 'wb') as f:
+                f.write(b'corrupted')
+            precis.templating.PrecisTemplate(
+                template_folder=TestConfig.template_cv,
+                bytecode_cache=bytecode_cache)
+            self.assertEqual(bytecode_cache.cacheInfo(),
+                             {'hits': 0, 'misses': 2})
+
+    def test_defaultBytecodeCache(self):
+        """Function to test that templates are not cached by default, and that
+        the persistent bytecode cache in the cache folder is used if it is
+        enabled in the configuration.
+        """
+
+        self.assertIsNone(precis.templating.PrecisTemplate(
+            template_folder=TestConfig.template_cv).env.bytecode_cache)
+
+        original = (precis.config.cache_folder,
+                    precis.config.template_bytecode_cache)
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            precis.config.cache_folder = tmp_folder
+            precis.config.template_bytecode_cache = True
+            try:
+                bytecode_cache = precis.templating.PrecisTemplate(
+                    template_folder=TestConfig.template_cv).env.bytecode_cache
+            finally:
+                (precis.config.cache_folder,
+                 precis.config.template_bytecode_cache) = original
+
+            self.assertEqual(bytecode_cache.cache_folder,
+                             os.path.join(tmp_folder, 'templates'))
+            self.assertEqual(len(os.listdir(bytecode_cache.cache_folder)), 1)
+
     def test_templateDriver(self):
         """Function to test the TemplateDriver functionality of the templating
         engine. Validates that the 'cv' template can be rendered.
@@ -62,3 +132,508 @@ class TestTemplate(unittest.TestCase):
 
         with open(TestConfig.template_cv_out, 'w') as f:
             f.write(driver.buildTemplate())
+
+    def test_compiledData(self):
+        """Function to test rendering from compiled user data. Validates that
+        the 'cv' template rendered from compiled user data is identical to the
+        template rendered from the user data ontology, and that compiled user
+        data can be saved and loaded.
+        """
+
+        # Importing CV template
+        cv_template = precis.templating.PrecisTemplate(
+            template_folder=TestConfig.template_cv
+        )
+
+        # Loading user ontology
+        user_ont = get_ontology(TestConfig.sample_rdf_data).load()
+        user_graph = default_world.as_rdflib_graph()
+
+        # Rendering from the user data ontology
+        with open(TestConfig.template_prefs, 'r') as user_prefs:
+            expected = precis.templating.TemplateDriver(
+                template=cv_template,
+                user_ont=user_ont,
+                user_graph=user_graph,
+                user_prefs=user_prefs
+            ).buildTemplate()
+
+        # Compiling user data, and saving and loading it
+        compiled_data = precis.templating.CompiledData.compile(
+            user_ont=user_ont,
+            user_graph=user_graph
+        )
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            compiled_file = os.path.join(tmp_folder, 'compiled.pickle.gz')
+            compiled_data.save(file_path=compiled_file)
+            compiled_data = precis.templating.CompiledData.load(
+                file_path=compiled_file)
+
+        # Rendering from compiled user data
+        with open(TestConfig.template_prefs, 'r') as user_prefs:
+            output = precis.templating.TemplateDriver(
+                template=cv_template,
+                user_ont=None,
+                user_graph=None,
+                user_prefs=user_prefs,
+                compiled_data=compiled_data
+            ).buildTemplate()
+
+        self.assertEqual(output, expected)
+
+        # Ensuring compiled orderings match ontology queries
+        query = precis.OntQuery(ont=user_ont, graph=user_graph)
+        for order in precis.config.valid_order_options:
+            self.assertEqual(
+                compiled_data.getAllOfType(c_type='Degree', order=order,
+                                           descr_priority=2),
+                query.getAllOfType(c_type='Degree', order=order,
+                                   descr_priority=2))
+        with self.assertRaises(ValueError):
+            compiled_data.getAllOfType(c_type='Degree', order='invalid')
+
+    def test_renderCache(self):
+        """Function to test the render cache. Validates that a template rendered
+        from a user data file is cached, that a cache hit does not load the
+        user data, and that least recently used entries are evicted.
+        """
+
+        # Importing CV template
+        cv_template = precis.templating.PrecisTemplate(
+            template_folder=TestConfig.template_cv
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            render_cache = precis.templating.RenderCache(
+                cache_folder=tmp_folder)
+
+            # Cache miss; user data is loaded from the data file
+            with open(TestConfig.template_prefs, 'r') as user_prefs:
+                driver = precis.templating.TemplateDriver(
+                    template=cv_template,
+                    user_ont=None,
+                    user_graph=None,
+                    user_prefs=user_prefs,
+                    render_cache=render_cache,
+                    data_file=TestConfig.sample_rdf_data
+                )
+            expected = driver.buildTemplate()
+
+            # Cache hit; user data is not built
+            with open(TestConfig.template_prefs, 'r') as user_prefs:
+                driver = precis.templating.TemplateDriver(
+                    template=cv_template,
+                    user_ont=None,
+                    user_graph=None,
+                    user_prefs=user_prefs,
+                    render_cache=render_cache,
+                    data_file=TestConfig.sample_rdf_data
+                )
+            self.assertFalse(hasattr(driver, 'user_data'))
+            self.assertEqual(driver.buildTemplate(), expected)
+
+            cache_info = render_cache.cacheInfo()
+            self.assertEqual(cache_info['hits'], 1)
+            self.assertEqual(cache_info['misses'], 1)
+            self.assertEqual(cache_info['entries'], 1)
+
+            # Rendering from template data (cached as a new entry)
+            # Note: An isolated world is used, as other tests load individuals
+            #       with the same IDs into the default world
+            world = precis.PrecisWorld()
+            user_ont = world.world.get_ontology(os.path.abspath(
+                TestConfig.sample_rdf_data)).load()
+            with open(TestConfig.template_prefs, 'r') as user_prefs:
+                driver = precis.templating.TemplateDriver(
+                    template=cv_template,
+                    user_ont=user_ont,
+                    user_graph=world.getRDFLibGraph(),
+                    user_prefs=user_prefs,
+                    render_cache=render_cache
+                )
+            world.close()
+            self.assertEqual(driver.buildTemplate(), expected)
+            self.assertEqual(cv_template.renderTemplate(
+                render_data=driver.user_data, render_cache=render_cache),
+                expected)
+            self.assertEqual(render_cache.cacheInfo()['entries'], 2)
+            self.assertEqual(render_cache.cacheInfo()['hits'], 2)
+
+            # The size of the cache is tracked as entries are written, or
+            # replaced (existing entries are counted when the cache is opened)
+            render_cache = precis.templating.RenderCache(
+                cache_folder=tmp_folder)
+            render_cache.put(key='1' * 64, output='x' * 10)
+            render_cache.put(key='1' * 64, output='x' * 5)
+            self.assertEqual(render_cache.size,
+                             render_cache.cacheInfo()['size'])
+
+            # Eviction of the least recently used entries
+            render_cache.max_size = cache_info['size']
+            render_cache.put(key='0' * 64, output=expected)
+            cache_info = render_cache.cacheInfo()
+            self.assertEqual(cache_info['entries'], 1)
+            self.assertEqual(cache_info['evictions'], 3)
+            self.assertEqual(render_cache.size, cache_info['size'])
+
+    def test_batchRender(self):
+        """Function to test parallel batch rendering. Validates that templates
+        rendered by worker processes are identical to templates rendered in
+        this process, and that a failed job does not affect the other jobs.
+        """
+
+        # Importing CV template
+        cv_template = precis.templating.PrecisTemplate(
+            template_folder=TestConfig.template_cv
+        )
+
+        # Rendering in this process (from compiled user data)
+        with open(TestConfig.template_prefs, 'r') as user_prefs:
+            expected = precis.templating.TemplateDriver(
+                template=cv_template,
+                user_ont=None,
+                user_graph=None,
+                user_prefs=user_prefs,
+                data_file=TestConfig.sample_rdf_data
+            ).buildTemplate()
+
+        data_files = [TestConfig.sample_json_data, TestConfig.sample_rdf_data,
+                      'data/missing.json']
+        jobs = [precis.templating.BatchJob(
+            data_file=data_file,
+            template_folder=TestConfig.template_cv,
+            prefs_file=TestConfig.template_prefs
+        ) for data_file in data_files]
+
+        # Rendering with a render cache shared by the workers
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            render_cache = precis.templating.RenderCache(
+                cache_folder=tmp_folder)
+            with precis.templating.BatchRenderer(
+                    template_folders=[TestConfig.template_cv],
+                    max_workers=2, render_cache=render_cache) as renderer:
+                results = {result.job.data_file: result
+                           for result in renderer.render(jobs=jobs)}
+            self.assertEqual(render_cache.cacheInfo()['entries'], 2)
+
+        # Note: The order of multi-valued properties of individuals loaded from
+        #       JSON data is not deterministic, so only the template rendered
+        #       from RDF data is compared
+        self.assertEqual(set(results.keys()), set(data_files))
+        for data_file in data_files[:2]:
+            self.assertIsNone(results[data_file].error)
+            self.assertIn('render', results[data_file].timings)
+        self.assertEqual(results[TestConfig.sample_rdf_data].output, expected)
+        self.assertIsNone(results['data/missing.json'].output)
+        self.assertIn('FileNotFoundError', results['data/missing.json'].error)
+
+    def test_concurrentExtraction(self):
+        """Function to test concurrent extraction of template data. Validates
+        that template data extracted by a pool of processes is identical to
+        template data extracted serially, and that each required class is
+        timed.
+        """
+
+        # Importing CV template
+        cv_template = precis.templating.PrecisTemplate(
+            template_folder=TestConfig.template_cv
+        )
+
+        # Loading user ontology into an isolated world
+        world = precis.PrecisWorld()
+        user_ont = world.world.get_ontology(os.path.abspath(
+            TestConfig.sample_rdf_data)).load()
+        user_graph = world.getRDFLibGraph()
+
+        drivers = list()
+        for max_workers in [None, 4]:
+            with open(TestConfig.template_prefs, 'r') as user_prefs:
+                drivers.append(precis.templating.TemplateDriver(
+                    template=cv_template,
+                    user_ont=user_ont,
+                    user_graph=user_graph,
+                    user_prefs=user_prefs,
+                    max_workers=max_workers
+                ))
+        world.close()
+
+        self.assertEqual(drivers[0].user_data, drivers[1].user_data)
+        self.assertEqual(list(drivers[0].user_data.keys()),
+                         list(drivers[1].user_data.keys()))
+        self.assertEqual(drivers[0].buildTemplate(), drivers[1].buildTemplate())
+        for driver in drivers:
+            self.assertEqual(list(driver.getClassTimings().keys()),
+                             list(cv_template.getRequiredClasses()))
+            self.assertTrue(all(elapsed >= 0 for elapsed in
+                                driver.getClassTimings().values()))
+
+    def test_renderServer(self):
+        """Function to test the render server. Validates that a template
+        rendered by the server (with data overrides) is identical to a template
+        rendered in this process, and that the server can be shut down.
+        """
+
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            socket_path = os.path.join(tmp_folder, 'render.sock')
+            override_file = os.path.join(tmp_folder, 'override.json')
+            with open(override_file, 'w') as f:
+                json.dump([{'$id': 'we_spacex_ceo', 'inCity': 'Starbase'}], f)
+
+            job = precis.templating.BatchJob(
+                data_file=TestConfig.sample_rdf_data,
+                template_folder=TestConfig.template_cv,
+                prefs_file=TestConfig.template_prefs
+            )
+            override_job = job._replace(
+                data_file=TestConfig.sample_json_data,
+                override_files=(override_file,)
+            )
+
+            server = precis.templating.RenderServer(
+                socket_path=socket_path,
+                template_folders=[TestConfig.template_cv]
+            )
+            server_thread = threading.Thread(target=server.serveForever)
+            server_thread.start()
+
+            client = precis.templating.RenderClient(socket_path=socket_path)
+            self.assertTrue(client.isAlive())
+            result = client.render(job=job)
+            override_result = client.render(job=override_job)
+            client.shutdown()
+            server_thread.join()
+
+            self.assertFalse(os.path.exists(socket_path))
+            self.assertIsNone(result.error)
+            self.assertEqual(result.output, precis.templating.batch.renderJob(
+                job=job).output)
+            self.assertIsNone(override_result.error)
+            self.assertIn('Starbase', override_result.output)
+
+    def test_incrementalUpdate(self):
+        """Function to test incremental updates of template data. Validates
+        that only classes derived from changed individuals are extracted again
+        after an incremental reload, and that the updated template data is
+        identical to template data built from the reloaded ontology.
+        """
+
+        # Importing CV template
+        cv_template = precis.templating.PrecisTemplate(
+            template_folder=TestConfig.template_cv
+        )
+
+        with open(TestConfig.sample_json_data, 'r') as f:
+            document = json.load(f)
+
+        world = precis.PrecisWorld()
+        loader = precis.Loader(ingest_file=io.StringIO(json.dumps(document)),
+                               namespace=TestConfig.namespace, world=world,
+                               track_changes=True)
+
+        def buildDriver():
+            with open(TestConfig.template_prefs, 'r') as user_prefs:
+                return precis.templating.TemplateDriver(
+                    template=cv_template,
+                    user_ont=loader.getOntology(),
+                    user_graph=loader.getRDFLibGraph(),
+                    user_prefs=user_prefs
+                )
+
+        def canonical(user_data: dict) -> dict:
+            # Note: The order of individuals with equal sort keys is not
+            #       deterministic, so individuals are sorted
+            return {k: sorted(json.dumps(i, sort_keys=True, default=str)
+                              for i in v) if isinstance(v, list) else v
+                    for k, v in user_data.items()}
+
+        driver = buildDriver()
+
+        # Renaming an organization (nested in a work experience), and adding an
+        # award affiliated with it (looked up by the project override)
+        document[0]['employedAt']['hasName'] = 'SpaceX Corp'
+        document.append({'$type': 'Award', '$id': 'award:new',
+                         'hasName': 'New Award', 'affiliatedWith': 'spacex'})
+        loader.reload(ingest_file=io.StringIO(json.dumps(document)))
+        affected_classes = driver.update(changes=loader.getLastChanges())
+
+        self.assertIn('WorkExperience', affected_classes)
+        self.assertIn('Project', affected_classes)
+        self.assertIn('Award', affected_classes)
+        self.assertNotIn('Degree', affected_classes)
+        self.assertEqual(canonical(driver.user_data),
+                         canonical(buildDriver().user_data))
+
+        # Renaming an individual affiliated with a work experience (looked up
+        # from the work experience, in reverse)
+        for individual in document:
+            if individual['$id'] == 'award:ieee':
+                individual['hasName'] = 'Renamed Award'
+        loader.reload(ingest_file=io.StringIO(json.dumps(document)))
+        affected_classes = driver.update(changes=loader.getLastChanges())
+
+        self.assertIn('WorkExperience', affected_classes)
+        self.assertIn('Renamed Award', [affiliated['hasName'] for i in
+            driver.user_data['WorkExperience'] if i['$id'] == 'we_tesla_ceo'
+            for affiliated in i['affiliated']])
+        self.assertEqual(canonical(driver.user_data),
+                         canonical(buildDriver().user_data))
+
+        # Adding an award affiliated with a work experience
+        document.append({'$type': 'Award', '$id': 'award:linked',
+                         'hasName': 'Linked Award',
+                         'affiliatedWith': 'we_tesla_ceo'})
+        loader.reload(ingest_file=io.StringIO(json.dumps(document)))
+        self.assertIn('WorkExperience', driver.update(
+            changes=loader.getLastChanges()))
+        self.assertEqual(canonical(driver.user_data),
+                         canonical(buildDriver().user_data))
+
+        world.close()
+
+        # Template data built from compiled user data cannot be updated
+        with open(TestConfig.template_prefs, 'r') as user_prefs:
+            driver = precis.templating.TemplateDriver(
+                template=cv_template,
+                user_ont=None,
+                user_graph=None,
+                user_prefs=user_prefs,
+                data_file=TestConfig.sample_rdf_data
+            )
+        with self.assertRaises(ValueError):
+            driver.update(changes={})
+
+    def test_persistentStore(self):
+        """Function to test rendering from a persistent world holding the user
+        data of several people. Validates that template data built from one
+        namespace of the persistent world is identical to template data built
+        from an isolated world, and does not include other namespaces.
+        """
+
+        # Importing CV template
+        cv_template = precis.templating.PrecisTemplate(
+            template_folder=TestConfig.template_cv
+        )
+
+        with open(TestConfig.sample_json_data, 'r') as f:
+            document = json.load(f)
+
+        # Second person, with the same IDs (and an edited organization name)
+        edited = json.loads(json.dumps(document))
+        edited[0]['employedAt']['hasName'] = 'SpaceX Corp'
+        namespaces = [TestConfig.namespace + '#', TestConfig.namespace + '2#']
+
+        def buildDriver(**kwargs) -> precis.templating.TemplateDriver:
+            with open(TestConfig.template_prefs, 'r') as user_prefs:
+                return precis.templating.TemplateDriver(
+                    template=cv_template,
+                    user_prefs=user_prefs,
+                    **kwargs
+                )
+
+        def canonical(value):
+            # Note: The order of multi-valued properties (and of individuals
+            #       with equal sort keys) is not deterministic across loads
+            if isinstance(value, dict):
+                return {k: canonical(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return sorted([canonical(i) for i in value],
+                              key=lambda i: json.dumps(i, sort_keys=True,
+                                                       default=str))
+            return value
+
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            store_file = os.path.join(tmp_folder, 'store.sqlite3')
+
+            # Ingesting in bulk mode (committed when the world is closed)
+            world = precis.PrecisWorld.open(file_path=store_file, bulk=True)
+            for namespace, data in zip(namespaces, [document, edited]):
+                precis.Loader(ingest_file=io.StringIO(json.dumps(data)),
+                              namespace=namespace, world=world)
+            world.close()
+
+            drivers = [buildDriver(user_ont=None, user_graph=None,
+                                   data_file=store_file, namespace=namespace)
+                       for namespace in namespaces]
+
+        world = precis.PrecisWorld()
+        loader = precis.Loader(ingest_file=io.StringIO(json.dumps(document)),
+                               namespace=namespaces[0], world=world)
+        expected = buildDriver(user_ont=loader.getOntology(),
+                               user_graph=loader.getRDFLibGraph())
+        world.close()
+
+        self.assertEqual(canonical(drivers[0].user_data),
+                         canonical(expected.user_data))
+        self.assertNotIn('SpaceX Corp', drivers[0].buildTemplate())
+        self.assertIn('SpaceX Corp', drivers[1].buildTemplate())
+
+    def test_stats(self):
+        """Function to test instrumentation of loading, querying and rendering.
+        Validates that template data is not affected, that stages and
+        counters are recorded (in total, and for each class), and that they
+        can be exported as JSON and as a Chrome trace.
+        """
+
+        # Importing CV template
+        cv_template = precis.templating.PrecisTemplate(
+            template_folder=TestConfig.template_cv
+        )
+
+        def canonical(value):
+            # Note: The order of multi-valued properties (and of individuals
+            #       with equal sort keys) is not deterministic across loads
+            if isinstance(value, dict):
+                return {k: canonical(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return sorted([canonical(i) for i in value],
+                              key=lambda i: json.dumps(i, sort_keys=True,
+                                                       default=str))
+            return value
+
+        user_data = list()
+        for stats in [None, precis.Stats()]:
+            world = precis.PrecisWorld()
+            with open(TestConfig.sample_json_data, 'r') as f:
+                loader = precis.Loader(ingest_file=f,
+                                       namespace=TestConfig.namespace,
+                                       world=world, stats=stats)
+            with open(TestConfig.template_prefs, 'r') as user_prefs:
+                driver = precis.templating.TemplateDriver(
+                    template=cv_template,
+                    user_ont=loader.getOntology(),
+                    user_graph=loader.getRDFLibGraph(),
+                    user_prefs=user_prefs,
+                    stats=stats
+                )
+            driver.buildTemplate()
+            user_data.append(canonical(driver.user_data))
+            world.close()
+
+        self.assertEqual(user_data[0], user_data[1])
+
+        results = stats.toDict()
+        self.assertTrue(set(['parse', 'ingest', 'create', 'preferences',
+                             'extract', 'query', 'override', 'render']).\
+            issubset(results['stages'].keys()))
+        self.assertEqual(results['stages']['extract']['calls'],
+                         len(cv_template.getRequiredClasses()))
+        for counter in ['individuals', 'queries', 'rows', 'searches']:
+            self.assertGreater(results['counters'][counter], 0)
+        self.assertIn('extract', results['classes']['Degree']['stages'])
+        self.assertGreater(
+            results['classes']['Degree']['counters']['queries'], 0)
+
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            json_file = os.path.join(tmp_folder, 'stats.json')
+            trace_file = os.path.join(tmp_folder, 'trace.json')
+            stats.saveJSON(file_path=json_file)
+            stats.saveChromeTrace(file_path=trace_file)
+
+            with open(json_file) as f:
+                self.assertEqual(json.load(f)['counters'],
+                                 results['counters'])
+            with open(trace_file) as f:
+                trace_events = json.load(f)['traceEvents']
+            self.assertEqual(
+                sum(1 for i in trace_events if i['ph'] == 'X'),
+                sum(i['calls'] for i in results['stages'].values()))